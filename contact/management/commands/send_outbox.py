@@ -0,0 +1,45 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from contact.outbox import drain_outbox
+
+
+class Command(BaseCommand):
+    help = "Delivers the emails waiting on the contact outbox"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.CONTACT_OUTBOX_BATCH_SIZE,
+            help="Emails delivered per SMTP connection",
+        )
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep polling the outbox instead of exiting when it's empty",
+        )
+        parser.add_argument(
+            "--interval",
+            type=float,
+            default=settings.CONTACT_OUTBOX_POLL_INTERVAL,
+            help="Seconds between polls when --loop is used",
+        )
+
+    def handle(self, *args, **options):
+        while True:
+            try:
+                sent, failed = drain_outbox(options["batch_size"])
+            except Exception as error:
+                if not options["loop"]:
+                    raise
+                self.stderr.write(f"Unable to deliver the outbox: {error!r}")
+                sent = failed = 0
+            if sent or failed:
+                self.stdout.write(f"{sent} sent, {failed} failed")
+                continue
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
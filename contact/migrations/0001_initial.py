@@ -0,0 +1,38 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:14
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OutgoingEmail',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('subject', models.CharField(max_length=255, verbose_name='Asunto')),
+                ('body', models.TextField(verbose_name='Mensaje')),
+                ('htmlBody', models.TextField(blank=True, verbose_name='Mensaje HTML')),
+                ('fromEmail', models.CharField(max_length=255, verbose_name='Remitente')),
+                ('to', models.JSONField(default=list, verbose_name='Destinatarios')),
+                ('replyTo', models.JSONField(blank=True, default=list, verbose_name='Responder a')),
+                ('status', models.CharField(choices=[('PEN', 'Pendiente'), ('SEN', 'Enviado'), ('FAI', 'Fallido')], default='PEN', max_length=3, verbose_name='Estado')),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Intentos')),
+                ('nextAttempt', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Próximo intento')),
+                ('lastError', models.TextField(blank=True, verbose_name='Último error')),
+                ('created', models.DateTimeField(auto_now_add=True, verbose_name='Creado')),
+                ('sent', models.DateTimeField(blank=True, null=True, verbose_name='Enviado')),
+            ],
+            options={
+                'verbose_name': 'Email saliente',
+                'verbose_name_plural': 'Emails salientes',
+                'indexes': [models.Index(fields=['status', 'nextAttempt'], name='contact_outbox_pending_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.30 on 2026-10-18 14:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('contact', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceivedMessage',
+            fields=[
+                ('digest', models.CharField(max_length=64, primary_key=True, serialize=False, verbose_name='Resumen')),
+                ('received', models.DateTimeField(verbose_name='Recibido')),
+            ],
+            options={
+                'verbose_name': 'Mensaje recibido',
+                'verbose_name_plural': 'Mensajes recibidos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ThrottleBucket',
+            fields=[
+                ('key', models.CharField(max_length=255, primary_key=True, serialize=False, verbose_name='Clave')),
+                ('tokens', models.FloatField(verbose_name='Tokens')),
+                ('updated', models.FloatField(verbose_name='Actualizado')),
+            ],
+            options={
+                'verbose_name': 'Balde de límite',
+                'verbose_name_plural': 'Baldes de límite',
+            },
+        ),
+    ]
@@ -1,2 +1,91 @@
 from django.db import models
+from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
+
+
+EMAIL_STATUS_CHOICES = [
+    ("PEN", _("Pendiente")),
+    ("SEN", _("Enviado")),
+    ("FAI", _("Fallido")),
+]
+
+
+class OutgoingEmail(models.Model):
+    """
+    Email waiting on the outbox to be delivered by the send_outbox worker
+
+    subject: Subject of the email
+    body: Plain text body
+    htmlBody: HTML alternative of the body
+    fromEmail: Sender address
+    to: List of recipient addresses
+    replyTo: List of reply-to addresses
+    status: Pending, sent or failed (after CONTACT_OUTBOX_MAX_ATTEMPTS)
+    attempts: Number of failed delivery attempts
+    nextAttempt: Datetime after which the email can be delivered
+    lastError: Error of the last failed attempt
+    created: Datetime when the email was queued
+    sent: Datetime when the email was delivered
+    """
+    subject = models.CharField(_("Asunto"), max_length=255)
+    body = models.TextField(_("Mensaje"))
+    htmlBody = models.TextField(_("Mensaje HTML"), blank=True)
+    fromEmail = models.CharField(_("Remitente"), max_length=255)
+    to = models.JSONField(_("Destinatarios"), default=list)
+    replyTo = models.JSONField(_("Responder a"), default=list, blank=True)
+    status = models.CharField(_("Estado"), choices=EMAIL_STATUS_CHOICES, max_length=3, default="PEN")
+    attempts = models.PositiveIntegerField(_("Intentos"), default=0)
+    nextAttempt = models.DateTimeField(_("Próximo intento"), default=timezone.now)
+    lastError = models.TextField(_("Último error"), blank=True)
+    created = models.DateTimeField(_("Creado"), auto_now_add=True)
+    sent = models.DateTimeField(_("Enviado"), null=True, blank=True)
+
+    class Meta:
+        verbose_name = _('Email saliente')
+        verbose_name_plural = _('Emails salientes')
+        indexes = [
+            models.Index(fields=["status", "nextAttempt"], name="contact_outbox_pending_idx"),
+        ]
+
+    def __str__(self) -> str:
+        return self.subject
+
+
+class ThrottleBucket(models.Model):
+    """
+    Token bucket of a contact throttle (contact.throttling), stored on the
+    database so every worker updates it with a single atomic UPDATE
+
+    key: Throttle scope and client identity
+    tokens: Tokens left when the bucket was last updated
+    updated: Timestamp (sec) of the last update
+    """
+    key = models.CharField(_("Clave"), max_length=255, primary_key=True)
+    tokens = models.FloatField(_("Tokens"))
+    updated = models.FloatField(_("Actualizado"))
+
+    class Meta:
+        verbose_name = _('Balde de límite')
+        verbose_name_plural = _('Baldes de límite')
+
+    def __str__(self) -> str:
+        return self.key
+
+
+class ReceivedMessage(models.Model):
+    """
+    Digest of a message received by the contact form, used to ignore
+    identical messages during CONTACT_DUPLICATE_WINDOW
+
+    digest: SHA-256 of the message parts
+    received: Datetime when the message was last accepted
+    """
+    digest = models.CharField(_("Resumen"), max_length=64, primary_key=True)
+    received = models.DateTimeField(_("Recibido"))
+
+    class Meta:
+        verbose_name = _('Mensaje recibido')
+        verbose_name_plural = _('Mensajes recibidos')
+
+    def __str__(self) -> str:
+        return self.digest
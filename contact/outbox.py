@@ -0,0 +1,132 @@
+import hashlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.utils import timezone
+
+from contact.models import OutgoingEmail, ReceivedMessage
+
+
+def enqueue_email(subject, message, html_message, from_email, to, reply_to=None):
+    """
+    Stores an email on the outbox, it will be delivered by the send_outbox worker
+    """
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        htmlBody=html_message or "",
+        fromEmail=from_email,
+        to=list(to),
+        replyTo=list(reply_to or []),
+    )
+
+
+def is_duplicate(*parts):
+    """
+    Returns True if a message with the same parts was received during the
+    last CONTACT_DUPLICATE_WINDOW seconds
+    """
+    digest = hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+    now = timezone.now()
+    window_start = now - timedelta(seconds=settings.CONTACT_DUPLICATE_WINDOW)
+    _message, created = ReceivedMessage.objects.get_or_create(digest=digest, defaults={"received": now})
+    if created:
+        ReceivedMessage.objects.filter(received__lt=window_start).delete()
+        return False
+    # Only one of concurrent requests can renew an expired digest
+    return not ReceivedMessage.objects.filter(digest=digest, received__lt=window_start).update(received=now)
+
+
+def build_message(email, connection):
+    mail = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        email.fromEmail,
+        email.to,
+        reply_to=email.replyTo,
+        connection=connection,
+    )
+    if email.htmlBody:
+        mail.attach_alternative(email.htmlBody, "text/html")
+    return mail
+
+
+def get_retry_delay(attempts):
+    """
+    Exponential backoff: CONTACT_OUTBOX_RETRY_DELAY, twice that, four times...
+    """
+    return timedelta(seconds=settings.CONTACT_OUTBOX_RETRY_DELAY * 2 ** (attempts - 1))
+
+
+def record_failure(email, error):
+    """
+    Schedules the next attempt of email with exponential backoff, or marks
+    it as failed after CONTACT_OUTBOX_MAX_ATTEMPTS
+    """
+    email.attempts += 1
+    email.lastError = repr(error)
+    if email.attempts >= settings.CONTACT_OUTBOX_MAX_ATTEMPTS:
+        email.status = "FAI"
+    else:
+        email.status = "PEN"
+        email.nextAttempt = timezone.now() + get_retry_delay(email.attempts)
+    email.save(update_fields=["attempts", "lastError", "status", "nextAttempt"])
+
+
+def claim_batch(batch_size):
+    """
+    Returns the next pending emails, claiming them by postponing their next
+    attempt so a concurrent worker doesn't deliver them twice
+    """
+    now = timezone.now()
+    ids = list(
+        OutgoingEmail.objects
+        .filter(status="PEN", nextAttempt__lte=now)
+        .order_by("nextAttempt", "id")
+        .values_list("id", flat=True)[:batch_size]
+    )
+    lease = now + timedelta(seconds=settings.CONTACT_OUTBOX_LEASE)
+    claimed = []
+    for email_id in ids:
+        if OutgoingEmail.objects.filter(pk=email_id, status="PEN", nextAttempt__lte=now).update(nextAttempt=lease):
+            claimed.append(email_id)
+    return list(OutgoingEmail.objects.filter(pk__in=claimed).order_by("id"))
+
+
+def drain_outbox(batch_size=None):
+    """
+    Delivers a batch of pending emails over a single SMTP connection.
+    Failed emails are retried with exponential backoff until they reach
+    CONTACT_OUTBOX_MAX_ATTEMPTS. Returns the number of sent and failed emails.
+    """
+    emails = claim_batch(batch_size or settings.CONTACT_OUTBOX_BATCH_SIZE)
+    if not emails:
+        return 0, 0
+
+    connection = get_connection()
+    try:
+        connection.open()
+    except Exception as error:
+        # Without a connection every claimed email counts a failed attempt,
+        # otherwise they would only wait for the lease and never reach FAI
+        for email in emails:
+            record_failure(email, error)
+        return 0, len(emails)
+
+    sent = failed = 0
+    try:
+        for email in emails:
+            try:
+                build_message(email, connection).send()
+            except Exception as error:
+                record_failure(email, error)
+                failed += 1
+            else:
+                email.status = "SEN"
+                email.sent = timezone.now()
+                email.save(update_fields=["status", "sent"])
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
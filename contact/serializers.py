@@ -0,0 +1,22 @@
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework import serializers
+
+
+class ContactSerializer(serializers.Serializer):
+    """
+    Message received by the contact form. When subject is "Otro" the
+    subject written by the visitor on otherSubject is used instead.
+    """
+    name = serializers.CharField(max_length=120)
+    email = serializers.EmailField()
+    subject = serializers.CharField(max_length=120)
+    otherSubject = serializers.CharField(max_length=120, required=False, allow_blank=True)
+    message = serializers.CharField()
+
+    def validate(self, data):
+        if data["subject"] == "Otro":
+            if not data.get("otherSubject"):
+                raise serializers.ValidationError({"otherSubject": _("Este campo es requerido.")})
+            data["subject"] = data["otherSubject"]
+        return data
@@ -1,3 +1,180 @@
-from django.test import TestCase
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.test import RequestFactory, TestCase, override_settings
+from django.utils import timezone
+
+from contact.models import OutgoingEmail
+from contact.outbox import drain_outbox
+from contact.throttling import ContactIPThrottle
+
+
+class FailingEmailBackend(EmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionError("SMTP server unavailable")
+
+
+class UnreachableEmailBackend(EmailBackend):
+    def open(self):
+        raise ConnectionRefusedError("SMTP server unreachable")
+
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+CONTACT_DATA = {
+    "name": "Visitor",
+    "email": "visitor@example.com",
+    "subject": "Trabajo",
+    "message": "Hola!",
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class EmailAPITest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_post_queues_email_without_sending(self):
+        response = self.client.post("/contact", CONTACT_DATA, secure=True)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(mail.outbox), 0)
+        email = OutgoingEmail.objects.get()
+        self.assertEqual(email.status, "PEN")
+        self.assertEqual(email.replyTo, ["visitor@example.com"])
+
+    def test_duplicate_messages_are_accepted_but_queued_once(self):
+        for _ in range(2):
+            response = self.client.post("/contact", CONTACT_DATA, secure=True)
+            self.assertEqual(response.status_code, 200)
+        self.assertEqual(OutgoingEmail.objects.count(), 1)
+
+    def test_email_is_throttled(self):
+        for i in range(3):
+            self.client.post("/contact", {**CONTACT_DATA, "message": f"Hola {i}!"}, secure=True)
+        response = self.client.post("/contact", {**CONTACT_DATA, "message": "Spam"}, secure=True)
+        self.assertEqual(response.status_code, 429)
+        self.assertIn("Retry-After", response)
+        self.assertEqual(OutgoingEmail.objects.count(), 3)
+
+    def test_ip_is_throttled(self):
+        for i in range(5):
+            self.client.post("/contact", {**CONTACT_DATA, "email": f"visitor{i}@example.com"}, secure=True)
+        response = self.client.post("/contact", {**CONTACT_DATA, "email": "other@example.com"}, secure=True)
+        self.assertEqual(response.status_code, 429)
+        self.assertEqual(OutgoingEmail.objects.count(), 5)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 0})
+    def test_forwarded_for_is_ignored_without_proxies(self):
+        for i in range(5):
+            data = {**CONTACT_DATA, "email": f"visitor{i}@example.com"}
+            self.client.post("/contact", data, secure=True, HTTP_X_FORWARDED_FOR=f"10.0.0.{i}")
+        data = {**CONTACT_DATA, "email": "other@example.com"}
+        response = self.client.post("/contact", data, secure=True, HTTP_X_FORWARDED_FOR="10.0.0.9")
+        self.assertEqual(response.status_code, 429)
+
+    @override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, "NUM_PROXIES": 1})
+    def test_forwarded_for_is_read_from_the_proxy(self):
+        # The client sends any X-Forwarded-For, the proxy appends the client IP
+        for i in range(5):
+            data = {**CONTACT_DATA, "email": f"visitor{i}@example.com"}
+            self.client.post("/contact", data, secure=True, HTTP_X_FORWARDED_FOR=f"10.0.0.{i}, 203.0.113.7")
+        data = {**CONTACT_DATA, "email": "other@example.com"}
+        response = self.client.post("/contact", data, secure=True, HTTP_X_FORWARDED_FOR="10.0.0.9, 203.0.113.7")
+        self.assertEqual(response.status_code, 429)
+        data = {**CONTACT_DATA, "email": "another@example.com"}
+        response = self.client.post("/contact", data, secure=True, HTTP_X_FORWARDED_FOR="203.0.113.8")
+        self.assertEqual(response.status_code, 200)
+
+    def test_invalid_messages_are_rejected(self):
+        invalid = [
+            {**CONTACT_DATA, "email": "visitor"},
+            {key: value for key, value in CONTACT_DATA.items() if key != "message"},
+            {**CONTACT_DATA, "subject": "Otro"},
+        ]
+        for data in invalid:
+            self.assertEqual(self.client.post("/contact", data, secure=True).status_code, 400)
+        self.assertEqual(OutgoingEmail.objects.count(), 0)
+
+        self.client.post("/contact", {**CONTACT_DATA, "subject": "Otro", "otherSubject": "Consulta"}, secure=True)
+        self.assertEqual(OutgoingEmail.objects.get().subject, "Contacto desde la web: Consulta")
+
+    def test_email_that_is_not_a_string_is_only_throttled_by_ip(self):
+        for i in range(5):
+            data = {**CONTACT_DATA, "email": 5, "message": f"Hola {i}!"}
+            response = self.client.post("/contact", data, secure=True, content_type="application/json")
+            self.assertEqual(response.status_code, 400)
+        response = self.client.post("/contact", {**CONTACT_DATA, "email": 5}, secure=True, content_type="application/json")
+        self.assertEqual(response.status_code, 429)
+
+
+class TokenBucketThrottleTest(TestCase):
+    def test_bucket_refills_at_the_rate(self):
+        throttle = ContactIPThrottle()
+        request = RequestFactory().post("/contact")
+        with mock.patch.object(ContactIPThrottle, "timer", return_value=1000.0):
+            self.assertEqual([ContactIPThrottle().allow_request(request, None) for _ in range(6)], [True] * 5 + [False])
+            throttle.allow_request(request, None)
+            self.assertAlmostEqual(throttle.wait(), throttle.duration / throttle.num_requests)
+        with mock.patch.object(ContactIPThrottle, "timer", return_value=1000.0 + throttle.duration / throttle.num_requests):
+            self.assertEqual([ContactIPThrottle().allow_request(request, None) for _ in range(2)], [True, False])
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class OutboxTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        for i in range(3):
+            self.client.post("/contact", {**CONTACT_DATA, "message": f"Hola {i}!"}, secure=True)
+
+    def test_drain_sends_pending_emails(self):
+        self.assertEqual(drain_outbox(), (3, 0))
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].reply_to, ["visitor@example.com"])
+        self.assertEqual(mail.outbox[0].alternatives[0][1], "text/html")
+        self.assertFalse(OutgoingEmail.objects.exclude(status="SEN").exists())
+        self.assertEqual(drain_outbox(), (0, 0))
+
+    def test_drain_sends_in_batches(self):
+        self.assertEqual(drain_outbox(batch_size=2), (2, 0))
+        call_command("send_outbox", stdout=StringIO())
+        self.assertEqual(len(mail.outbox), 3)
+
+    @override_settings(
+        EMAIL_BACKEND="contact.tests.FailingEmailBackend",
+        CONTACT_OUTBOX_MAX_ATTEMPTS=2,
+        CONTACT_OUTBOX_RETRY_DELAY=60,
+    )
+    def test_failed_emails_are_retried_with_backoff(self):
+        before = timezone.now()
+        self.assertEqual(drain_outbox(), (0, 3))
+        email = OutgoingEmail.objects.first()
+        self.assertEqual((email.status, email.attempts), ("PEN", 1))
+        self.assertGreaterEqual(email.nextAttempt, before + timedelta(seconds=60))
+        self.assertEqual(drain_outbox(), (0, 0))
+
+        OutgoingEmail.objects.update(nextAttempt=timezone.now())
+        self.assertEqual(drain_outbox(), (0, 3))
+        self.assertEqual(OutgoingEmail.objects.filter(status="FAI").count(), 3)
+
+    @override_settings(
+        EMAIL_BACKEND="contact.tests.UnreachableEmailBackend",
+        CONTACT_OUTBOX_MAX_ATTEMPTS=2,
+        CONTACT_OUTBOX_RETRY_DELAY=60,
+    )
+    def test_connection_failures_count_as_attempts(self):
+        before = timezone.now()
+        self.assertEqual(drain_outbox(), (0, 3))
+        email = OutgoingEmail.objects.first()
+        self.assertEqual((email.status, email.attempts), ("PEN", 1))
+        self.assertIn("SMTP server unreachable", email.lastError)
+        self.assertGreaterEqual(email.nextAttempt, before + timedelta(seconds=60))
+
+        OutgoingEmail.objects.update(nextAttempt=timezone.now())
+        self.assertEqual(drain_outbox(), (0, 3))
+        self.assertEqual(OutgoingEmail.objects.filter(status="FAI").count(), 3)
@@ -0,0 +1,74 @@
+import time
+
+from django.db.models import F, Value
+from django.db.models.functions import Least
+from django.db.models.lookups import GreaterThanOrEqual
+
+from rest_framework.throttling import SimpleRateThrottle
+
+from contact.models import ThrottleBucket
+
+
+class TokenBucketThrottle(SimpleRateThrottle):
+    """
+    Token bucket throttle stored on the database, shared by every worker.
+
+    The rate "N/period" is read as a bucket of N tokens which refills N tokens
+    per period: bursts of N requests are accepted, after that requests are
+    accepted at the refill rate.
+
+    A token is taken by a single conditional UPDATE, so concurrent requests
+    of the same client can't spend the same token whatever the cache backend.
+    """
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        self.now = self.timer()
+        refill = self.num_requests / self.duration
+        _bucket, created = ThrottleBucket.objects.get_or_create(
+            key=self.key, defaults={"tokens": self.num_requests - 1, "updated": self.now}
+        )
+        if created:
+            # Buckets untouched for a whole period are full, so they are dropped
+            ThrottleBucket.objects.filter(updated__lt=self.now - self.duration).delete()
+            return True
+
+        tokens = Least(Value(float(self.num_requests)), F("tokens") + (Value(self.now) - F("updated")) * refill)
+        buckets = ThrottleBucket.objects.filter(GreaterThanOrEqual(tokens, 1), key=self.key)
+        if buckets.update(tokens=tokens - 1, updated=self.now):
+            return True
+
+        bucket = ThrottleBucket.objects.get(key=self.key)
+        tokens = min(self.num_requests, bucket.tokens + (self.now - bucket.updated) * refill)
+        self.wait_time = (1 - tokens) / refill
+        return False
+
+    def wait(self):
+        return self.wait_time
+
+    def timer(self):
+        return time.time()
+
+
+class ContactIPThrottle(TokenBucketThrottle):
+    scope = "contact_ip"
+
+    def get_cache_key(self, request, view):
+        return self.cache_format % {"scope": self.scope, "ident": self.get_ident(request)}
+
+
+class ContactEmailThrottle(TokenBucketThrottle):
+    scope = "contact_email"
+
+    def get_cache_key(self, request, view):
+        email = request.data.get("email")
+        # Without a valid email the request is left to the IP throttle
+        if not isinstance(email, str) or not email.strip():
+            return None
+        return self.cache_format % {"scope": self.scope, "ident": email.strip().lower()}
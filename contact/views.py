@@ -1,23 +1,31 @@
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives
 
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from contact.outbox import enqueue_email, is_duplicate
+from contact.serializers import ContactSerializer
+from contact.throttling import ContactEmailThrottle, ContactIPThrottle
+
 
 class EmailAPI(APIView):
+    throttle_classes = [ContactIPThrottle, ContactEmailThrottle]
 
     def post(self, request):
         """
         Receives a POST request with the necesary information to create an email
-        and send it to contact mail box
+        and queues it on the outbox to be sent to contact mail box
         """
-        reqName = request.data.get('name')
-        reqEmail = request.data.get('email')
-        reqSubject = request.data.get('subject')
-        if reqSubject == 'Otro':
-            reqSubject = request.data.get('otherSubject')
-        reqMessage = request.data.get('message')
+        serializer = ContactSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        reqName = serializer.validated_data['name']
+        reqEmail = serializer.validated_data['email']
+        reqSubject = serializer.validated_data['subject']
+        reqMessage = serializer.validated_data['message']
+
+        # Identical messages are accepted but only sent once
+        if is_duplicate(reqName, reqEmail, reqSubject, reqMessage):
+            return Response({'msg': 'Su mensaje ha sido envíado con éxito. Gracias por contactarse!'}, status=200)
         
         subject = f"Contacto desde la web: {reqSubject}"
         message = f"""
@@ -33,15 +41,13 @@ class EmailAPI(APIView):
         <p>{reqMessage}</p>
         """
 
-        mail = EmailMultiAlternatives(
+        enqueue_email(
             subject,
             message,
+            html_message,
             settings.DEFAULT_FROM_EMAIL,
             [settings.DEFAULT_CONTACT_EMAIL],
-            alternatives=[(html_message, "text/html")],
             reply_to=[reqEmail],
         )
 
-        mail.send()
-
         return Response({'msg': 'Su mensaje ha sido envíado con éxito. Gracias por contactarse!'}, status=200)
@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+
+class CoreConfig(AppConfig):
+    name = "core"
+
+    def ready(self):
+        from core.db import set_sqlite_pragmas
+
+        connection_created.connect(set_sqlite_pragmas, dispatch_uid="core.db.set_sqlite_pragmas")
@@ -0,0 +1,13 @@
+from django.conf import settings
+
+
+def set_sqlite_pragmas(sender, connection, **kwargs):
+    """
+    connection_created receiver, runs SQLITE_PRAGMAS on every new SQLite
+    connection. They are executed on the raw connection, so they aren't
+    logged or counted as queries of the request which opened it.
+    """
+    if connection.vendor != "sqlite":
+        return
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        connection.connection.execute(f"PRAGMA {name} = {value}")
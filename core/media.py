@@ -0,0 +1,112 @@
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+
+from core.storage import is_hashed
+
+
+RANGE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+
+
+def get_range(request, size, etag, last_modified):
+    """
+    Returns the (start, end) byte range requested with the Range header
+    (single ranges only), None for the whole file or False when the range
+    can't be satisfied. With If-Range the range only applies if the file
+    didn't change.
+    """
+    match = RANGE.match(request.headers.get("Range", "").strip())
+    if match is None or (not match["start"] and not match["end"]):
+        return None
+    if_range = request.headers.get("If-Range")
+    if if_range and if_range != etag and parse_http_date_safe(if_range) != last_modified:
+        return None
+    if match["start"]:
+        start = int(match["start"])
+        # A last byte before the first one is invalid, so the header is ignored
+        if match["end"] and int(match["end"]) < start:
+            return None
+        end = min(int(match["end"]), size - 1) if match["end"] else size - 1
+    else:
+        start = max(size - int(match["end"]), 0)
+        end = size - 1
+    if start > end or start >= size:
+        return False
+    return start, end
+
+
+def read_range(file, start, length, block_size=FileResponse.block_size):
+    with file:
+        file.seek(start)
+        while length > 0:
+            chunk = file.read(min(block_size, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+
+def serve_media(request, path):
+    """
+    Serves the uploaded files of MEDIA_ROOT, streamed and never read whole
+    into memory, with Range and If-Range support (eg.: the resume PDFs).
+
+    Content hashed names (see core.storage) are cached forever, other files
+    are revalidated with their ETag. With MEDIA_SENDFILE_HEADER the file is
+    handed off to the web server (X-Sendfile or X-Accel-Redirect), which
+    then handles the ranges.
+    """
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+        stat = os.stat(full_path)
+    except (OSError, ValueError):
+        raise Http404
+    if not os.path.isfile(full_path):
+        raise Http404
+
+    last_modified = int(stat.st_mtime)
+    etag = quote_etag(f"{stat.st_size:x}-{stat.st_mtime_ns:x}")
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+
+    response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+    if response is None:
+        if settings.MEDIA_SENDFILE_HEADER == "X-Sendfile":
+            response = HttpResponse(content_type=content_type)
+            response["X-Sendfile"] = full_path
+        elif settings.MEDIA_SENDFILE_HEADER == "X-Accel-Redirect":
+            response = HttpResponse(content_type=content_type)
+            response["X-Accel-Redirect"] = f"{settings.MEDIA_SENDFILE_PREFIX.rstrip('/')}/{path}"
+        else:
+            response = serve_file(request, full_path, stat.st_size, content_type, etag, last_modified)
+        if encoding:
+            response["Content-Encoding"] = encoding
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(last_modified)
+    if is_hashed(path):
+        patch_cache_control(response, public=True, max_age=settings.MEDIA_CACHE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(response, public=True, no_cache=True)
+    return response
+
+
+def serve_file(request, full_path, size, content_type, etag, last_modified):
+    byte_range = get_range(request, size, etag, last_modified)
+    if byte_range is False:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+    elif byte_range is None:
+        response = FileResponse(open(full_path, "rb"), content_type=content_type)
+    else:
+        start, end = byte_range
+        response = FileResponse(read_range(open(full_path, "rb"), start, end - start + 1), status=206, content_type=content_type)
+        response["Content-Range"] = f"bytes {start}-{end}/{size}"
+        response["Content-Length"] = end - start + 1
+    response["Accept-Ranges"] = "bytes"
+    return response
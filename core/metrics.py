@@ -0,0 +1,90 @@
+import os
+
+from django.conf import settings
+from django.db.models import Count
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess
+from prometheus_client.core import GaugeMetricFamily
+
+from contact.models import EMAIL_STATUS_CHOICES, OutgoingEmail
+
+
+REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests by route, method and status",
+    ["route", "method", "status"],
+)
+LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Time to build the response",
+    ["route", "method"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5),
+)
+RESPONSE_SIZE = Histogram(
+    "http_response_size_bytes",
+    "Size of the (non streaming) response bodies",
+    ["route"],
+    buckets=(256, 1024, 4096, 16384, 65536, 262144, 1048576),
+)
+QUERIES = Histogram(
+    "http_db_queries",
+    "Database queries per request",
+    ["route"],
+    buckets=(0, 1, 2, 4, 8, 16, 32, 64),
+)
+CACHE_REQUESTS = Counter(
+    "cache_requests_total",
+    "Lookups on the response caches by result (hit or miss)",
+    ["cache", "result"],
+)
+
+
+def record_cache(name, hit):
+    CACHE_REQUESTS.labels(name, "hit" if hit else "miss").inc()
+
+
+class OutboxCollector:
+    """
+    Reports the contact outbox emails per status, read on every scrape
+    """
+
+    def collect(self):
+        counts = dict(OutgoingEmail.objects.order_by().values_list("status").annotate(Count("pk")))
+        gauge = GaugeMetricFamily("contact_outbox_emails", "Emails on the contact outbox per status", labels=["status"])
+        for status, _label in EMAIL_STATUS_CHOICES:
+            gauge.add_metric([status], counts.get(status, 0))
+        yield gauge
+
+
+OUTBOX_REGISTRY = CollectorRegistry()
+OUTBOX_REGISTRY.register(OutboxCollector())
+
+
+def get_registry():
+    """
+    With PROMETHEUS_MULTIPROC_DIR (see gunicorn.conf.py) every worker writes
+    its metrics to files on that directory and they are aggregated on each
+    scrape, otherwise the metrics of the current process are returned
+    """
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def metrics(request):
+    """
+    Metrics in Prometheus text format. They are only served with
+    `Authorization: Bearer <METRICS_TOKEN>` or to INTERNAL_IPS, every other
+    request (any request if neither is set) is forbidden.
+    """
+    authorized = settings.METRICS_TOKEN and constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    )
+    if not authorized and request.META.get("REMOTE_ADDR") not in settings.INTERNAL_IPS:
+        return HttpResponseForbidden()
+    content = generate_latest(get_registry()) + generate_latest(OUTBOX_REGISTRY)
+    return HttpResponse(content, content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,292 @@
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.dispatch import receiver
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+from django.utils.text import compress_sequence, compress_string
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+from core.metrics import LATENCY, QUERIES, REQUESTS, RESPONSE_SIZE, record_cache
+
+logger = logging.getLogger(__name__)
+
+COMPRESSED_KEY = "core:compressed:{}:{}"
+
+
+def get_accepted_encodings(request):
+    """
+    Returns the content codings accepted by the client, excluding q=0
+    """
+    accepted = set()
+    for coding in request.META.get("HTTP_ACCEPT_ENCODING", "").split(","):
+        name, _, params = coding.strip().partition(";")
+        if params.replace(" ", "") in ("q=0", "q=0.0", "q=0.00", "q=0.000"):
+            continue
+        accepted.add(name.strip().lower())
+    return accepted
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return compress_string(content)
+
+
+class CompressionMiddleware(MiddlewareMixin):
+    """
+    Compresses responses with Brotli (when the brotli package is installed)
+    or gzip, following the client Accept-Encoding.
+
+    Only the content types of COMPRESSION_CONTENT_TYPES are compressed (HTML
+    is left out, so pages with CSRF tokens aren't exposed to BREACH) and
+    bodies smaller than COMPRESSION_MIN_SIZE are sent as they are. Bodies
+    with a strong ETag are identified by it, so they are compressed once and
+    served from the cache afterwards.
+    """
+
+    def process_response(self, request, response):
+        if response.has_header("Content-Encoding") or response.status_code != 200:
+            return response
+        content_type = response.get("Content-Type", "").split(";")[0].strip()
+        if content_type not in settings.COMPRESSION_CONTENT_TYPES:
+            return response
+        if not response.streaming and len(response.content) < settings.COMPRESSION_MIN_SIZE:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        accepted = get_accepted_encodings(request)
+        if response.streaming:
+            # Streams are compressed on the fly, only with gzip
+            if "gzip" not in accepted or response.is_async:
+                return response
+            response.streaming_content = compress_sequence(response.streaming_content)
+            del response.headers["Content-Length"]
+            encoding = "gzip"
+        else:
+            encoding = next((encoding for encoding in self.get_encodings() if encoding in accepted), None)
+            if encoding is None:
+                return response
+            compressed = self.get_compressed(response, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # The compressed body is a different representation, so a strong ETag
+        # is made weak (as GZipMiddleware does), which still matches on
+        # conditional requests
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
+
+    def get_encodings(self):
+        return ("br", "gzip") if brotli is not None else ("gzip",)
+
+    def get_compressed(self, response, encoding):
+        etag = response.get("ETag")
+        if not etag or not etag.startswith('"'):
+            return compress(response.content, encoding)
+
+        key = COMPRESSED_KEY.format(etag.strip('"'), encoding)
+        compressed = cache.get(key)
+        record_cache("compressed", compressed is not None)
+        if compressed is None:
+            compressed = compress(response.content, encoding)
+            cache.set(key, compressed, settings.PORTFOLIO_CACHE_TIMEOUT)
+        return compressed
+
+
+class QueryStats:
+    """
+    Number and time (ms) of the database queries of a request
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+
+query_stats = ContextVar("query_stats", default=None)
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Database execute wrapper, installed on every connection, which times the
+    queries of the request being tracked (see track_queries). The stats are
+    looked up on a context variable, so queries run by the async ORM (on a
+    sync_to_async thread) are counted too.
+    """
+    stats = query_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.duration += (time.perf_counter() - start) * 1000
+        stats.count += 1
+
+
+@receiver(connection_created)
+def install_query_recorder(sender, connection, **kwargs):
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+@contextmanager
+def track_queries():
+    """
+    Yields the QueryStats of the current request, they are shared by the
+    middlewares which track the same request
+    """
+    stats = query_stats.get()
+    if stats is not None:
+        yield stats
+        return
+    # Connections opened before this module was imported
+    for connection in connections.all(initialized_only=True):
+        install_query_recorder(None, connection)
+    token = query_stats.set(QueryStats())
+    try:
+        yield query_stats.get()
+    finally:
+        query_stats.reset(token)
+
+
+class TrackingMiddleware:
+    """
+    Base of the middlewares which wrap the request with track_queries,
+    they work on both WSGI and ASGI (without moving async requests to a
+    thread). Subclasses implement finish(request, response, stats, duration).
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def start(self, request, stats):
+        pass
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with track_queries() as stats:
+            self.start(request, stats)
+            start = time.perf_counter()
+            response = self.get_response(request)
+            return self.finish(request, response, stats, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        with track_queries() as stats:
+            self.start(request, stats)
+            start = time.perf_counter()
+            response = await self.get_response(request)
+            return self.finish(request, response, stats, time.perf_counter() - start)
+
+
+class ServerTiming:
+    """
+    Durations (ms) of the phases of a request, in the order they were added,
+    plus the number and time of the database queries (see
+    ServerTimingMiddleware and portfolio.mixins.ServerTimingMixin)
+    """
+
+    def __init__(self, stats=None):
+        self.durations = {}
+        self.stats = stats or QueryStats()
+
+    @property
+    def queries(self):
+        return self.stats.count
+
+    @property
+    def db(self):
+        return self.stats.duration
+
+    def add(self, name, duration):
+        self.durations[name] = self.durations.get(name, 0.0) + duration
+
+    def get_header(self):
+        metrics = [f'db;dur={self.db:.2f};desc="{self.queries} queries"']
+        metrics += [f"{name};dur={duration:.2f}" for name, duration in self.durations.items()]
+        return ", ".join(metrics)
+
+    def as_dict(self):
+        return {"queries": self.queries, "db": round(self.db, 2), **{name: round(duration, 2) for name, duration in self.durations.items()}}
+
+
+class ServerTimingMiddleware(TrackingMiddleware):
+    """
+    Adds a Server-Timing header with the database time and query count, the
+    phases recorded by the views and the total time of the request. With
+    SERVER_TIMING_LOG every request is also logged (the timings are on the
+    `timing` attribute of the record).
+
+    The middleware is removed from the chain unless SERVER_TIMING is
+    enabled, so it has no cost when it is off. Queries run while a streaming
+    response is consumed aren't counted.
+    """
+
+    def __init__(self, get_response):
+        if not settings.SERVER_TIMING:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def start(self, request, stats):
+        request.server_timing = ServerTiming(stats)
+
+    def finish(self, request, response, stats, duration):
+        timing = request.server_timing
+        timing.add("total", duration * 1000)
+        response.headers["Server-Timing"] = timing.get_header()
+        if settings.SERVER_TIMING_LOG:
+            logger.info(
+                "%s %s %s %s",
+                request.method,
+                request.get_full_path(),
+                response.status_code,
+                " ".join(f"{name}={value}" for name, value in timing.as_dict().items()),
+                extra={"timing": {"method": request.method, "path": request.path, "status": response.status_code, **timing.as_dict()}},
+            )
+        return response
+
+
+class MetricsMiddleware(TrackingMiddleware):
+    """
+    Records the count, latency, response size and database queries of every
+    request (see core.metrics), labeled by the name of the resolved URL
+    """
+
+    def __init__(self, get_response):
+        if not settings.METRICS:
+            raise MiddlewareNotUsed
+        super().__init__(get_response)
+
+    def finish(self, request, response, stats, duration):
+        match = getattr(request, "resolver_match", None)
+        route = (match.url_name or match.view_name) if match else "unresolved"
+        REQUESTS.labels(route, request.method, response.status_code).inc()
+        LATENCY.labels(route, request.method).observe(duration)
+        QUERIES.labels(route).observe(stats.count)
+        if not response.streaming:
+            RESPONSE_SIZE.labels(route).observe(len(response.content))
+        return response
@@ -29,6 +29,7 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
     "rest_framework",
     "corsheaders",
+    "core",
     "portfolio",
     "contact",
 ]
@@ -36,7 +37,10 @@ INSTALLED_APPS = [
 CSRF_TRUSTED_ORIGINS = ['http://localhost:4200','https://*.127.0.0.1']
 
 MIDDLEWARE = [
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.ServerTimingMiddleware",
     "corsheaders.middleware.CorsMiddleware",
+    "core.middleware.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -71,9 +75,53 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Seconds a connection is reused, set it to 0 on ASGI workers
+        "CONN_MAX_AGE": env.int("CONN_MAX_AGE", default=600),
+        "CONN_HEALTH_CHECKS": True,
     }
 }
 
+# Pragmas run on every new SQLite connection (core.db)
+SQLITE_PRAGMAS = {
+    "journal_mode": "wal", # Readers don't block the writer (admin) and vice versa
+    "synchronous": "normal", # Safe with WAL, only checkpoints wait for the disk
+    "mmap_size": env.int("SQLITE_MMAP_SIZE", default=128 * 1024 * 1024), # Bytes
+    "cache_size": env.int("SQLITE_CACHE_SIZE", default=-32000), # Pages, or KiB when negative
+    "busy_timeout": env.int("SQLITE_BUSY_TIMEOUT", default=5000), # ms waiting for a lock before "database is locked"
+}
+
+
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://"),
+}
+
+# Seconds that cached portfolio payloads are kept
+PORTFOLIO_CACHE_TIMEOUT = 60 * 60 * 24
+
+# Server-Timing header with the DB, serialization and render time (core.middleware.ServerTimingMiddleware)
+SERVER_TIMING = os.environ.get("SERVER_TIMING", str(DEBUG)) == "True"
+
+SERVER_TIMING_LOG = os.environ.get("SERVER_TIMING_LOG") == "True" # Logs the timings of every request
+
+# Prometheus metrics (core.metrics), served on /metrics
+METRICS = os.environ.get("METRICS", "True") == "True"
+
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN") # Bearer token that allows to read /metrics
+
+INTERNAL_IPS = env.list("INTERNAL_IPS", default=[]) # Also allowed to read /metrics, without token
+
+# Response compression (core.middleware.CompressionMiddleware)
+COMPRESSION_MIN_SIZE = 1024 # Bytes, smaller bodies are sent uncompressed
+COMPRESSION_BROTLI_QUALITY = 5
+COMPRESSION_CONTENT_TYPES = (
+    "application/json",
+    "application/vnd.portfolio.sideload+json",
+    "application/javascript",
+    "text/css",
+    "text/javascript",
+    "image/svg+xml",
+)
+
 
 AUTH_PASSWORD_VALIDATORS = [
     {
@@ -100,8 +148,49 @@ MEDIA_URL = "/media/"
 
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 
+# Uploads are stored under content hashed names (core.storage)
+STORAGES = {
+    "default": {"BACKEND": "core.storage.HashedFileSystemStorage"},
+    "staticfiles": {"BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage"},
+}
+
+# Media served by core.media.serve_media
+MEDIA_CACHE_MAX_AGE = 60 * 60 * 24 * 365 # Sec, for content hashed files
+
+MEDIA_SENDFILE_HEADER = os.environ.get("MEDIA_SENDFILE_HEADER") # "X-Sendfile" (Apache) or "X-Accel-Redirect" (nginx) hands the files off to the web server
+
+MEDIA_SENDFILE_PREFIX = os.environ.get("MEDIA_SENDFILE_PREFIX", "/protected-media/") # nginx internal location of MEDIA_ROOT
+
+# Widths (px) of the resized copies generated for uploaded images
+IMAGE_VARIANT_WIDTHS = (320, 640, 960, 1280)
+
+IMAGE_VARIANT_QUALITY = 80
+
+# Size (px) of the longest side of the image placeholders
+IMAGE_PLACEHOLDER_SIZE = 16
+
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# REST framework settings
+REST_FRAMEWORK = {
+    "DEFAULT_RENDERER_CLASSES": [
+        "portfolio.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "portfolio.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
+    "DEFAULT_THROTTLE_RATES": {
+        "contact_ip": "5/hour",
+        "contact_email": "3/hour",
+    },
+    # Proxies in front of the app. The client IP is taken from X-Forwarded-For
+    # as appended by the last of them, with 0 it's REMOTE_ADDR
+    "NUM_PROXIES": int(os.environ.get("NUM_PROXIES", 0)),
+}
+
 # CORS settings
 CORS_ALLOW_ALL_ORIGINS = True
 
@@ -112,6 +201,19 @@ DEFAULT_FROM_EMAIL = 'no-responder@manuelferrero.com.ar'
 
 DEFAULT_CONTACT_EMAIL = 'contacto@manuelferrero.com.ar'
 
+# Contact outbox (delivered by `manage.py send_outbox`)
+CONTACT_OUTBOX_BATCH_SIZE = 20 # Emails per SMTP connection
+
+CONTACT_OUTBOX_MAX_ATTEMPTS = 5
+
+CONTACT_OUTBOX_RETRY_DELAY = 60 # Sec, doubled on each failed attempt
+
+CONTACT_OUTBOX_LEASE = 600 # Sec that a claimed email waits before being retried by another worker
+
+CONTACT_OUTBOX_POLL_INTERVAL = 5 # Sec
+
+CONTACT_DUPLICATE_WINDOW = 60 * 60 # Sec that identical messages are ignored
+
 
 
 #! =============================== PRODUCTION SETTINGS ===============================
@@ -135,6 +237,14 @@ if not DEBUG:
         'https://ferreromanuel.pythonanywhere.com',
     ]
 
+    # Behind the load balancer of PythonAnywhere
+    REST_FRAMEWORK["NUM_PROXIES"] = int(os.environ.get("NUM_PROXIES", 1))
+
+    # Cache shared between workers
+    CACHES = {
+        "default": env.cache("CACHE_URL", default=f"filecache://{BASE_DIR / 'cache'}"),
+    }
+
     # Email settings
     EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 
@@ -0,0 +1,60 @@
+import hashlib
+import re
+from pathlib import PurePosixPath
+
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files import File
+from django.core.files.storage import FileSystemStorage
+from django.core.files.utils import validate_file_name
+
+
+# Names of the files stored by HashedFileSystemStorage: <stem>.<16 hex digits><suffix>
+HASHED_NAME = re.compile(r"\.[0-9a-f]{16}(\.[^./]+)?$")
+
+
+def is_hashed(name):
+    return HASHED_NAME.search(name) is not None
+
+
+class HashedFileSystemStorage(FileSystemStorage):
+    """
+    Stores every file under a name with the hash of its content, eg.:
+    img/projects/photo.jpg -> img/projects/photo.3f2a9c0d1b7e4a65.jpg
+
+    A name never changes its content, so files can be cached forever
+    (see core.media), and uploading the same file again reuses it.
+    """
+
+    def get_hashed_name(self, name, content, max_length=None):
+        """
+        Returns the hashed name of content. Like get_available_name, the stem
+        is truncated to fit max_length, so an existing file is only reused
+        when its name also fits.
+        """
+        digest = hashlib.sha256()
+        for chunk in content.chunks():
+            digest.update(chunk)
+        path = PurePosixPath(name)
+        stem = path.stem
+        suffix = f".{digest.hexdigest()[:16]}{path.suffix}"
+        if max_length is not None:
+            excess = len(str(path.with_name(stem + suffix))) - max_length
+            if excess > 0:
+                stem = stem[:-excess]
+                if not stem:
+                    raise SuspiciousFileOperation(
+                        f'Storage can not find an available filename for "{name}". '
+                        'Please make sure that the corresponding file field allows sufficient "max_length".'
+                    )
+        return str(path.with_name(stem + suffix))
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        validate_file_name(name, allow_relative_path=True)
+        name = self.get_hashed_name(name, content, max_length=max_length)
+        if self.exists(name):
+            return name
+        return super().save(name, content, max_length=max_length)
@@ -1,15 +1,16 @@
 from django.conf import settings
-from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include, re_path
 
 from contact.views import EmailAPI
+from core.media import serve_media
+from core.metrics import metrics
 
 urlpatterns = [
     path("admin/", admin.site.urls),
+    path("metrics", metrics, name="metrics"),
+    path(f"{settings.MEDIA_URL.strip('/')}/<path:path>", serve_media, name="media"),
+    path("async/", include('portfolio.async_urls')),
     path('', include('portfolio.urls')),
-    re_path('contact', EmailAPI.as_view()),
+    re_path('contact', EmailAPI.as_view(), name="contact"),
 ]
-
-if settings.DEBUG:
-    urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
@@ -0,0 +1,29 @@
+"""
+Gunicorn settings.
+
+Every worker writes its Prometheus metrics to PROMETHEUS_MULTIPROC_DIR and
+/metrics aggregates them (see core.metrics). The directory is emptied when
+the server starts and the files of dead workers are marked on exit.
+"""
+import os
+import shutil
+from pathlib import Path
+
+
+wsgi_app = "core.wsgi:application"
+
+# prometheus_client picks its value class when it is imported, so the
+# directory is set before the master (and so the forked workers) imports it
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", str(Path(__file__).resolve().parent / "metrics"))
+
+
+def on_starting(server):
+    directory = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(directory, ignore_errors=True)
+    os.makedirs(directory)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -18,14 +18,48 @@ from .models import (
 )
 
 
-admin.site.register([
-    Experience,
-    ExtLink,
-    Repository,
-    Education,
-    ProjectCategory,
-    ProjectLanguage,
-])
+class PortfolioAdmin(admin.ModelAdmin):
+    """
+    Base of the portfolio admins. Changelists are paginated without counting
+    the whole table, and relations use autocomplete widgets (declared on
+    each admin), so no page loads a full table into a select box.
+    """
+    list_per_page = 50
+    show_full_result_count = False
+
+
+@admin.register(ExtLink)
+class ExtLinkAdmin(PortfolioAdmin):
+    search_fields = ("title",)
+
+
+@admin.register(Repository)
+class RepositoryAdmin(PortfolioAdmin):
+    search_fields = ("title",)
+
+
+@admin.register(ProjectCategory)
+class ProjectCategoryAdmin(PortfolioAdmin):
+    search_fields = ("title",)
+
+
+@admin.register(ProjectLanguage)
+class ProjectLanguageAdmin(PortfolioAdmin):
+    search_fields = ("title",)
+
+
+@admin.register(Education)
+class EducationAdmin(PortfolioAdmin):
+    list_display = ("title", "place", "developer", "startDate", "finishDate", "isActive")
+    list_select_related = ("developer",)
+    autocomplete_fields = ("developer", "repository")
+
+
+@admin.register(Experience)
+class ExperienceAdmin(PortfolioAdmin):
+    list_display = ("title", "company", "developer", "startDate", "finishDate", "isActive")
+    list_select_related = ("developer",)
+    autocomplete_fields = ("developer", "project", "repository", "extLink")
 
 
 class DeveloperLanguageInline(admin.TabularInline):
@@ -45,7 +79,8 @@ class DeveloperTitleInline(admin.TabularInline):
 
 
 @admin.register(Developer)
-class DeveloperAdmin(admin.ModelAdmin):
+class DeveloperAdmin(PortfolioAdmin):
+    search_fields = ("firstName", "lastName")
     inlines = [
         DeveloperLanguageInline,
         DeveloperSkillInline,
@@ -57,21 +92,38 @@ class DeveloperAdmin(admin.ModelAdmin):
 class SkillFrameworkInline(admin.TabularInline):
     model = Framework
 
+    def get_queryset(self, request):
+        # Framework.__str__ (shown on every row) renders the skill
+        return super().get_queryset(request).select_related("skill")
+
 
 @admin.register(Skill)
-class SkillAdmin(admin.ModelAdmin):
+class SkillAdmin(PortfolioAdmin):
+    list_display = ("title", "developer", "proficiency", "isActive")
+    list_select_related = ("developer",)
+    search_fields = ("title",)
+    autocomplete_fields = ("developer",)
     inlines = [
         SkillFrameworkInline,
     ]
 
 
+@admin.register(Framework)
+class FrameworkAdmin(PortfolioAdmin):
+    list_select_related = ("skill",)
+    autocomplete_fields = ("skill",)
+
+
 class ProjectImageInline(admin.TabularInline):
     model = ProjectImage
 
 
-
 @admin.register(Project)
-class ProjectAdmin(admin.ModelAdmin):
+class ProjectAdmin(PortfolioAdmin):
+    list_display = ("title", "developer", "category", "status", "startDate", "isActive")
+    list_select_related = ("developer", "category")
+    search_fields = ("title",)
+    autocomplete_fields = ("developer", "category", "languages", "repository", "extLink")
     inlines = [
         ProjectImageInline,
     ]
@@ -0,0 +1,18 @@
+from django.urls import re_path
+
+from portfolio import generics, urls
+from portfolio.async_views import AsyncReadView
+
+# Async variant of every generic route of portfolio.urls (see AsyncReadView)
+urlpatterns = [
+    re_path(
+        pattern.pattern.regex.pattern,
+        AsyncReadView.as_view(view_class=pattern.callback.view_class),
+        name=f"async_{pattern.name}",
+    )
+    for pattern in urls.urlpatterns
+    if issubclass(
+        getattr(pattern.callback, "view_class", object),
+        (generics.ListCreateAPIView, generics.RetrieveUpdateDestroyAPIView),
+    )
+]
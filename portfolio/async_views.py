@@ -0,0 +1,110 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.http import Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from django.views import View
+
+from rest_framework.exceptions import APIException, NotFound
+from rest_framework.views import exception_handler
+
+from core.metrics import record_cache
+from portfolio.cache import RESPONSE_KEY, get_serializer_models, get_versions, get_versions_digest
+from portfolio.mixins import FacetMixin
+from portfolio.renderers import FastJSONRenderer, SideloadJSONRenderer
+
+
+class AsyncReadView(View):
+    """
+    Async GET variant of a portfolio generic view (view_class), served under
+    /async/. The view_class queryset, filters, ordering, pagination and
+    serializer are reused, but the rows are read with the async ORM, so the
+    event loop keeps serving other requests while SQLite works.
+
+    Responses are JSON or sideloaded JSON (with `?facets=true` on lists),
+    with the same ETag and cached body handling of the sync views.
+    """
+    view_class = None
+    http_method_names = ["get", "head", "options"]
+    renderers = [FastJSONRenderer(), SideloadJSONRenderer()]
+
+    def get_view(self, request, kwargs):
+        view = self.view_class(format_kwarg=None, args=(), kwargs=kwargs)
+        view.request = view.initialize_request(request)
+        return view
+
+    def render_error(self, error):
+        response = exception_handler(error, {})
+        renderer = self.renderers[0]
+        return HttpResponse(renderer.render(response.data), status=response.status_code, content_type=renderer.media_type)
+
+    async def get(self, request, **kwargs):
+        view = self.get_view(request, kwargs)
+        try:
+            renderer, media_type = view.get_content_negotiator().select_renderer(view.request, self.renderers)
+        except Http404:
+            # Unknown ?format=
+            return self.render_error(NotFound())
+        except APIException as error:
+            return self.render_error(error)
+        view.request.accepted_renderer, view.request.accepted_media_type = renderer, media_type
+
+        serializer_class = view.get_serializer_class()
+        versions = await sync_to_async(get_versions)(get_serializer_models(serializer_class))
+        request_key = f"async:{renderer.format}:{request.build_absolute_uri()}:{get_versions_digest(versions)}"
+        digest = hashlib.sha1(request_key.encode()).hexdigest()
+        etag = quote_etag(digest)
+        last_modified = max(versions.values()) // 10 ** 9
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            key = RESPONSE_KEY.format(serializer_class.Meta.model._meta.model_name, digest)
+            content = await cache.aget(key)
+            record_cache("response", content is not None)
+            if content is None:
+                try:
+                    data = await self.get_data(view, kwargs)
+                except APIException as error:
+                    return self.render_error(error)
+                content = renderer.render(data)
+                await cache.aset(key, content, settings.PORTFOLIO_CACHE_TIMEOUT)
+            response = HttpResponse(content, content_type=renderer.media_type)
+        response["ETag"] = etag
+        response["Last-Modified"] = http_date(last_modified)
+        patch_cache_control(response, no_cache=True)
+        return response
+
+    async def get_data(self, view, kwargs):
+        """
+        Returns the serialized object or list. Querysets are only built here,
+        rows are fetched with `async for`/afirst(): unlike aiterator() (on
+        Django 4.2) they honour prefetch_related, so the serializer runs
+        without queries.
+        """
+        queryset = view.filter_queryset(view.get_queryset())
+        if "pk" in kwargs:
+            instance = await queryset.filter(pk=kwargs["pk"]).afirst()
+            if instance is None:
+                raise NotFound()
+            data = view.get_serializer(instance).data
+            if view.is_sideloaded():
+                data = {"result": data, "included": await sync_to_async(view.get_included)([data])}
+            return data
+
+        page = await sync_to_async(view.paginate_queryset)(queryset)
+        if page is not None:
+            data = view.get_paginated_response(view.get_serializer(page, many=True).data).data
+        else:
+            data = view.get_serializer([instance async for instance in queryset], many=True).data
+        # Same shape as SideloadMixin.list and FacetMixin.list
+        if view.is_sideloaded():
+            rows = data["results"] if isinstance(data, dict) else data
+            included = await sync_to_async(view.get_included)(rows)
+            data = {**data, "included": included} if isinstance(data, dict) else {"results": data, "included": included}
+        if isinstance(view, FacetMixin) and view.is_faceted():
+            facets = await sync_to_async(view.get_facets)(queryset)
+            data = {**data, "facets": facets} if isinstance(data, dict) else {"results": data, "facets": facets}
+        return data
@@ -0,0 +1,99 @@
+import re
+import statistics
+import time
+
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from portfolio.export import get_routes
+
+
+# Endpoints measured besides the routes exported by portfolio.export
+EXTRA_URLS = [
+    "/search?q=project",
+    "/project?facets=true",
+    "/project?format=sideload",
+    "/project?expand=developer,category,languages,project_images,repository,extLink",
+]
+
+# Max queries of an uncached request to every endpoint (<pk> stands for any
+# primary key). They don't depend on the number of rows, so a higher count
+# means a new N+1 query.
+QUERY_BUDGETS = {
+    "/bundle": 18,
+    "/developer/<pk>/bundle": 19,
+    "/developer": 1,
+    "/developer/<pk>": 1,
+    "/title": 1,
+    "/title/<pk>": 1,
+    "/social_link": 1,
+    "/social_link/<pk>": 1,
+    "/language": 1,
+    "/language/<pk>": 1,
+    "/skill": 1,
+    "/skill/<pk>": 1,
+    "/framework": 1,
+    "/framework/<pk>": 1,
+    "/repository": 1,
+    "/repository/<pk>": 1,
+    "/education": 1,
+    "/education/<pk>": 1,
+    "/project_category": 1,
+    "/project_category/<pk>": 1,
+    "/project_language": 1,
+    "/project_language/<pk>": 1,
+    "/external_link": 1,
+    "/external_link/<pk>": 1,
+    "/project_image": 1,
+    "/project_image/<pk>": 1,
+    "/project": 4,
+    "/project/details/<pk>": 4,
+    "/project/dev": 4,
+    "/project/pro": 4,
+    "/project/pau": 4,
+    "/project/can": 4,
+    "/experience": 2,
+    "/experience/<pk>": 2,
+    "/search?q=project": 1,
+    "/project?facets=true": 5,
+    "/project?format=sideload": 10,
+    "/project?expand=developer,category,languages,project_images,repository,extLink": 4,
+}
+
+
+def get_template(url):
+    return re.sub(r"/[0-9]+(?=/|$)", "/<pk>", url)
+
+
+def get_benchmark_urls():
+    """
+    Returns the URL of every public route (the first primary key of the
+    detail routes) and the EXTRA_URLS
+    """
+    urls = {}
+    for path, _view, _kwargs, _models in get_routes():
+        urls.setdefault(get_template(f"/{path}"), f"/{path}")
+    return list(urls.values()) + EXTRA_URLS
+
+
+def measure(client, url, repeat=1):
+    """
+    Requests url `repeat` times with an empty cache, returns the status,
+    queries, bytes and the p50 and p95 latency (ms)
+    """
+    timings = []
+    for _ in range(repeat):
+        cache.clear()
+        with CaptureQueriesContext(connection) as context:
+            start = time.perf_counter()
+            response = client.get(url, secure=True)
+            timings.append((time.perf_counter() - start) * 1000)
+    timings.sort()
+    return {
+        "status": response.status_code,
+        "queries": len(context),
+        "bytes": len(response.content),
+        "p50": statistics.median(timings),
+        "p95": timings[min(len(timings) - 1, int(len(timings) * 0.95))],
+    }
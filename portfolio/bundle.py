@@ -0,0 +1,106 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from core.metrics import record_cache
+from portfolio.cache import get_portfolio_models, get_versions, get_versions_digest
+from portfolio.mixins import optimize_queryset, referenced_ids
+from portfolio.models import (
+    Developer,
+    Title,
+    SocialLink,
+    Language,
+    Skill,
+    Framework,
+    Repository,
+    Education,
+    ProjectCategory,
+    ProjectLanguage,
+    ExtLink,
+    Project,
+    ProjectImage,
+    Experience,
+)
+from portfolio.serializers import (
+    DeveloperSerializer,
+    TitleSerializer,
+    SocialLinkSerializer,
+    LanguageSerializer,
+    SkillSerializer,
+    FrameworkSerializer,
+    RepositorySerializer,
+    EducationSerializer,
+    ProjectCategorySerializer,
+    ProjectLanguageSerializer,
+    ExtLinkSerializer,
+    ProjectSerializer,
+    ProjectImageSerializer,
+    ExperienceSerializer,
+)
+
+
+BUNDLE_KEY = "portfolio:bundle:{}:{}:{}"
+
+
+def serialize(queryset, serializer_class, context):
+    serializer = serializer_class(context=context)
+    return serializer_class(optimize_queryset(queryset, serializer), many=True, context=context).data
+
+
+def build_bundle(request, developer_id=None):
+    """
+    Returns the whole public portfolio as a normalized document: one list per
+    resource, where related objects are referenced by primary key
+    """
+    def scoped(queryset, lookup="developer"):
+        if developer_id is None:
+            return queryset
+        return queryset.filter(**{lookup: developer_id})
+
+    context = {"request": request}
+    bundle = {
+        "developer": serialize(scoped(Developer.objects.order_by("id"), "pk"), DeveloperSerializer, context),
+        "title": serialize(scoped(Title.objects.order_by("id")), TitleSerializer, context),
+        "social_link": serialize(scoped(SocialLink.objects.filter(isActive=True).order_by("id")), SocialLinkSerializer, context),
+        "language": serialize(scoped(Language.objects.filter(isActive=True).order_by("-proficiency")), LanguageSerializer, context),
+        "skill": serialize(scoped(Skill.objects.filter(isActive=True).order_by("-proficiency")), SkillSerializer, context),
+        "framework": serialize(scoped(Framework.objects.filter(isActive=True).order_by("id"), "skill__developer"), FrameworkSerializer, context),
+        "education": serialize(scoped(Education.objects.filter(isActive=True).order_by("-finishDate")), EducationSerializer, context),
+        "experience": serialize(scoped(Experience.objects.filter(isActive=True).order_by("-startDate")), ExperienceSerializer, context),
+    }
+    project_ids = referenced_ids(bundle["experience"], "project")
+    projects = Project.objects.filter(Q(isActive=True) | Q(pk__in=project_ids))
+    bundle["project"] = serialize(scoped(projects.order_by("startDate")), ProjectSerializer, context)
+    bundle["project_image"] = serialize(
+        ProjectImage.objects.filter(project__in=[row["id"] for row in bundle["project"]]).order_by("-isFeature", "id"),
+        ProjectImageSerializer,
+        context,
+    )
+
+    related = [
+        ("repository", Repository, RepositorySerializer, ("education", "project", "experience"), "repository"),
+        ("project_category", ProjectCategory, ProjectCategorySerializer, ("project",), "category"),
+        ("project_language", ProjectLanguage, ProjectLanguageSerializer, ("project",), "languages"),
+        ("external_link", ExtLink, ExtLinkSerializer, ("project", "experience"), "extLink"),
+    ]
+    for name, model, serializer_class, sections, field in related:
+        ids = set()
+        for section in sections:
+            ids |= referenced_ids(bundle[section], field)
+        bundle[name] = serialize(model.objects.filter(pk__in=ids).order_by("id"), serializer_class, context)
+    return bundle
+
+
+def get_bundle(request, developer_id=None):
+    """
+    Returns the bundle snapshot, building it only if a portfolio model
+    changed since the last snapshot was stored
+    """
+    digest = get_versions_digest(get_versions(get_portfolio_models()))
+    key = BUNDLE_KEY.format(request.build_absolute_uri("/"), developer_id or "all", digest)
+    bundle = cache.get(key)
+    record_cache("bundle", bundle is not None)
+    if bundle is None:
+        bundle = build_bundle(request, developer_id)
+        cache.set(key, bundle, settings.PORTFOLIO_CACHE_TIMEOUT)
+    return bundle
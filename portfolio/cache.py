@@ -0,0 +1,129 @@
+import functools
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.apps import apps
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+
+from rest_framework import serializers
+
+
+VERSION_KEY = "portfolio:version:{}"
+
+RESPONSE_KEY = "portfolio:response:{}:{}"
+
+# Models changed inside defer_invalidation()
+deferred_models = ContextVar("deferred_models", default=None)
+
+
+def get_portfolio_models():
+    """
+    Returns the models of the portfolio app
+    """
+    return list(apps.get_app_config("portfolio").get_models())
+
+
+def get_version_key(model):
+    return VERSION_KEY.format(model._meta.label_lower)
+
+
+def get_versions(models):
+    """
+    Returns a dict with the version token of each model.
+
+    A version token is the time (in ns) of the last change of the model. When
+    the token is missing from the cache (first request or evicted) a new one
+    is stored, so stale payloads can never match a token again.
+    """
+    keys = {get_version_key(model): model for model in models}
+    versions = cache.get_many(keys)
+    for key in keys.keys() - versions.keys():
+        cache.add(key, time.time_ns(), None)
+        versions[key] = cache.get(key)
+    return {model: versions[key] for key, model in keys.items()}
+
+
+def set_version(model):
+    cache.set(get_version_key(model), time.time_ns(), None)
+
+
+def bump_version(model):
+    """
+    Marks model as changed, invalidating every payload which depends on it.
+
+    The version changes when the current transaction commits (right away
+    outside of one): otherwise a reader could render the old rows under the
+    new version and keep them cached until the next change.
+    """
+    deferred = deferred_models.get()
+    if deferred is not None:
+        deferred.add(model)
+        return
+    transaction.on_commit(functools.partial(set_version, model))
+
+
+@contextmanager
+def defer_invalidation():
+    """
+    Bumps the version of the models changed inside the block once, when it
+    exits, instead of on every change (eg.: on every row of a batch)
+    """
+    if deferred_models.get() is not None:
+        yield
+        return
+    token = deferred_models.set(set())
+    try:
+        yield
+    finally:
+        models = deferred_models.get()
+        deferred_models.reset(token)
+        for model in models:
+            bump_version(model)
+
+
+def get_versions_digest(versions):
+    """
+    Returns a short digest of a dict of version tokens
+    """
+    tokens = sorted(f"{model._meta.label_lower}={token}" for model, token in versions.items())
+    return hashlib.sha1(";".join(tokens).encode()).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def get_serializer_models(serializer_class):
+    """
+    Returns the models whose rows can be rendered by serializer_class,
+    following nested, related and expandable fields. A payload must be
+    invalidated when any of them changes.
+    """
+    return frozenset(collect_serializer_models(serializer_class()))
+
+
+def collect_serializer_models(serializer, seen=None):
+    seen = set() if seen is None else seen
+    if isinstance(serializer, serializers.ListSerializer):
+        serializer = serializer.child
+    if type(serializer) in seen:
+        return set()
+    seen.add(type(serializer))
+    model = serializer.Meta.model
+    models = {model}
+    for field in serializer.fields.values():
+        if isinstance(field, serializers.BaseSerializer):
+            models |= collect_serializer_models(field, seen)
+        elif isinstance(field, (serializers.RelatedField, serializers.ManyRelatedField)):
+            try:
+                related_model = model._meta.get_field(field.source).related_model
+            except FieldDoesNotExist:
+                continue
+            if related_model is not None:
+                models.add(related_model)
+    for serializer_class in getattr(serializer.Meta, "expandable_fields", {}).values():
+        if isinstance(serializer_class, tuple):
+            serializer_class = serializer_class[0]
+        models |= collect_serializer_models(serializer_class(), seen)
+    return models
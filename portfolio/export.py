@@ -0,0 +1,154 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+
+from django.test import RequestFactory
+
+from portfolio import urls
+from portfolio.cache import get_portfolio_models, get_serializer_models, get_versions, get_versions_digest
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MANIFEST_NAME = "manifest.json"
+
+# Routes which aren't exported: the HTML home and the search (it depends on
+# the query string)
+EXCLUDED_ROUTES = {"home", "search"}
+
+GROUP_PATTERN = re.compile(r"\(\?P<(?P<name>\w+)>(?P<pattern>[^)]*)\)")
+
+
+def get_route_kwargs(pattern, view_class):
+    """
+    Returns every combination of URL kwargs of a route: literal groups (eg.:
+    project/(?P<status>dev)) have a single value and the other ones are
+    primary keys of the view queryset
+    """
+    combinations = [{}]
+    for group in GROUP_PATTERN.finditer(pattern):
+        if group["pattern"].isalnum():
+            values = [group["pattern"]]
+        else:
+            values = [str(pk) for pk in view_class.queryset.model._default_manager.order_by("pk").values_list("pk", flat=True)]
+        combinations = [dict(kwargs, **{group["name"]: value}) for kwargs in combinations for value in values]
+    return combinations
+
+
+def get_routes():
+    """
+    Yields (path, view, kwargs, models) for every public GET endpoint of
+    portfolio.urls, where models are the ones rendered by the view
+    """
+    for pattern in urls.urlpatterns:
+        view_class = getattr(pattern.callback, "view_class", None)
+        if view_class is None or pattern.name in EXCLUDED_ROUTES:
+            continue
+        regex = pattern.pattern.regex.pattern
+        serializer_class = getattr(view_class, "serializer_class", None)
+        models = get_serializer_models(serializer_class) if serializer_class else get_portfolio_models()
+        for kwargs in get_route_kwargs(regex, view_class):
+            path = GROUP_PATTERN.sub(lambda group: kwargs[group["name"]], regex).strip("^$")
+            yield path, pattern.callback, kwargs, models
+
+
+def write_file(path, content):
+    """
+    Replaces a file atomically, so the files are never served half written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.write_bytes(content)
+    os.replace(temporary, path)
+
+
+def get_variants(content):
+    """
+    Returns the precompressed copies of a file, with the best (slowest)
+    compression since they are built once
+    """
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+    return variants
+
+
+class StaticExport:
+    """
+    Renders the portfolio endpoints to <output>/<path>.json, with gzip and
+    Brotli copies (<path>.json.gz / .br) and a manifest:
+    {"host", "files": {"/<path>": {"file", "sha256", "bytes", "versions"}}}
+
+    Exports are incremental: an endpoint is only rendered again when the
+    version of a model it renders changed since the last export (see
+    portfolio.cache), and its files are only written when the content hash
+    changed. Files of endpoints which no longer exist are removed.
+    """
+
+    def __init__(self, output, host, force=False):
+        self.output = Path(output)
+        self.host = host
+        self.force = force
+        self.factory = RequestFactory()
+        self.manifest = self.read_manifest()
+
+    def read_manifest(self):
+        try:
+            manifest = json.loads((self.output / MANIFEST_NAME).read_text())
+        except (OSError, ValueError):
+            return {}
+        return manifest["files"] if manifest.get("host") == self.host else {}
+
+    def render(self, path, view, kwargs):
+        request = self.factory.get(f"/{path}", secure=True, HTTP_HOST=self.host, HTTP_ACCEPT="application/json")
+        response = view(request, **kwargs)
+        if hasattr(response, "render"):
+            response.render()
+        if response.status_code != 200:
+            raise ValueError(f"/{path} answered {response.status_code}")
+        return response.content
+
+    def export(self):
+        """
+        Runs the export, returns the number of written, unchanged and
+        removed endpoints
+        """
+        files = {}
+        stats = {"written": 0, "unchanged": 0, "removed": 0}
+        for path, view, kwargs, models in get_routes():
+            url = f"/{path}"
+            name = f"{path}.json"
+            versions = get_versions_digest(get_versions(models))
+            previous = self.manifest.get(url)
+            exists = (self.output / name).exists()
+            if not self.force and exists and previous and previous["versions"] == versions:
+                files[url] = previous
+                stats["unchanged"] += 1
+                continue
+
+            content = self.render(path, view, kwargs)
+            digest = hashlib.sha256(content).hexdigest()
+            if self.force or not exists or not previous or previous["sha256"] != digest:
+                write_file(self.output / name, content)
+                for extension, compressed in get_variants(content).items():
+                    write_file(self.output / f"{name}{extension}", compressed)
+                stats["written"] += 1
+            else:
+                stats["unchanged"] += 1
+            files[url] = {"file": name, "sha256": digest, "bytes": len(content), "versions": versions}
+
+        for url in self.manifest.keys() - files.keys():
+            name = self.manifest[url]["file"]
+            for extension in ("", ".gz", ".br"):
+                (self.output / f"{name}{extension}").unlink(missing_ok=True)
+            stats["removed"] += 1
+
+        manifest = {"host": self.host, "files": dict(sorted(files.items()))}
+        write_file(self.output / MANIFEST_NAME, json.dumps(manifest, indent=2).encode())
+        return stats
@@ -0,0 +1,163 @@
+import random
+from datetime import date, timedelta
+
+from portfolio.cache import bump_version, get_portfolio_models
+from portfolio.models import (
+    PROJECT_STATUS_CHOICES,
+    Developer,
+    Title,
+    SocialLink,
+    Language,
+    Skill,
+    Framework,
+    Repository,
+    Education,
+    ProjectCategory,
+    ProjectLanguage,
+    ExtLink,
+    Project,
+    ProjectImage,
+    Experience,
+)
+from portfolio.search import rebuild_index
+
+
+def create_portfolio(rows):
+    """
+    Creates a developer with `rows` items of every related model
+    """
+    developer = Developer.objects.create(
+        firstName="Manuel",
+        lastName="Ferrero",
+        jobTitle="Developer",
+        phone="123456789",
+        email="dev@example.com",
+        residence="Córdoba - Argentina",
+        photo="img/about/seed.png",
+        about="About",
+        aboutShort="Short",
+        cvEsp="files/cv/cv-esp.pdf",
+        cvEng="files/cv/cv-eng.pdf",
+    )
+    category = ProjectCategory.objects.create(title="Web")
+    for i in range(rows):
+        Title.objects.create(developer=developer, title=f"Title {i}")
+        SocialLink.objects.create(developer=developer, title=f"Social {i}", icon="icon", link="https://example.com")
+        Language.objects.create(developer=developer, title=f"Language {i}", proficiency=50)
+        skill = Skill.objects.create(developer=developer, title=f"Skill {i}", proficiency=50)
+        Framework.objects.create(skill=skill, title=f"Framework {i}", icon="icon")
+        repository = Repository.objects.create(title=f"Repo {i}", link="https://example.com", readmeLink="https://example.com")
+        Education.objects.create(developer=developer, title=f"Education {i}", place="Place", startDate=date(2020, 1, 1), description="Description", repository=repository)
+        language = ProjectLanguage.objects.create(title=f"Lang {i}")
+        link = ExtLink.objects.create(title=f"Link {i}", link="https://example.com")
+        project = Project.objects.create(developer=developer, title=f"Project {i}", category=category, client="Client", startDate=date(2020, 1, 1), description="Description", repository=repository, status="PRO")
+        project.languages.add(language)
+        project.extLink.add(link)
+        ProjectImage.objects.create(project=project, image="img/projects/seed.jpg", altText=f"Image {i}")
+        experience = Experience.objects.create(developer=developer, title=f"Experience {i}", company="Company", place="Place", startDate=date(2020, 1, 1), description="Description", project=project, repository=repository)
+        experience.extLink.add(link)
+    return developer
+
+
+def generate_portfolios(developers, rows, seed=0):
+    """
+    Creates `developers` developers with about `rows` items of every related
+    model each (2 frameworks per skill, 3 images and 2 languages per project),
+    with random statuses, dates and inactive items.
+
+    Rows are inserted with bulk_create, which sends no signals, so the search
+    index is rebuilt and every model version is bumped at the end.
+    """
+    generator = random.Random(seed)
+    statuses = [status for status, _label in PROJECT_STATUS_CHOICES]
+
+    def day():
+        return date(2015, 1, 1) + timedelta(days=generator.randrange(3000))
+
+    def active():
+        return generator.random() > 0.2
+
+    categories = ProjectCategory.objects.bulk_create(ProjectCategory(title=f"Category {i}") for i in range(max(1, rows // 4)))
+    languages = ProjectLanguage.objects.bulk_create(ProjectLanguage(title=f"Lang {i}") for i in range(max(2, rows // 2)))
+    developer_objects = Developer.objects.bulk_create(
+        Developer(
+            firstName=f"Developer {d}",
+            lastName="Generated",
+            jobTitle="Developer",
+            phone="123456789",
+            email=f"dev{d}@example.com",
+            residence="Córdoba - Argentina",
+            photo="img/about/seed.png",
+            about="About " * 50,
+            aboutShort="Short",
+            cvEsp="files/cv/cv-esp.pdf",
+            cvEng="files/cv/cv-eng.pdf",
+        )
+        for d in range(developers)
+    )
+    for developer in developer_objects:
+        Title.objects.bulk_create(Title(developer=developer, title=f"Title {i}") for i in range(rows))
+        SocialLink.objects.bulk_create(
+            SocialLink(developer=developer, title=f"Social {i}", icon="icon", link="https://example.com", isActive=active())
+            for i in range(rows)
+        )
+        Language.objects.bulk_create(
+            Language(developer=developer, title=f"Language {i}", proficiency=generator.randint(1, 100), isActive=active())
+            for i in range(max(1, rows // 2))
+        )
+        skills = Skill.objects.bulk_create(
+            Skill(developer=developer, title=f"Skill {i}", proficiency=generator.randint(1, 100), isActive=active())
+            for i in range(rows)
+        )
+        Framework.objects.bulk_create(
+            Framework(skill=skill, title=f"Framework {i}", icon="icon", isActive=active())
+            for skill in skills for i in range(2)
+        )
+        repositories = Repository.objects.bulk_create(
+            Repository(title=f"Repo {i}", link="https://example.com", readmeLink="https://example.com")
+            for i in range(rows)
+        )
+        Education.objects.bulk_create(
+            Education(
+                developer=developer, title=f"Education {i}", place="Place", startDate=day(),
+                finishDate=day() if generator.random() > 0.3 else None, description="Description " * 20,
+                repository=generator.choice(repositories), isActive=active(),
+            )
+            for i in range(rows)
+        )
+        projects = Project.objects.bulk_create(
+            Project(
+                developer=developer, title=f"Project {i}", category=generator.choice(categories), client="Client",
+                startDate=day(), description="Description " * 40, repository=generator.choice(repositories),
+                status=generator.choice(statuses), isActive=active(),
+            )
+            for i in range(rows)
+        )
+        Project.languages.through.objects.bulk_create(
+            Project.languages.through(project=project, projectlanguage=language)
+            for project in projects for language in generator.sample(languages, 2)
+        )
+        links = ExtLink.objects.bulk_create(ExtLink(title=f"Link {i}", link="https://example.com") for i in range(rows))
+        Project.extLink.through.objects.bulk_create(
+            Project.extLink.through(project=project, extlink=link) for project, link in zip(projects, links)
+        )
+        ProjectImage.objects.bulk_create(
+            ProjectImage(project=project, image="img/projects/seed.jpg", altText=f"Image {i}", isFeature=i == 0)
+            for project in projects for i in range(3)
+        )
+        experiences = Experience.objects.bulk_create(
+            Experience(
+                developer=developer, title=f"Experience {i}", company="Company", place="Place", startDate=day(),
+                finishDate=day() if generator.random() > 0.3 else None, description="Description " * 20,
+                project=generator.choice(projects), repository=generator.choice(repositories), isActive=active(),
+            )
+            for i in range(rows)
+        )
+        Experience.extLink.through.objects.bulk_create(
+            Experience.extLink.through(experience=experience, extlink=link) for experience, link in zip(experiences, links)
+        )
+
+    rebuild_index()
+    for model in get_portfolio_models():
+        bump_version(model)
+    return developer_objects
@@ -0,0 +1,64 @@
+from django.contrib.admin.utils import get_fields_from_path
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+
+
+def is_multivalued(fields):
+    return any(field.many_to_many or field.one_to_many for field in fields)
+
+
+def clean_value(field, value):
+    """
+    Converts a query param value to the python value of the field, validating
+    it against the field choices. Related fields are cleaned as primary keys.
+    """
+    if field.is_relation:
+        field = field.related_model._meta.pk
+    return field.clean(value, None)
+
+
+class FieldFilterBackend(BaseFilterBackend):
+    """
+    Filters the list by the query params declared on the view filter_fields
+    ({param: lookup}). A param accepts comma separated values, eg.:
+    ?status=DEV,PRO&category=3
+
+    Only the declared params are read, so lists are always filtered on
+    indexed columns. Lookups spanning many to many relations are applied as a
+    subquery on the primary key, so rows aren't repeated.
+    """
+    invalid_value_message = _("Valor inválido: %(value)s")
+
+    def get_filter_fields(self, view):
+        return getattr(view, "filter_fields", {})
+
+    def filter_queryset(self, request, queryset, view):
+        for param, lookup in self.get_filter_fields(view).items():
+            raw = request.query_params.get(param)
+            if not raw:
+                continue
+            fields = get_fields_from_path(queryset.model, lookup)
+            try:
+                values = [clean_value(fields[-1], value.strip()) for value in raw.split(",") if value.strip()]
+            except DjangoValidationError:
+                raise ValidationError({param: [self.invalid_value_message % {"value": raw}]})
+            condition = {f"{lookup}__in": values}
+            if is_multivalued(fields):
+                condition = {"pk__in": queryset.model._default_manager.filter(**condition).values("pk")}
+            queryset = queryset.filter(**condition)
+        return queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": param,
+                "required": False,
+                "in": "query",
+                "description": f"Comma separated values of {lookup}",
+                "schema": {"type": "string"},
+            }
+            for param, lookup in self.get_filter_fields(view).items()
+        ]
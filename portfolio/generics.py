@@ -0,0 +1,48 @@
+from rest_framework import generics
+from rest_framework.filters import OrderingFilter
+
+from portfolio.filters import FieldFilterBackend
+from portfolio.mixins import (
+    BulkMixin,
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    DynamicFieldsMixin,
+    FacetMixin,
+    OptimizedQuerysetMixin,
+    ServerTimingMixin,
+    SideloadMixin,
+    StreamingListMixin,
+)
+
+
+class ListCreateAPIView(
+    ServerTimingMixin,
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    StreamingListMixin,
+    SideloadMixin,
+    FacetMixin,
+    DynamicFieldsMixin,
+    OptimizedQuerysetMixin,
+    BulkMixin,
+    generics.ListCreateAPIView,
+):
+    """
+    List filtered by the view filter_fields and ordered with `?ordering=` on
+    the view ordering_fields (only the primary key unless declared), with
+    bulk create, update and delete (see BulkMixin)
+    """
+    filter_backends = (FieldFilterBackend, OrderingFilter)
+    ordering_fields = ("id",)
+
+
+class RetrieveUpdateDestroyAPIView(
+    ServerTimingMixin,
+    ConditionalGetMixin,
+    CachedResponseMixin,
+    SideloadMixin,
+    DynamicFieldsMixin,
+    OptimizedQuerysetMixin,
+    generics.RetrieveUpdateDestroyAPIView,
+):
+    pass
@@ -0,0 +1,134 @@
+import base64
+import logging
+from io import BytesIO
+from pathlib import PurePosixPath
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+
+from PIL import Image
+
+from portfolio.models import Developer, ProjectImage
+
+
+logger = logging.getLogger(__name__)
+
+# Image fields processed on save, per model
+IMAGE_FIELDS = {
+    Developer: ["photo"],
+    ProjectImage: ["image"],
+}
+
+VARIANT_FORMATS = {
+    "webp": "WEBP",
+    "jpeg": "JPEG",
+}
+
+
+def get_variant_name(name, width, extension):
+    """
+    Returns the storage name of a variant: img/projects/variants/<name>-<width>.<extension>
+    """
+    path = PurePosixPath(name)
+    return str(path.parent / "variants" / f"{path.stem}-{width}.{extension}")
+
+
+def save_variant(storage, name, image, image_format):
+    if image_format == "JPEG" and image.mode != "RGB":
+        # JPEG has no alpha channel, transparent images are flattened on white
+        background = Image.new("RGB", image.size, (255, 255, 255))
+        background.paste(image, mask=image.convert("RGBA").getchannel("A"))
+        image = background
+    buffer = BytesIO()
+    image.save(buffer, image_format, quality=settings.IMAGE_VARIANT_QUALITY, optimize=True)
+    if storage.exists(name):
+        storage.delete(name)
+    return storage.save(name, ContentFile(buffer.getvalue()))
+
+
+def open_image(field_file):
+    with field_file.open("rb"):
+        image = Image.open(field_file)
+        image.load()
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+    return image
+
+
+def generate_variants(field_file, image):
+    """
+    Generates resized WebP and JPEG copies of an image at the widths of
+    IMAGE_VARIANT_WIDTHS (never upscaling) and returns their description:
+    {"source": name, "webp": [{"name", "width", "height"}, ...], "jpeg": [...]}
+    """
+    widths = sorted({width for width in settings.IMAGE_VARIANT_WIDTHS if width < image.width} | {image.width})
+    variants = {"source": field_file.name}
+    for extension in VARIANT_FORMATS:
+        variants[extension] = []
+    for width in widths:
+        height = max(1, round(image.height * width / image.width))
+        resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+        for extension, image_format in VARIANT_FORMATS.items():
+            name = save_variant(field_file.storage, get_variant_name(field_file.name, width, extension), resized, image_format)
+            variants[extension].append({"name": name, "width": width, "height": height})
+    return variants
+
+
+def generate_placeholder(image):
+    """
+    Returns a tiny blurred preview of the image as a WebP data URI (a few
+    hundred bytes), to be shown while the real image is downloaded
+    """
+    preview = image.copy()
+    preview.thumbnail((settings.IMAGE_PLACEHOLDER_SIZE, settings.IMAGE_PLACEHOLDER_SIZE))
+    buffer = BytesIO()
+    preview.save(buffer, "WEBP", quality=40)
+    return f"data:image/webp;base64,{base64.b64encode(buffer.getvalue()).decode()}"
+
+
+def get_dominant_color(image):
+    """
+    Returns the most frequent color of the (non transparent) pixels of the
+    image as an hex string
+    """
+    sample = image.convert("RGBA")
+    sample.thumbnail((64, 64))
+    pixels = [pixel[:3] for pixel in sample.getdata() if pixel[3] >= 128] or [pixel[:3] for pixel in sample.getdata()]
+    strip = Image.new("RGB", (len(pixels), 1))
+    strip.putdata(pixels)
+    palette = strip.quantize(colors=8)
+    _count, index = max(palette.getcolors())
+    red, green, blue = palette.getpalette()[index * 3:index * 3 + 3]
+    return f"#{red:02x}{green:02x}{blue:02x}"
+
+
+def update_image(instance, field_name, force=False):
+    """
+    Processes instance.<field_name> when the image changed since the last run
+    and stores the results on the fields named after it: <field_name>Variants,
+    <field_name>Placeholder, <field_name>Color, <field_name>Width and
+    <field_name>Height. Returns True when they were updated.
+    """
+    field_file = getattr(instance, field_name)
+    variants = getattr(instance, f"{field_name}Variants") or {}
+    if not field_file or (not force and variants.get("source") == field_file.name):
+        return False
+    if not field_file.storage.exists(field_file.name):
+        return False
+    try:
+        image = open_image(field_file)
+        values = {
+            "Variants": generate_variants(field_file, image),
+            "Placeholder": generate_placeholder(image),
+            "Color": get_dominant_color(image),
+            "Width": image.width,
+            "Height": image.height,
+        }
+    except (OSError, ValueError) as error:
+        logger.warning("Unable to process %s: %s", field_file.name, error)
+        values = {"Variants": {}, "Placeholder": "", "Color": "", "Width": None, "Height": None}
+    values = {f"{field_name}{suffix}": value for suffix, value in values.items()}
+    for name, value in values.items():
+        setattr(instance, name, value)
+    type(instance)._default_manager.filter(pk=instance.pk).update(**values)
+    return True
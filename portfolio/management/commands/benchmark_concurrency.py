@@ -0,0 +1,136 @@
+import asyncio
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from portfolio.management.commands.export_static_api import get_default_host
+
+
+class Command(BaseCommand):
+    help = (
+        "Starts gunicorn with sync workers and with uvicorn workers (/async/... views) and measures them under slow "
+        "clients, which send the request and read the response over --delay seconds. Runs on the current database "
+        "(see generate_portfolio_data) and requires gunicorn and uvicorn."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="/project", help="Sync endpoint, the async one is /async<url>")
+        parser.add_argument("--requests", type=int, default=200, help="Concurrent requests of every run")
+        parser.add_argument("--workers", type=int, default=4, help="Gunicorn workers of both profiles")
+        parser.add_argument("--delay", type=float, default=0.2, help="Seconds every client takes to send the request and to read the response")
+        parser.add_argument("--port", type=int, default=8765, help="Port of the benchmarked server")
+
+    def handle(self, *args, **options):
+        profiles = [
+            ("sync", options["url"], [], {}),
+            # Persistent connections are for sync workers only (see README)
+            ("async", f"/async{options['url']}", ["-k", "uvicorn.workers.UvicornWorker", "core.asgi:application"], {"CONN_MAX_AGE": "0"}),
+        ]
+        self.stdout.write(f"{'mode':<8}{'status':>12}{'total s':>10}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for mode, url, arguments, environment in profiles:
+            with self.serve(options["port"], options["workers"], arguments, environment):
+                # Both runs start with the response cached, so they measure how
+                # requests are served, not a cold cache stampede
+                asyncio.run(self.request(options["port"], url, 0))
+                run = asyncio.run(self.run(options["port"], url, options["requests"], options["delay"]))
+            self.report(mode, run)
+
+    def serve(self, port, workers, arguments, environment):
+        command = [
+            sys.executable, "-m", "gunicorn", "-c", str(settings.BASE_DIR / "gunicorn.conf.py"),
+            "-w", str(workers), "-b", f"127.0.0.1:{port}", "--log-level", "warning", *arguments,
+        ]
+        server = subprocess.Popen(command, cwd=settings.BASE_DIR, env={**os.environ, **environment})
+        return Server(server, port)
+
+    async def run(self, port, url, requests, delay):
+        start = time.perf_counter()
+
+        async def request():
+            status = await self.request(port, url, delay)
+            return status, time.perf_counter() - start
+
+        results = await asyncio.gather(*(request() for _ in range(requests)))
+        return results, time.perf_counter() - start
+
+    async def request(self, port, url, delay):
+        """
+        Sends the request in two halves and reads the response in two parts,
+        waiting delay / 2 in between, like a client on a slow network.
+        Returns the response status, or "error" when the server refused or
+        dropped the connection.
+        """
+        message = (
+            f"GET {url} HTTP/1.1\r\nHost: {get_default_host()}\r\nAccept: application/json\r\n"
+            "X-Forwarded-Proto: https\r\nConnection: close\r\n\r\n"
+        ).encode()
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        except OSError:
+            return "error"
+        try:
+            writer.write(message[:len(message) // 2])
+            await writer.drain()
+            await asyncio.sleep(delay / 2)
+            writer.write(message[len(message) // 2:])
+            await writer.drain()
+            status_line = await reader.readline()
+            await asyncio.sleep(delay / 2)
+            await reader.read()
+        except OSError:
+            return "error"
+        finally:
+            writer.close()
+        return int(status_line.split()[1]) if status_line else "error"
+
+    def report(self, mode, run):
+        """
+        Latencies are counted from the start of the run, so they include the
+        time a request waits for a free worker
+        """
+        results, total = run
+        statuses = ",".join(sorted({str(status) for status, _duration in results}))
+        timings = sorted(duration * 1000 for _status, duration in results)
+        p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+        self.stdout.write(
+            f"{mode:<8}{statuses:>12}{total:>10.2f}{len(results) / total:>10.1f}{statistics.median(timings):>10.2f}{p95:>10.2f}"
+        )
+
+
+class Server:
+    """
+    Context manager of a started server process: waits until its port
+    accepts connections and stops it on exit
+    """
+    timeout = 30
+
+    def __init__(self, process, port):
+        self.process = process
+        self.port = port
+
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while time.monotonic() < deadline:
+            if self.process.poll() is not None:
+                raise CommandError(f"The server exited with code {self.process.returncode}")
+            try:
+                socket.create_connection(("127.0.0.1", self.port), timeout=1).close()
+                return self
+            except OSError:
+                time.sleep(0.1)
+        self.__exit__()
+        raise CommandError(f"The server didn't listen on port {self.port} after {self.timeout} seconds")
+
+    def __exit__(self, *args):
+        self.process.terminate()
+        try:
+            self.process.wait(self.timeout)
+        except subprocess.TimeoutExpired:
+            self.process.kill()
+            self.process.wait()
@@ -0,0 +1,43 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from portfolio.benchmark import QUERY_BUDGETS, get_benchmark_urls, get_template, measure
+from portfolio.factories import generate_portfolios
+
+
+class Command(BaseCommand):
+    help = "Measures latency, queries and bytes of every endpoint at several data sizes (the data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="5,20,80", help="Comma separated rows per developer of every run")
+        parser.add_argument("--developers", type=int, default=2, help="Developers of every run")
+        parser.add_argument("--repeat", type=int, default=10, help="Requests per endpoint")
+
+    def handle(self, *args, **options):
+        # Allows the test client host and keeps emails in memory
+        setup_test_environment()
+        try:
+            for size in [int(size) for size in options["sizes"].split(",")]:
+                with transaction.atomic():
+                    generate_portfolios(options["developers"], size)
+                    self.run(size, options["repeat"])
+                    transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+    def run(self, size, repeat):
+        client = Client()
+        self.stdout.write(f"\n{size} rows per developer")
+        self.stdout.write(f"{'endpoint':<90}{'status':>7}{'queries':>9}{'budget':>8}{'bytes':>10}{'p50 ms':>9}{'p95 ms':>9}")
+        for url in get_benchmark_urls():
+            result = measure(client, url, repeat)
+            budget = QUERY_BUDGETS.get(get_template(url), "-")
+            line = (
+                f"{url:<90}{result['status']:>7}{result['queries']:>9}{budget:>8}{result['bytes']:>10}"
+                f"{result['p50']:>9.2f}{result['p95']:>9.2f}"
+            )
+            if budget != "-" and result["queries"] > budget:
+                line = self.style.ERROR(f"{line}  over budget")
+            self.stdout.write(line)
@@ -0,0 +1,66 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from rest_framework.renderers import JSONRenderer
+
+from portfolio.factories import create_portfolio
+from portfolio.mixins import optimize_queryset
+from portfolio.models import Experience, Project
+from portfolio.renderers import FastJSONRenderer, orjson
+from portfolio.serializers import ExperienceSerializer, ProjectSerializer, parse_field_tree
+
+
+PAYLOADS = [
+    (
+        "project",
+        Project,
+        ProjectSerializer,
+        "developer,category,languages,project_images,repository,extLink",
+    ),
+    (
+        "experience",
+        Experience,
+        ExperienceSerializer,
+        "developer,project.developer,project.category,project.languages,project.project_images,project.repository,project.extLink,repository,extLink",
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = "Compares JSONRenderer and FastJSONRenderer on seeded nested payloads (the data is rolled back)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type=int, default=200, help="Rows of every model to seed")
+        parser.add_argument("--repeat", type=int, default=20, help="Renders per renderer and payload")
+
+    def handle(self, *args, **options):
+        if orjson is None:
+            self.stdout.write("orjson isn't installed, FastJSONRenderer falls back to the standard library")
+
+        with transaction.atomic():
+            create_portfolio(options["rows"])
+            payloads = []
+            for name, model, serializer_class, expand in PAYLOADS:
+                serializer = serializer_class(expand=parse_field_tree(expand))
+                queryset = optimize_queryset(model.objects.order_by("pk"), serializer)
+                data = serializer_class(queryset, many=True, expand=parse_field_tree(expand)).data
+                payloads.append((name, data))
+            transaction.set_rollback(True)
+
+        self.stdout.write(f"{'payload':<12}{'renderer':<20}{'bytes':>10}{'p50 ms':>10}{'p95 ms':>10}")
+        for name, data in payloads:
+            for renderer in (JSONRenderer(), FastJSONRenderer()):
+                timings = []
+                for _ in range(options["repeat"]):
+                    start = time.perf_counter()
+                    content = renderer.render(data)
+                    timings.append((time.perf_counter() - start) * 1000)
+                timings.sort()
+                p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+                self.stdout.write(
+                    f"{name:<12}{type(renderer).__name__:<20}{len(content):>10}"
+                    f"{statistics.median(timings):>10.2f}{p95:>10.2f}"
+                )
@@ -0,0 +1,41 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.http.request import validate_host
+
+from portfolio.export import StaticExport
+
+
+API_HOST = "api.manuelferrero.com.ar"
+
+
+def get_allowed_hosts():
+    # Same fallback as HttpRequest.get_host
+    if settings.DEBUG and not settings.ALLOWED_HOSTS:
+        return [".localhost", "127.0.0.1", "[::1]"]
+    return settings.ALLOWED_HOSTS
+
+
+def get_default_host():
+    """
+    Returns the API host if it's allowed, otherwise the first plain host of
+    ALLOWED_HOSTS, so the exported requests pass the host validation
+    """
+    allowed = get_allowed_hosts()
+    if validate_host(API_HOST, allowed):
+        return API_HOST
+    return next((host.lstrip(".") for host in allowed if host != "*" and validate_host(host.lstrip("."), allowed)), API_HOST)
+
+
+class Command(BaseCommand):
+    help = "Renders the public portfolio endpoints to JSON files (with gzip/Brotli copies and a manifest) to be served by a CDN"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--output", default=settings.BASE_DIR / "static_api", help="Directory of the exported files")
+        parser.add_argument("--host", default=get_default_host(), help="Host used to build the absolute URLs (one of ALLOWED_HOSTS)")
+        parser.add_argument("--force", action="store_true", help="Render and write every endpoint even if it didn't change")
+
+    def handle(self, *args, **options):
+        if not validate_host(options["host"], get_allowed_hosts()):
+            raise CommandError(f"{options['host']} is not in ALLOWED_HOSTS")
+        stats = StaticExport(options["output"], options["host"], force=options["force"]).export()
+        self.stdout.write(", ".join(f"{count} {name}" for name, count in stats.items()))
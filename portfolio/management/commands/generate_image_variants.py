@@ -0,0 +1,24 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.cache import bump_version
+from portfolio.images import IMAGE_FIELDS, update_image
+
+
+class Command(BaseCommand):
+    help = "Generates the resized variants and placeholders of the images already uploaded"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Process the images even if they didn't change",
+        )
+
+    def handle(self, *args, **options):
+        for model, fields in IMAGE_FIELDS.items():
+            updated = 0
+            for instance in model._default_manager.order_by("pk").iterator():
+                updated += any([update_image(instance, field, force=options["force"]) for field in fields])
+            if updated:
+                bump_version(model)
+            self.stdout.write(f"{model.__name__}: {updated} updated")
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from portfolio.factories import generate_portfolios
+
+
+class Command(BaseCommand):
+    help = "Creates synthetic developers with proportional related rows (for benchmarks and local testing)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--developers", type=int, default=1, help="Developers to create")
+        parser.add_argument("--rows", type=int, default=20, help="Rows of every related model per developer")
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the random values")
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            developers = generate_portfolios(options["developers"], options["rows"], options["seed"])
+        self.stdout.write(f"{len(developers)} developers created")
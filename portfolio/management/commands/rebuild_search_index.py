@@ -0,0 +1,10 @@
+from django.core.management.base import BaseCommand
+
+from portfolio.search import rebuild_index
+
+
+class Command(BaseCommand):
+    help = "Indexes again every project, work experience and education on the full-text search table"
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{rebuild_index()} indexed")
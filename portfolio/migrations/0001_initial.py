@@ -0,0 +1,252 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:21
+
+import django.core.validators
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Developer',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('firstName', models.CharField(max_length=30, verbose_name='Nombre/s')),
+                ('lastName', models.CharField(max_length=30, verbose_name='Apellido/s')),
+                ('openToWork', models.BooleanField(default=True, verbose_name='¿Buscando trabajo?')),
+                ('jobTitle', models.CharField(max_length=60, verbose_name='Título de trabajo')),
+                ('phone', models.CharField(max_length=13, verbose_name='Teléfono')),
+                ('email', models.EmailField(max_length=254, verbose_name='Email')),
+                ('residence', models.CharField(help_text='Ej.: Ciudad, Provincia - País', max_length=120, verbose_name='Residencia')),
+                ('photo', models.ImageField(help_text='Preferentemente imagen con fondo transparente', upload_to='img/about/', verbose_name='Foto')),
+                ('about', models.TextField(verbose_name='Carta de presentación')),
+                ('aboutShort', models.TextField(verbose_name='Presentación corta')),
+                ('cvEsp', models.FileField(upload_to='files/cv/', verbose_name='CV en español')),
+                ('cvEng', models.FileField(upload_to='files/cv/', verbose_name='CV en inglés')),
+            ],
+            options={
+                'verbose_name': 'Información personal',
+                'verbose_name_plural': 'Información personal',
+            },
+        ),
+        migrations.CreateModel(
+            name='ExtLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Nombre')),
+                ('link', models.URLField(verbose_name='Link')),
+            ],
+            options={
+                'verbose_name': 'Link externo',
+                'verbose_name_plural': 'Links externos',
+            },
+        ),
+        migrations.CreateModel(
+            name='Project',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Nombre')),
+                ('client', models.CharField(max_length=60, verbose_name='Cliente/s')),
+                ('startDate', models.DateField(verbose_name='Fecha inicio')),
+                ('description', models.TextField(verbose_name='Descripción')),
+                ('status', models.CharField(choices=[('DEV', 'En desarrollo'), ('PRO', 'En producción'), ('PAU', 'Pausado'), ('CAN', 'Cancelado')], max_length=255, verbose_name='Estado')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+            ],
+            options={
+                'verbose_name': 'Proyecto',
+                'verbose_name_plural': 'Proyectos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectCategory',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Categoría')),
+            ],
+            options={
+                'verbose_name': 'Categoría de proyectos',
+                'verbose_name_plural': 'Categorías de proyectos',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectLanguage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Lenguaje')),
+            ],
+            options={
+                'verbose_name': 'Lenguaje de proyectos',
+                'verbose_name_plural': 'Lenguajes de proyectos',
+            },
+        ),
+        migrations.CreateModel(
+            name='Repository',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Nombre')),
+                ('link', models.URLField(verbose_name='Link')),
+                ('readmeLink', models.URLField(verbose_name='Link a README.md')),
+            ],
+            options={
+                'verbose_name': 'Repositorio',
+                'verbose_name_plural': 'Repositorios',
+            },
+        ),
+        migrations.CreateModel(
+            name='Title',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Título')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='title', to='portfolio.developer', verbose_name='Desarrollador')),
+            ],
+            options={
+                'verbose_name': 'Título',
+                'verbose_name_plural': 'Títulos',
+            },
+        ),
+        migrations.CreateModel(
+            name='SocialLink',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Nombre')),
+                ('icon', models.CharField(max_length=120, verbose_name='Ícono')),
+                ('link', models.URLField(verbose_name='Link')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='social_link', to='portfolio.developer', verbose_name='Desarrollador')),
+            ],
+            options={
+                'verbose_name': 'Social link',
+                'verbose_name_plural': 'Social links',
+            },
+        ),
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Habilidad')),
+                ('proficiency', models.PositiveIntegerField(help_text='Entre 1 y 100', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='Competencia')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill', to='portfolio.developer', verbose_name='Desarrollador')),
+            ],
+            options={
+                'verbose_name': 'Habilidad',
+                'verbose_name_plural': 'Habilidades',
+            },
+        ),
+        migrations.CreateModel(
+            name='ProjectImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(default='img/projects/unavailable.jpg', upload_to='img/projects/', verbose_name='Imagen')),
+                ('altText', models.CharField(max_length=30, verbose_name='Texto alternativo')),
+                ('isFeature', models.BooleanField(default=False, verbose_name='Portada de proyecto?')),
+                ('project', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project_images', to='portfolio.project', verbose_name='Proyecto')),
+            ],
+            options={
+                'verbose_name': 'Imagen de proyecto',
+                'verbose_name_plural': 'Imágenes de proyecto',
+            },
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='category',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.RESTRICT, related_name='category', to='portfolio.projectcategory', verbose_name='Categoría'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='developer',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='project', to='portfolio.developer', verbose_name='Desarrollador'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='extLink',
+            field=models.ManyToManyField(blank=True, related_name='project_external_links', to='portfolio.extlink', verbose_name='Links externos'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='languages',
+            field=models.ManyToManyField(related_name='project_languages', to='portfolio.projectlanguage', verbose_name='Lenguajes utilizados'),
+        ),
+        migrations.AddField(
+            model_name='project',
+            name='repository',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='repository', to='portfolio.repository', verbose_name='Repositorio'),
+        ),
+        migrations.CreateModel(
+            name='Language',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Idioma')),
+                ('proficiency', models.PositiveIntegerField(help_text='Entre 1 y 100', validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(100)], verbose_name='Competencia')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='language', to='portfolio.developer', verbose_name='Desarrollador')),
+            ],
+            options={
+                'verbose_name': 'Idioma',
+                'verbose_name_plural': 'Idiomas',
+            },
+        ),
+        migrations.CreateModel(
+            name='Framework',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=30, verbose_name='Framework/Librería')),
+                ('icon', models.CharField(max_length=120, verbose_name='Ícono HTML')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='framework', to='portfolio.skill', verbose_name='Habilidad')),
+            ],
+            options={
+                'verbose_name': 'Framework',
+                'verbose_name_plural': 'Frameworks',
+            },
+        ),
+        migrations.CreateModel(
+            name='Experience',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=60, verbose_name='Título')),
+                ('company', models.CharField(max_length=60, verbose_name='Compañía')),
+                ('place', models.CharField(help_text='Ej.: Ciudad, Provincia - País', max_length=120, verbose_name='Ubicación')),
+                ('startDate', models.DateField(verbose_name='Fecha inicio')),
+                ('finishDate', models.DateField(blank=True, help_text='Opcional', null=True, verbose_name='Fecha final')),
+                ('isPresent', models.BooleanField(default=False, verbose_name='Trabajando actualmente')),
+                ('description', models.TextField(verbose_name='Descripción')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='experience', to='portfolio.developer', verbose_name='Desarrollador')),
+                ('extLink', models.ManyToManyField(blank=True, related_name='experience_external_links', to='portfolio.extlink', verbose_name='Links externos')),
+                ('project', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='portfolio.project')),
+                ('repository', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to='portfolio.repository')),
+            ],
+            options={
+                'verbose_name': 'Experiencia laboral',
+                'verbose_name_plural': 'Experiencias laborales',
+            },
+        ),
+        migrations.CreateModel(
+            name='Education',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=120, verbose_name='Título')),
+                ('place', models.CharField(max_length=120, verbose_name='Institución')),
+                ('link', models.CharField(blank=True, help_text='Opcional', max_length=120, null=True, verbose_name='Link')),
+                ('startDate', models.DateField(verbose_name='Fecha inicio')),
+                ('finishDate', models.DateField(blank=True, help_text='Opcional', null=True, verbose_name='Fecha final')),
+                ('isPresent', models.BooleanField(default=False, verbose_name='Cursando actualmente')),
+                ('description', models.TextField(verbose_name='Descripción')),
+                ('certificate', models.FileField(blank=True, help_text='Opcional', null=True, upload_to='files/certificates/', verbose_name='Certificado')),
+                ('isActive', models.BooleanField(default=True, verbose_name='¿Activo?')),
+                ('developer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='education', to='portfolio.developer', verbose_name='Desarrollador')),
+                ('repository', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='edu_repo', to='portfolio.repository', verbose_name='Repositorio')),
+            ],
+            options={
+                'verbose_name': 'Educación',
+                'verbose_name_plural': 'Educación',
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='developer',
+            name='photoVariants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Variantes de la foto'),
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='imageVariants',
+            field=models.JSONField(blank=True, default=dict, editable=False, verbose_name='Variantes de la imagen'),
+        ),
+    ]
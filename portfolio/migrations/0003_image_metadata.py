@@ -0,0 +1,53 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0002_image_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='developer',
+            name='photoPlaceholder',
+            field=models.TextField(blank=True, editable=False, verbose_name='Previsualización de la foto'),
+        ),
+        migrations.AddField(
+            model_name='developer',
+            name='photoColor',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Color de la foto'),
+        ),
+        migrations.AddField(
+            model_name='developer',
+            name='photoWidth',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ancho de la foto'),
+        ),
+        migrations.AddField(
+            model_name='developer',
+            name='photoHeight',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Alto de la foto'),
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='imagePlaceholder',
+            field=models.TextField(blank=True, editable=False, verbose_name='Previsualización de la imagen'),
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='imageColor',
+            field=models.CharField(blank=True, editable=False, max_length=7, verbose_name='Color de la imagen'),
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='imageWidth',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Ancho de la imagen'),
+        ),
+        migrations.AddField(
+            model_name='projectimage',
+            name='imageHeight',
+            field=models.PositiveIntegerField(blank=True, editable=False, null=True, verbose_name='Alto de la imagen'),
+        ),
+    ]
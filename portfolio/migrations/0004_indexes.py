@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-18 13:21
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0003_image_metadata'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='projectimage',
+            name='project',
+            field=models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='project_images', to='portfolio.project', verbose_name='Proyecto'),
+        ),
+        migrations.AddIndex(
+            model_name='education',
+            index=models.Index(condition=models.Q(('isActive', True)), fields=['-finishDate'], name='portfolio_education_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='experience',
+            index=models.Index(condition=models.Q(('isActive', True)), fields=['-startDate', '-finishDate'], name='portfolio_exp_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='language',
+            index=models.Index(condition=models.Q(('isActive', True)), fields=['-proficiency'], name='portfolio_language_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(condition=models.Q(('isActive', True)), fields=['startDate'], name='portfolio_project_active_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'startDate'], name='portfolio_project_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='projectimage',
+            index=models.Index(fields=['project', '-isFeature'], name='portfolio_image_feature_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('isActive', True)), fields=['-proficiency'], name='portfolio_skill_active_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+from django.db import migrations
+
+
+# The rowid of every row is pk * 4 + the kind code of portfolio.search
+CREATE_SEARCH_TABLE = """
+CREATE VIRTUAL TABLE portfolio_search USING fts5(
+    title, subtitle, body, tags,
+    tokenize = 'unicode61 remove_diacritics 2'
+)
+"""
+
+POPULATE_SEARCH_TABLE = [
+    """
+INSERT INTO portfolio_search (rowid, title, subtitle, body, tags)
+SELECT project.id * 4 + 1, project.title, project.client, project.description, (
+    SELECT coalesce(group_concat(language.title, ' '), '')
+    FROM portfolio_project_languages AS project_language
+    JOIN portfolio_projectlanguage AS language ON language.id = project_language.projectlanguage_id
+    WHERE project_language.project_id = project.id
+)
+FROM portfolio_project AS project WHERE project.isActive
+    """,
+    """
+INSERT INTO portfolio_search (rowid, title, subtitle, body, tags)
+SELECT id * 4 + 2, title, company, description, '' FROM portfolio_experience WHERE isActive
+    """,
+    """
+INSERT INTO portfolio_search (rowid, title, subtitle, body, tags)
+SELECT id * 4 + 3, title, place, description, '' FROM portfolio_education WHERE isActive
+    """,
+]
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0004_indexes'),
+    ]
+
+    operations = [
+        migrations.RunSQL(CREATE_SEARCH_TABLE, "DROP TABLE portfolio_search"),
+        migrations.RunSQL(POPULATE_SEARCH_TABLE, migrations.RunSQL.noop),
+    ]
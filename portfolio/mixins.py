@@ -0,0 +1,581 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.db.models import CharField, Count, F, Prefetch, Value
+from django.db.models.functions import Cast
+from django.db.models.signals import m2m_changed, post_save
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+
+from rest_framework import serializers, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.response import Response
+
+from core.metrics import record_cache
+from portfolio.cache import RESPONSE_KEY, bump_version, defer_invalidation, get_serializer_models, get_versions, get_versions_digest
+from portfolio.renderers import SideloadJSONRenderer
+from portfolio.serializers import parse_field_tree
+
+
+def referenced_ids(rows, *fields):
+    """
+    Returns the primary keys referenced by fields on the serialized rows
+    """
+    ids = set()
+    for row in rows:
+        for field in fields:
+            value = row.get(field)
+            if isinstance(value, list):
+                ids.update(value)
+            elif value is not None:
+                ids.add(value)
+    return ids
+
+
+def get_related_lookups(serializer, prefix=""):
+    """
+    Walks the fields of a serializer and returns the select_related and
+    prefetch_related lookups needed to render it without extra queries.
+
+    Nested serializers for a single object are joined with select_related,
+    nested serializers with many=True become Prefetch objects whose queryset
+    is optimized for the child serializer too. The child serializer can set
+    `related_filter` (dict) and `related_ordering` (tuple) on its Meta to
+    filter and order the prefetched rows.
+    """
+    select = []
+    prefetch = []
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*" or "." in field.source:
+            continue
+        lookup = f"{prefix}{field.source}"
+        if isinstance(field, serializers.ListSerializer):
+            prefetch.append(Prefetch(lookup, queryset=get_related_queryset(field.child)))
+        elif isinstance(field, serializers.BaseSerializer):
+            select.append(lookup)
+            nested_select, nested_prefetch = get_related_lookups(field, f"{lookup}__")
+            select += nested_select
+            prefetch += nested_prefetch
+        elif isinstance(field, serializers.ManyRelatedField):
+            prefetch.append(lookup)
+    return select, prefetch
+
+
+def get_related_queryset(serializer):
+    """
+    Returns the queryset used to prefetch the rows of a nested serializer
+    """
+    meta = serializer.Meta
+    queryset = meta.model._default_manager.filter(**getattr(meta, "related_filter", {}))
+    ordering = getattr(meta, "related_ordering", None)
+    if ordering:
+        queryset = queryset.order_by(*ordering)
+    return optimize_queryset(queryset, serializer)
+
+
+def optimize_queryset(queryset, serializer):
+    """
+    Applies to queryset the related lookups needed by serializer
+    """
+    select, prefetch = get_related_lookups(serializer)
+    if select:
+        queryset = queryset.select_related(*select)
+    if prefetch:
+        queryset = queryset.prefetch_related(*prefetch)
+    return queryset
+
+
+class DynamicFieldsMixin:
+    """
+    Passes the `fields` and `expand` query params of read requests to the
+    serializer (see DynamicFieldsModelSerializer)
+    """
+
+    def get_serializer(self, *args, **kwargs):
+        if self.request.method in SAFE_METHODS:
+            kwargs.setdefault("fields", parse_field_tree(self.request.query_params.get("fields")))
+            kwargs.setdefault("expand", parse_field_tree(self.request.query_params.get("expand")))
+        return super().get_serializer(*args, **kwargs)
+
+
+class SideloadMixin:
+    """
+    Adds the sideload format (see SideloadJSONRenderer): rows are rendered
+    with related objects as primary keys, and every related object reachable
+    through Meta.expandable_fields is rendered once on `included`, grouped by
+    model name. Serialization work grows with the distinct related objects
+    instead of rows * nesting depth.
+    """
+
+    def get_renderers(self):
+        return super().get_renderers() + [SideloadJSONRenderer()]
+
+    def is_sideloaded(self):
+        renderer = getattr(self.request, "accepted_renderer", None)
+        return renderer is not None and renderer.format == SideloadJSONRenderer.format
+
+    def get_serializer(self, *args, **kwargs):
+        if self.is_sideloaded():
+            # Relations stay primary keys: dotted `fields` would expand
+            # their parent, so only the top level names are kept
+            fields = parse_field_tree(self.request.query_params.get("fields"))
+            kwargs["fields"] = {name: {} for name in fields}
+            kwargs["expand"] = {}
+        return super().get_serializer(*args, **kwargs)
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if self.is_sideloaded():
+            if isinstance(response.data, dict):
+                response.data["included"] = self.get_included(response.data["results"])
+            else:
+                response.data = {"results": response.data, "included": self.get_included(response.data)}
+        return response
+
+    def retrieve(self, request, *args, **kwargs):
+        response = super().retrieve(request, *args, **kwargs)
+        if self.is_sideloaded():
+            response.data = {"result": response.data, "included": self.get_included([response.data])}
+        return response
+
+    def get_included(self, rows):
+        context = self.get_serializer_context()
+        included = {}
+        pending = [(self.get_serializer_class(), rows)]
+        while pending:
+            serializer_class, rows = pending.pop()
+            for name, related_class in getattr(serializer_class.Meta, "expandable_fields", {}).items():
+                if isinstance(related_class, tuple):
+                    related_class = related_class[0]
+                model = related_class.Meta.model
+                objects = included.setdefault(model._meta.model_name, {})
+                ids = referenced_ids(rows, name) - objects.keys()
+                if not ids:
+                    continue
+                serializer = related_class(context=context)
+                queryset = optimize_queryset(model._default_manager.filter(pk__in=ids).order_by("pk"), serializer)
+                related_rows = related_class(queryset, many=True, context=context).data
+                objects.update((row["id"], row) for row in related_rows)
+                pending.append((related_class, related_rows))
+        return {name: list(objects.values()) for name, objects in sorted(included.items()) if objects}
+
+
+class FacetMixin:
+    """
+    Adds facet counts to lists requested with `?facets=true`: the number of
+    rows of the (filtered) list per value of every facet_fields lookup
+    ({name: lookup}), eg.: {"status": {"DEV": 2, "PRO": 5}, "category": {"3": 7}}.
+
+    Every facet is a GROUP BY on the filtered queryset and all of them are
+    fetched with one UNION ALL query.
+    """
+    facet_fields = {}
+    facets_query_param = "facets"
+
+    def is_faceted(self):
+        return bool(self.facet_fields) and self.request.query_params.get(self.facets_query_param) in ("1", "true")
+
+    def list(self, request, *args, **kwargs):
+        response = super().list(request, *args, **kwargs)
+        if self.is_faceted() and isinstance(response, Response):
+            facets = self.get_facets(self.filter_queryset(self.get_queryset()))
+            if isinstance(response.data, dict):
+                response.data["facets"] = facets
+            else:
+                response.data = {"results": response.data, "facets": facets}
+        return response
+
+    def get_facets(self, queryset):
+        queryset = queryset.order_by().select_related(None).prefetch_related(None)
+        queries = [
+            queryset.values(facet=Value(name), value=Cast(F(lookup), CharField())).annotate(count=Count("pk", distinct=True))
+            for name, lookup in self.facet_fields.items()
+        ]
+        facets = {name: {} for name in self.facet_fields}
+        for row in queries[0].union(*queries[1:], all=True):
+            if row["value"] is not None:
+                facets[row["facet"]][row["value"]] = row["count"]
+        return facets
+
+
+class OptimizedQuerysetMixin:
+    """
+    Makes the queries of a generic view follow the serializer tree, so the
+    number of queries per request doesn't grow with the number of rows and
+    relations which aren't rendered are never joined
+    """
+
+    def get_queryset(self):
+        return optimize_queryset(super().get_queryset(), self.get_serializer())
+
+
+class VersionedResponseMixin:
+    """
+    Base for the mixins which identify a response by the version of the
+    models rendered by the serializer (see portfolio.signals)
+    """
+    cache_formats = ("json", "sideload")
+
+    def get_versions(self):
+        if not hasattr(self, "_versions"):
+            self._versions = get_versions(get_serializer_models(self.get_serializer_class()))
+        return self._versions
+
+    def get_response_digest(self, request):
+        """
+        Returns a digest which changes whenever the rendered body would change
+        """
+        request_key = f"{request.accepted_renderer.format}:{request.build_absolute_uri()}:{get_versions_digest(self.get_versions())}"
+        return hashlib.sha1(request_key.encode()).hexdigest()
+
+    def is_versioned(self, request):
+        """
+        Only the formats listed in `cache_formats` are identified by version,
+        the browsable API depends on the user and is always rendered
+        """
+        return request.accepted_renderer.format in self.cache_formats
+
+
+class CachedResponseMixin(VersionedResponseMixin):
+    """
+    Caches the rendered body of GET requests.
+
+    Cache keys contain the version of every model rendered by the serializer,
+    so any change on them makes the view render again.
+    """
+
+    def get_cache_key(self, request):
+        model = self.get_serializer_class().Meta.model
+        return RESPONSE_KEY.format(model._meta.model_name, self.get_response_digest(request))
+
+    def get(self, request, *args, **kwargs):
+        if not self.is_versioned(request):
+            return super().get(request, *args, **kwargs)
+
+        key = self.get_cache_key(request)
+        cached = cache.get(key)
+        record_cache("response", cached is not None)
+        if cached is not None:
+            content, content_type = cached
+            return HttpResponse(content, content_type=content_type)
+
+        def store(response):
+            cache.set(key, (response.content, response["Content-Type"]), settings.PORTFOLIO_CACHE_TIMEOUT)
+
+        response = super().get(request, *args, **kwargs)
+        if response.status_code == 200 and isinstance(response, Response):
+            response.add_post_render_callback(store)
+        return response
+
+
+class ConditionalGetMixin(VersionedResponseMixin):
+    """
+    Adds ETag and Last-Modified headers to GET responses and answers
+    If-None-Match/If-Modified-Since with a 304 without serializing the body
+    """
+
+    def get(self, request, *args, **kwargs):
+        if not self.is_versioned(request):
+            return super().get(request, *args, **kwargs)
+
+        etag = quote_etag(self.get_response_digest(request))
+        last_modified = max(self.get_versions().values()) // 10 ** 9
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            response["Last-Modified"] = http_date(last_modified)
+            patch_cache_control(response, no_cache=True)
+        return response
+
+
+class ServerTimingMixin:
+    """
+    Records on the request Server-Timing (see core.middleware) the time of
+    the view, mostly serialization (the database time of the queries it runs
+    is subtracted, it's reported apart), and the time of rendering
+    """
+
+    def initial(self, request, *args, **kwargs):
+        timing = getattr(request, "server_timing", None)
+        if timing is not None:
+            self.timing_start = (time.perf_counter(), timing.db)
+        super().initial(request, *args, **kwargs)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        timing = getattr(request, "server_timing", None)
+        if timing is None or not hasattr(self, "timing_start"):
+            return response
+
+        start, db = self.timing_start
+        timing.add("serialize", (time.perf_counter() - start) * 1000 - (timing.db - db))
+        if isinstance(response, Response):
+            render_start = time.perf_counter()
+            response.add_post_render_callback(
+                lambda rendered: timing.add("render", (time.perf_counter() - render_start) * 1000)
+            )
+        return response
+
+
+class StreamingListMixin:
+    """
+    Streams unpaginated JSON lists when requested with `?stream=true`.
+
+    Rows are read with queryset.iterator() (prefetching per chunk) and
+    rendered one by one, so peak memory doesn't grow with the list size.
+    """
+    stream_query_param = "stream"
+    stream_chunk_size = 100
+
+    def is_streamed(self, request):
+        return (
+            request.query_params.get(self.stream_query_param) in ("1", "true")
+            and request.accepted_renderer.format == "json"
+        )
+
+    def list(self, request, *args, **kwargs):
+        if not self.is_streamed(request):
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        serializer = self.get_serializer(many=True).child
+        renderer = request.accepted_renderer
+
+        def stream():
+            separator = b"["
+            for instance in queryset.iterator(chunk_size=self.stream_chunk_size):
+                yield separator + renderer.render(serializer.to_representation(instance))
+                separator = b","
+            yield b"[]" if separator == b"[" else b"]"
+
+        return StreamingHttpResponse(stream(), content_type=renderer.media_type)
+
+
+class BulkMixin:
+    """
+    Bulk variants of the list endpoints, with a list as body:
+
+    - POST [{...}, ...] creates the objects
+    - PUT/PATCH [{"id": ..., ...}, ...] updates them (PATCH only the sent fields)
+    - DELETE [id, ...] deletes them
+
+    The whole batch is validated first and then applied in one transaction
+    with bulk_create/bulk_update, bumping the versions once at the end. Any
+    invalid item rejects the batch (400, with the errors of each item by
+    index) unless `?mode=partial` is sent: then the valid items are applied
+    and the errors are reported with them.
+    """
+    bulk_max_items = 500
+
+    def post(self, request, *args, **kwargs):
+        if not isinstance(request.data, list):
+            return super().post(request, *args, **kwargs)
+        return self.bulk_create(request)
+
+    def put(self, request, *args, **kwargs):
+        return self.bulk_update(request)
+
+    def patch(self, request, *args, **kwargs):
+        return self.bulk_update(request, partial=True)
+
+    def delete(self, request, *args, **kwargs):
+        return self.bulk_destroy(request)
+
+    def get_bulk_model(self):
+        return self.get_serializer_class().Meta.model
+
+    def get_bulk_items(self, request):
+        items = request.data
+        if not isinstance(items, list):
+            raise ValidationError({"non_field_errors": ["Se esperaba una lista"]})
+        if len(items) > self.bulk_max_items:
+            raise ValidationError({"non_field_errors": [f"No se pueden procesar más de {self.bulk_max_items} elementos"]})
+        return items
+
+    def is_partial_batch(self, request):
+        return request.query_params.get("mode") == "partial"
+
+    def to_pk(self, value):
+        """
+        Returns value as a primary key of the model, None if it isn't valid
+        """
+        try:
+            return self.get_bulk_model()._meta.pk.to_python(value)
+        except (DjangoValidationError, TypeError):
+            return None
+
+    def get_bulk_instances(self, pks):
+        """
+        Returns {pk: instance} of the pks which are rows of the list, so eg.
+        /project/dev can't change or delete the projects it doesn't list
+        """
+        return self.get_queryset().in_bulk([pk for pk in pks if pk is not None])
+
+    def bulk_response(self, request, results, errors, status_code):
+        if not self.is_partial_batch(request):
+            return Response(results, status=status_code)
+        if errors and not results:
+            status_code = status.HTTP_400_BAD_REQUEST
+        return Response({"results": results, "errors": errors}, status=status_code)
+
+    def serialize_batch(self, instances):
+        """
+        Serializes the batch read again with the queryset optimizations of
+        the view, so relations don't cost a query per row
+        """
+        if not instances:
+            return []
+        queryset = optimize_queryset(self.get_bulk_model()._default_manager.all(), self.get_serializer())
+        rows = queryset.in_bulk([instance.pk for instance in instances])
+        return self.get_serializer([rows[instance.pk] for instance in instances], many=True).data
+
+    def is_rejected(self, request, errors):
+        return bool(errors) and not self.is_partial_batch(request)
+
+    def reject(self, errors):
+        return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+    def validate_batch(self, serializers):
+        """
+        Validates (index, serializer) pairs, returns the valid serializers and
+        the errors by index
+        """
+        valid, errors = [], []
+        for index, serializer in serializers:
+            if serializer.is_valid():
+                valid.append(serializer)
+            else:
+                errors.append({"index": index, "errors": serializer.errors})
+        return valid, errors
+
+    def bulk_create(self, request):
+        items = self.get_bulk_items(request)
+        valid, errors = self.validate_batch([(index, self.get_serializer(data=item)) for index, item in enumerate(items)])
+        if self.is_rejected(request, errors):
+            return self.reject(errors)
+        model = self.get_bulk_model()
+        with defer_invalidation(), transaction.atomic():
+            instances = [model(**self.split_many_to_many(model, serializer.validated_data)[0]) for serializer in valid]
+            model._default_manager.bulk_create(instances)
+            self.set_many_to_many(model, instances, [serializer.validated_data for serializer in valid])
+            self.send_post_save(model, instances, created=True)
+        return self.bulk_response(request, self.serialize_batch(instances), errors, status.HTTP_201_CREATED)
+
+    def bulk_update(self, request, partial=False):
+        items = self.get_bulk_items(request)
+        pks = [self.to_pk(item.get("id")) if isinstance(item, dict) else None for item in items]
+        instances = self.get_bulk_instances(pks)
+        serializers, missing = [], []
+        for index, (pk, item) in enumerate(zip(pks, items)):
+            if pk in instances:
+                serializers.append((index, self.get_serializer(instances[pk], data=item, partial=partial)))
+            else:
+                missing.append({"index": index, "errors": {"id": ["No encontrado."]}})
+        valid, errors = self.validate_batch(serializers)
+        errors = sorted(missing + errors, key=lambda error: error["index"])
+        if self.is_rejected(request, errors):
+            return self.reject(errors)
+
+        model = self.get_bulk_model()
+        updated = []
+        with defer_invalidation(), transaction.atomic():
+            fields = set()
+            for serializer in valid:
+                values, _related = self.split_many_to_many(model, serializer.validated_data)
+                for name, value in values.items():
+                    setattr(serializer.instance, name, value)
+                fields.update(values)
+                updated.append(serializer.instance)
+            if fields:
+                model._default_manager.bulk_update(updated, fields)
+            self.set_many_to_many(model, updated, [serializer.validated_data for serializer in valid], clear=True)
+            self.send_post_save(model, updated, created=False)
+        return self.bulk_response(request, self.serialize_batch(updated), errors, status.HTTP_200_OK)
+
+    def bulk_destroy(self, request):
+        pks = [self.to_pk(value) for value in self.get_bulk_items(request)]
+        instances = self.get_bulk_instances(pks)
+        errors = [{"index": index, "errors": {"id": ["No encontrado."]}} for index, pk in enumerate(pks) if pk not in instances]
+        if self.is_rejected(request, errors):
+            return self.reject(errors)
+        # QuerySet.delete() sends the delete signals of every row
+        with defer_invalidation(), transaction.atomic():
+            self.get_bulk_model()._default_manager.filter(pk__in=instances).delete()
+        if not self.is_partial_batch(request):
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return self.bulk_response(request, sorted(instances), errors, status.HTTP_200_OK)
+
+    @staticmethod
+    def split_many_to_many(model, validated_data):
+        """
+        Returns the validated data of the columns and of the many to many
+        fields apart
+        """
+        related = {field.name for field in model._meta.many_to_many}
+        values = {name: value for name, value in validated_data.items() if name not in related}
+        return values, {name: value for name, value in validated_data.items() if name in related}
+
+    def set_many_to_many(self, model, instances, validated_data, clear=False):
+        """
+        Sets the many to many fields of a batch with one insert per field
+        (and one delete of the previous rows when clear is set). The
+        m2m_changed signals of every row are sent as by clear() and add(),
+        so their receivers (eg.: the search index) see the changes.
+        """
+        for field in model._meta.many_to_many:
+            batch = [(instance, data[field.name]) for instance, data in zip(instances, validated_data) if field.name in data]
+            if not batch:
+                continue
+            through = field.remote_field.through
+            source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+            # As clear() and add(), the rows prefetched by the view are dropped
+            for instance, _related in batch:
+                getattr(instance, "_prefetched_objects_cache", {}).pop(field.name, None)
+            if clear:
+                self.send_m2m_changed(field, batch, "pre_clear")
+                through._default_manager.filter(**{f"{source}__in": [instance for instance, _related in batch]}).delete()
+                self.send_m2m_changed(field, batch, "post_clear")
+            self.send_m2m_changed(field, batch, "pre_add")
+            through._default_manager.bulk_create(
+                [through(**{f"{source}_id": instance.pk, f"{target}_id": related.pk}) for instance, values in batch for related in values],
+                ignore_conflicts=True,
+            )
+            self.send_m2m_changed(field, batch, "post_add")
+            bump_version(field.related_model)
+
+    @staticmethod
+    def send_m2m_changed(field, batch, action):
+        for instance, related in batch:
+            if action.endswith("_add") and not related:
+                continue
+            pk_set = None if action.endswith("_clear") else {value.pk for value in related}
+            m2m_changed.send(
+                sender=field.remote_field.through,
+                action=action,
+                instance=instance,
+                reverse=False,
+                model=field.related_model,
+                pk_set=pk_set,
+                using=instance._state.db,
+            )
+
+    def send_post_save(self, model, instances, created):
+        """
+        bulk_create/bulk_update send no signals: post_save is sent for every
+        row after the batch, so the image variants and the search index are
+        updated as on single saves
+        """
+        for instance in instances:
+            post_save.send(sender=model, instance=instance, created=created, update_fields=None, raw=False, using=instance._state.db)
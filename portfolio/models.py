@@ -24,6 +24,11 @@ class Developer(models.Model):
     residence: City, State - Country
     photo: Photo without background (to make possible dark/light themes)
            (it will be uploaded on the external server provided)
+    photoVariants: Resized copies of the photo (generated on save)
+    photoPlaceholder: Tiny preview of the photo as data URI (generated on save)
+    photoColor: Dominant color of the photo (generated on save)
+    photoWidth: Width of the photo in px (generated on save)
+    photoHeight: Height of the photo in px (generated on save)
     about: Cover letter
     aboutShort: Very short cover letter
     cvEsp: Resume PDF in spanish (it will be uploaded on the external server provided)
@@ -37,6 +42,11 @@ class Developer(models.Model):
     email = models.EmailField(_('Email'))
     residence = models.CharField(_('Residencia'), max_length=120, help_text=_("Ej.: Ciudad, Provincia - País"))
     photo = models.ImageField(_('Foto'), upload_to="img/about/", help_text=_("Preferentemente imagen con fondo transparente"))
+    photoVariants = models.JSONField(_('Variantes de la foto'), default=dict, blank=True, editable=False)
+    photoPlaceholder = models.TextField(_('Previsualización de la foto'), blank=True, editable=False)
+    photoColor = models.CharField(_('Color de la foto'), max_length=7, blank=True, editable=False)
+    photoWidth = models.PositiveIntegerField(_('Ancho de la foto'), null=True, blank=True, editable=False)
+    photoHeight = models.PositiveIntegerField(_('Alto de la foto'), null=True, blank=True, editable=False)
     about = models.TextField(_('Carta de presentación'))
     aboutShort = models.TextField(_('Presentación corta'))
     cvEsp = models.FileField(_('CV en español'), upload_to="files/cv/")
@@ -110,6 +120,9 @@ class Language(models.Model):
     class Meta:
         verbose_name = _('Idioma')
         verbose_name_plural = _('Idiomas')
+        indexes = [
+            models.Index(fields=["-proficiency"], name="portfolio_language_active_idx", condition=models.Q(isActive=True)),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -132,6 +145,9 @@ class Skill(models.Model):
     class Meta:
         verbose_name = _('Habilidad')
         verbose_name_plural = _('Habilidades')
+        indexes = [
+            models.Index(fields=["-proficiency"], name="portfolio_skill_active_idx", condition=models.Q(isActive=True)),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -211,6 +227,9 @@ class Education(models.Model):
     class Meta:
         verbose_name = _('Educación')
         verbose_name_plural = _('Educación')
+        indexes = [
+            models.Index(fields=["-finishDate"], name="portfolio_education_active_idx", condition=models.Q(isActive=True)),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -296,6 +315,10 @@ class Project(models.Model):
     class Meta:
         verbose_name = _('Proyecto')
         verbose_name_plural = _('Proyectos')
+        indexes = [
+            models.Index(fields=["startDate"], name="portfolio_project_active_idx", condition=models.Q(isActive=True)),
+            models.Index(fields=["status", "startDate"], name="portfolio_project_status_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -307,17 +330,30 @@ class ProjectImage(models.Model):
 
     project: Foreign key to the project
     image: Image (it will be uploaded on the external server provided)
+    imageVariants: Resized copies of the image (generated on save)
+    imagePlaceholder: Tiny preview of the image as data URI (generated on save)
+    imageColor: Dominant color of the image (generated on save)
+    imageWidth: Width of the image in px (generated on save)
+    imageHeight: Height of the image in px (generated on save)
     altText: Alternative text for HTML purposes
     isFeature: Determines if is the main image of the project
     """
-    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="project_images", verbose_name=_("Proyecto"))
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name="project_images", db_index=False, verbose_name=_("Proyecto"))
     image = models.ImageField(_("Imagen"), upload_to=f"img/projects/", default="img/projects/unavailable.jpg")
+    imageVariants = models.JSONField(_("Variantes de la imagen"), default=dict, blank=True, editable=False)
+    imagePlaceholder = models.TextField(_("Previsualización de la imagen"), blank=True, editable=False)
+    imageColor = models.CharField(_("Color de la imagen"), max_length=7, blank=True, editable=False)
+    imageWidth = models.PositiveIntegerField(_("Ancho de la imagen"), null=True, blank=True, editable=False)
+    imageHeight = models.PositiveIntegerField(_("Alto de la imagen"), null=True, blank=True, editable=False)
     altText = models.CharField(_("Texto alternativo"), max_length=30)
     isFeature = models.BooleanField(_("Portada de proyecto?"), default=False)
 
     class Meta:
         verbose_name = _('Imagen de proyecto')
         verbose_name_plural = _('Imágenes de proyecto')
+        indexes = [
+            models.Index(fields=["project", "-isFeature"], name="portfolio_image_feature_idx"),
+        ]
 
     def __str__(self) -> str:
         return self.altText
@@ -356,6 +392,9 @@ class Experience(models.Model):
     class Meta:
         verbose_name = _('Experiencia laboral')
         verbose_name_plural = _('Experiencias laborales')
+        indexes = [
+            models.Index(fields=["-startDate", "-finishDate"], name="portfolio_exp_active_idx", condition=models.Q(isActive=True)),
+        ]
 
     def __str__(self) -> str:
         return self.title
@@ -0,0 +1,185 @@
+import base64
+import datetime
+import functools
+import json
+import operator
+from collections import OrderedDict
+
+from django.core.exceptions import ValidationError
+from django.db.models import F, Q
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Opt-in cursor pagination.
+
+    Lists are only paginated when the request has a `page_size` or `cursor`
+    query param, otherwise the whole list is returned as before. Pages are
+    ordered by the view queryset ordering with `id` as tie-breaker and the
+    cursor stores the values of the last row, so every page is fetched with a
+    WHERE on the ordering keys instead of an OFFSET.
+
+    The WHERE bounds the first ordering key, so the database seeks its index
+    to the page instead of reading it from the start. Rows that tie on that
+    key are still read up to the position, as the mixed directions and
+    nullable keys of the orderings rule out a row value comparison.
+    """
+    page_size = api_settings.PAGE_SIZE or 10
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    invalid_cursor_message = _("Cursor inválido")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        params = request.query_params
+        if self.page_size_query_param not in params and self.cursor_query_param not in params:
+            return None
+
+        self.request = request
+        self.model = queryset.model
+        self.page_size = self.get_page_size(request)
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*[
+            F(field).desc(nulls_last=True) if descending else F(field).asc(nulls_first=True)
+            for field, descending, _nullable in self.ordering
+        ])
+        position = self.decode_cursor(request)
+        if position is not None:
+            queryset = queryset.filter(self.get_position_filter(position))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        self.next_position = self.get_position(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response(OrderedDict([
+            ("next", self.get_next_link()),
+            ("results", data),
+        ]))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def get_ordering(self, queryset):
+        """
+        Returns (field, descending, nullable) for each ordering field of
+        queryset, ending with the primary key
+        """
+        model = queryset.model
+        ordering = [field for field in queryset.query.order_by or model._meta.ordering if isinstance(field, str)]
+        result = []
+        for field in ordering:
+            descending = field.startswith("-")
+            name = field.lstrip("-")
+            if name == "pk":
+                name = model._meta.pk.name
+            result.append((name, descending, model._meta.get_field(name).null))
+            if name == model._meta.pk.name:
+                return result
+        result.append((model._meta.pk.name, False, False))
+        return result
+
+    def get_position(self, instance):
+        position = []
+        for field, _descending, _nullable in self.ordering:
+            value = getattr(instance, field)
+            if isinstance(value, (datetime.date, datetime.datetime)):
+                value = value.isoformat()
+            position.append(value)
+        return position
+
+    def get_position_filter(self, position):
+        """
+        Returns the filter of the rows placed after position:
+        (a at or beyond x) AND ((a beyond x) OR (a = x AND b beyond y) OR ...)
+        """
+        clauses = []
+        equal = Q()
+        for (field, descending, nullable), value in zip(self.ordering, position):
+            beyond = self.get_beyond_filter(field, descending, nullable, value)
+            if beyond is not None:
+                clauses.append(equal & beyond)
+            equal &= Q(**{f"{field}__isnull": True}) if value is None else Q(**{field: value})
+        return self.get_seek_filter(*self.ordering[0], position[0]) & functools.reduce(operator.or_, clauses)
+
+    def get_seek_filter(self, field, descending, nullable, value):
+        """
+        Returns the redundant range on the first key that lets the database
+        search its index instead of scanning it
+        """
+        if value is None:
+            return Q(**{f"{field}__isnull": True}) if descending else Q()
+        seek = Q(**{f"{field}__lte" if descending else f"{field}__gte": value})
+        if descending and nullable:
+            seek |= Q(**{f"{field}__isnull": True})
+        return seek
+
+    def get_beyond_filter(self, field, descending, nullable, value):
+        # Nulls go first on ascending order and last on descending order
+        if value is None:
+            return None if descending else Q(**{f"{field}__isnull": False})
+        beyond = Q(**{f"{field}__lt" if descending else f"{field}__gt": value})
+        if descending and nullable:
+            beyond |= Q(**{f"{field}__isnull": True})
+        return beyond
+
+    def encode_cursor(self, position):
+        return base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            position = json.loads(base64.urlsafe_b64decode(encoded.encode()))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if not isinstance(position, list) or len(position) != len(self.ordering):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            return [
+                self.clean_value(field, value)
+                for (field, _descending, _nullable), value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def clean_value(self, field, value):
+        # The cursor comes from the client, so its values are parsed as the
+        # model field would before they reach the query
+        field = self.model._meta.get_field(field)
+        if value is None:
+            if not field.null:
+                raise ValidationError(field.error_messages["null"])
+            return None
+        return field.to_python(value)
+
+    def get_next_link(self):
+        if self.next_position is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.encode_cursor(self.next_position))
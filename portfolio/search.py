@@ -0,0 +1,108 @@
+from django.db import connection
+
+from portfolio.models import Education, Experience, Project
+
+
+SEARCH_TABLE = "portfolio_search"
+
+# Kinds of indexed objects: model, code stored on the rowid and the fields
+# copied to the title, subtitle and body columns
+SEARCH_MODELS = {
+    "project": (Project, 1, ("title", "client", "description")),
+    "experience": (Experience, 2, ("title", "company", "description")),
+    "education": (Education, 3, ("title", "place", "description")),
+}
+SEARCH_KINDS = {model: kind for kind, (model, _code, _fields) in SEARCH_MODELS.items()}
+KIND_CODES = {code: kind for kind, (_model, code, _fields) in SEARCH_MODELS.items()}
+
+# Column weights for bm25(): title, subtitle, body, tags
+RANK_WEIGHTS = (10.0, 4.0, 1.0, 6.0)
+HIGHLIGHT = ("<mark>", "</mark>")
+
+
+def get_rowid(kind, pk):
+    """
+    Every row of the index is identified by the primary key and the kind
+    code, so rows are replaced and deleted by rowid instead of a scan
+    """
+    return pk * 4 + SEARCH_MODELS[kind][1]
+
+
+def get_tags(instance):
+    if isinstance(instance, Project):
+        return " ".join(language.title for language in instance.languages.all())
+    return ""
+
+
+def index_object(instance):
+    """
+    Adds (or replaces) an object on the search index. Inactive objects are
+    removed from it.
+    """
+    kind = SEARCH_KINDS[type(instance)]
+    remove_object(kind, instance.pk)
+    if not instance.isActive:
+        return
+    _model, _code, fields = SEARCH_MODELS[kind]
+    values = [getattr(instance, field) or "" for field in fields]
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {SEARCH_TABLE} (rowid, title, subtitle, body, tags) VALUES (%s, %s, %s, %s, %s)",
+            [get_rowid(kind, instance.pk), *values, get_tags(instance)],
+        )
+
+
+def remove_object(kind, pk):
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE} WHERE rowid = %s", [get_rowid(kind, pk)])
+
+
+def rebuild_index():
+    """
+    Indexes again every object, returns the number of indexed rows
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {SEARCH_TABLE}")
+    indexed = 0
+    for kind, (model, _code, _fields) in SEARCH_MODELS.items():
+        queryset = model._default_manager.filter(isActive=True).order_by("pk")
+        if model is Project:
+            queryset = queryset.prefetch_related("languages")
+        for instance in queryset.iterator(chunk_size=500):
+            index_object(instance)
+            indexed += 1
+    return indexed
+
+
+def build_match(query):
+    """
+    Converts the visitor input to an FTS5 query: every word is quoted (so
+    operators and punctuation are taken literally) and matched as a prefix
+    """
+    terms = [term.replace('"', '""') for term in query.split()]
+    return " ".join(f'"{term}"*' for term in terms if term.strip('"'))
+
+
+def search(query, limit=20):
+    """
+    Returns the objects matching query, best ranked first:
+    [{"kind", "id", "title", "snippet", "rank"}, ...]
+    title and snippet have the matched terms wrapped on HIGHLIGHT
+    """
+    match = build_match(query)
+    if not match:
+        return []
+    start, end = HIGHLIGHT
+    weights = ", ".join(str(weight) for weight in RANK_WEIGHTS)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT rowid, highlight({SEARCH_TABLE}, 0, %s, %s), "
+            f"snippet({SEARCH_TABLE}, -1, %s, %s, '…', 16), bm25({SEARCH_TABLE}, {weights}) AS rank "
+            f"FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s ORDER BY rank LIMIT %s",
+            [start, end, start, end, match, limit],
+        )
+        rows = cursor.fetchall()
+    return [
+        {"kind": KIND_CODES[rowid % 4], "id": rowid // 4, "title": title, "snippet": snippet, "rank": rank}
+        for rowid, title, snippet, rank in rows
+    ]
@@ -1,3 +1,5 @@
+from django.core.files.storage import default_storage
+
 from rest_framework import serializers
 
 from portfolio.models import (
@@ -18,7 +20,81 @@ from portfolio.models import (
 )
 
 
-class DeveloperSerializer(serializers.ModelSerializer):
+class SrcsetField(serializers.Field):
+    """
+    Read only representation of the variants generated by portfolio.images:
+    {"webp": [{"url", "width", "height"}, ...], "jpeg": [...]}
+    """
+
+    def __init__(self, **kwargs):
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        request = self.context.get("request")
+        srcset = {}
+        for extension, variants in value.items():
+            if extension == "source":
+                continue
+            srcset[extension] = []
+            for variant in variants:
+                url = default_storage.url(variant["name"])
+                if request is not None:
+                    url = request.build_absolute_uri(url)
+                srcset[extension].append({"url": url, "width": variant["width"], "height": variant["height"]})
+        return srcset
+
+
+def parse_field_tree(value):
+    """
+    Parses a comma separated list of dotted field names into a tree:
+    "id,developer.firstName" -> {"id": {}, "developer": {"firstName": {}}}
+    """
+    tree = {}
+    for path in (value or "").split(","):
+        node = tree
+        for name in path.strip().split("."):
+            if name:
+                node = node.setdefault(name, {})
+    return tree
+
+
+class DynamicFieldsModelSerializer(serializers.ModelSerializer):
+    """
+    ModelSerializer whose output can be trimmed and expanded.
+
+    Related objects are returned as primary keys unless they are expanded.
+    `fields` and `expand` are field trees (see parse_field_tree): only the
+    fields in `fields` are rendered (all of them if it's empty) and the
+    relations in `expand` are replaced by the serializer declared for them
+    on Meta.expandable_fields, as {name: serializer_class} or
+    {name: (serializer_class, {"many": True})}. Dotted names in `fields`
+    expand their parent too.
+    """
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields_tree = fields or {}
+        self.expand_tree = {**{name: {} for name, children in self.fields_tree.items() if children}, **(expand or {})}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        expandable_fields = getattr(self.Meta, "expandable_fields", {})
+        for name, expand in self.expand_tree.items():
+            if name not in expandable_fields or name not in fields:
+                continue
+            serializer_class, kwargs = expandable_fields[name], {}
+            if isinstance(serializer_class, tuple):
+                serializer_class, kwargs = serializer_class
+            fields[name] = serializer_class(fields=self.fields_tree.get(name), expand=expand, read_only=True, **kwargs)
+        if self.fields_tree:
+            fields = {name: field for name, field in fields.items() if name in self.fields_tree}
+        return fields
+
+
+class DeveloperSerializer(DynamicFieldsModelSerializer):
+    photoSrcset = SrcsetField(source="photoVariants")
+
     class Meta:
         model = Developer
         fields = (
@@ -31,6 +107,11 @@ class DeveloperSerializer(serializers.ModelSerializer):
             "email",
             "residence",
             "photo",
+            "photoSrcset",
+            "photoPlaceholder",
+            "photoColor",
+            "photoWidth",
+            "photoHeight",
             "about",
             "aboutShort",
             "cvEsp",
@@ -38,9 +119,7 @@ class DeveloperSerializer(serializers.ModelSerializer):
         )
 
 
-class TitleSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-
+class TitleSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Title
         fields = (
@@ -48,11 +127,12 @@ class TitleSerializer(serializers.ModelSerializer):
             "developer",
             "title",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+        }
 
 
-class SocialLinkSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-
+class SocialLinkSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = SocialLink
         fields = (
@@ -63,11 +143,12 @@ class SocialLinkSerializer(serializers.ModelSerializer):
             "link",
             "isActive",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+        }
 
 
-class LanguageSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-
+class LanguageSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Language
         fields = (
@@ -77,11 +158,12 @@ class LanguageSerializer(serializers.ModelSerializer):
             "proficiency",
             "isActive",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+        }
 
 
-class SkillSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-
+class SkillSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Skill
         fields = (
@@ -91,10 +173,12 @@ class SkillSerializer(serializers.ModelSerializer):
             "proficiency",
             "isActive",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+        }
 
 
-class FrameworkSerializer(serializers.ModelSerializer):
-    skill = SkillSerializer()
+class FrameworkSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Framework
         fields = (
@@ -104,9 +188,12 @@ class FrameworkSerializer(serializers.ModelSerializer):
             "icon",
             "isActive",
         )
+        expandable_fields = {
+            "skill": SkillSerializer,
+        }
 
 
-class RepositorySerializer(serializers.ModelSerializer):
+class RepositorySerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Repository
         fields = (
@@ -117,10 +204,7 @@ class RepositorySerializer(serializers.ModelSerializer):
         )
 
 
-class EducationSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-    repository = RepositorySerializer()
-
+class EducationSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Education
         fields = (
@@ -137,9 +221,13 @@ class EducationSerializer(serializers.ModelSerializer):
             "repository",
             "isActive",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+            "repository": RepositorySerializer,
+        }
 
 
-class ProjectCategorySerializer(serializers.ModelSerializer):
+class ProjectCategorySerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ProjectCategory
         fields = (
@@ -148,7 +236,7 @@ class ProjectCategorySerializer(serializers.ModelSerializer):
         )
 
 
-class ProjectLanguageSerializer(serializers.ModelSerializer):
+class ProjectLanguageSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ProjectLanguage
         fields = (
@@ -157,7 +245,7 @@ class ProjectLanguageSerializer(serializers.ModelSerializer):
         )
 
 
-class ExtLinkSerializer(serializers.ModelSerializer):
+class ExtLinkSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = ExtLink
         fields = (
@@ -167,26 +255,27 @@ class ExtLinkSerializer(serializers.ModelSerializer):
         )
 
 
-class ProjectImageSerializer(serializers.ModelSerializer):
+class ProjectImageSerializer(DynamicFieldsModelSerializer):
+    imageSrcset = SrcsetField(source="imageVariants")
+
     class Meta:
         model = ProjectImage
         fields = (
             "id",
             "project",
             "image",
+            "imageSrcset",
+            "imagePlaceholder",
+            "imageColor",
+            "imageWidth",
+            "imageHeight",
             "altText",
             "isFeature",
         )
+        related_ordering = ("-isFeature", "id")
 
 
-class ProjectSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-    category = ProjectCategorySerializer()
-    languages = ProjectLanguageSerializer(many=True)
-    project_images = ProjectImageSerializer(many=True)
-    repository = RepositorySerializer()
-    extLink = ExtLinkSerializer(many=True)
-
+class ProjectSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Project
         fields = (
@@ -204,14 +293,18 @@ class ProjectSerializer(serializers.ModelSerializer):
             "status",
             "isActive",
         )
-
-
-class ExperienceSerializer(serializers.ModelSerializer):
-    developer = DeveloperSerializer()
-    project = ProjectSerializer()
-    repository = RepositorySerializer()
-    extLink = ExtLinkSerializer(many=True)
-
+        read_only_fields = ("project_images",)
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+            "category": ProjectCategorySerializer,
+            "languages": (ProjectLanguageSerializer, {"many": True}),
+            "project_images": (ProjectImageSerializer, {"many": True}),
+            "repository": RepositorySerializer,
+            "extLink": (ExtLinkSerializer, {"many": True}),
+        }
+
+
+class ExperienceSerializer(DynamicFieldsModelSerializer):
     class Meta:
         model = Experience
         fields = (
@@ -229,3 +322,9 @@ class ExperienceSerializer(serializers.ModelSerializer):
             "extLink",
             "isActive",
         )
+        expandable_fields = {
+            "developer": DeveloperSerializer,
+            "project": ProjectSerializer,
+            "repository": RepositorySerializer,
+            "extLink": (ExtLinkSerializer, {"many": True}),
+        }
@@ -0,0 +1,96 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from portfolio.cache import bump_version, get_portfolio_models
+from portfolio.images import IMAGE_FIELDS, update_image
+from portfolio.models import Project, ProjectLanguage
+from portfolio.search import SEARCH_KINDS, index_object, remove_object
+
+
+PORTFOLIO_MODELS = get_portfolio_models()
+
+
+@receiver(post_save)
+@receiver(post_delete)
+def invalidate_model(sender, **kwargs):
+    """
+    Bumps the version of a portfolio model when one of its rows changes
+    """
+    if sender in PORTFOLIO_MODELS:
+        bump_version(sender)
+
+
+@receiver(m2m_changed)
+def invalidate_m2m(sender, instance, action, model, **kwargs):
+    """
+    Bumps the version of both sides of a portfolio many to many relation
+    """
+    if not action.startswith("post_"):
+        return
+    for changed in (type(instance), model):
+        if changed in PORTFOLIO_MODELS:
+            bump_version(changed)
+
+
+@receiver(post_save)
+def generate_image_variants(sender, instance, raw=False, **kwargs):
+    """
+    Generates the resized variants and placeholders of the uploaded images
+    """
+    if raw or sender not in IMAGE_FIELDS:
+        return
+    updated = [update_image(instance, field) for field in IMAGE_FIELDS[sender]]
+    if any(updated):
+        bump_version(sender)
+
+
+@receiver(post_save)
+def index_search_object(sender, instance, **kwargs):
+    """
+    Keeps the search index in sync with projects, experience and education
+    """
+    if sender in SEARCH_KINDS:
+        index_object(instance)
+
+
+@receiver(post_delete)
+def remove_search_object(sender, instance, **kwargs):
+    if sender in SEARCH_KINDS:
+        remove_object(SEARCH_KINDS[sender], instance.pk)
+
+
+def reindex_projects(pks):
+    for project in Project.objects.filter(pk__in=pks).prefetch_related("languages"):
+        index_object(project)
+
+
+@receiver(m2m_changed, sender=Project.languages.through)
+def index_project_languages(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Updates the language names indexed with the projects
+    """
+    if not reverse:
+        if action.startswith("post_"):
+            index_object(instance)
+    elif action == "pre_clear":
+        instance._search_projects = list(instance.project_languages.values_list("pk", flat=True))
+    elif action == "post_clear":
+        reindex_projects(instance._search_projects)
+    elif action in ("post_add", "post_remove"):
+        reindex_projects(pk_set)
+
+
+@receiver(post_save, sender=ProjectLanguage)
+def index_language_projects(sender, instance, created, **kwargs):
+    if not created:
+        reindex_projects(instance.project_languages.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=ProjectLanguage)
+def collect_language_projects(sender, instance, **kwargs):
+    instance._search_projects = list(instance.project_languages.values_list("pk", flat=True))
+
+
+@receiver(post_delete, sender=ProjectLanguage)
+def reindex_language_projects(sender, instance, **kwargs):
+    reindex_projects(instance._search_projects)
@@ -1,3 +1,1085 @@
-from django.test import TestCase
+import base64
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from contextlib import closing
+from datetime import date
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.db.models import F
+from django.db.models.signals import m2m_changed
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+import brotli
+from PIL import Image
+from prometheus_client import REGISTRY
+from rest_framework.renderers import JSONRenderer
+
+from contact.outbox import enqueue_email
+from portfolio import views
+from portfolio.async_views import AsyncReadView
+from portfolio.benchmark import QUERY_BUDGETS, get_benchmark_urls, get_template, measure
+from portfolio.cache import get_version_key, get_versions
+from portfolio.export import StaticExport, write_file
+from portfolio.factories import create_portfolio, generate_portfolios
+from portfolio.models import (
+    Education,
+    Framework,
+    Project,
+    ProjectImage,
+    ProjectLanguage,
+    Title,
+)
+from portfolio.mixins import BulkMixin
+from portfolio.renderers import FastJSONRenderer
+
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+def tearDownModule():
+    shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class QueryCountTest(TestCase):
+    urls = [
+        "/developer",
+        "/title",
+        "/social_link",
+        "/language",
+        "/skill",
+        "/framework",
+        "/repository",
+        "/education",
+        "/project_category",
+        "/project_language",
+        "/external_link",
+        "/project",
+        "/project/pro",
+        "/project_image",
+        "/experience",
+        "/framework?expand=skill.developer",
+        "/project?expand=developer,category,languages,project_images,repository,extLink",
+        "/experience?expand=developer,project.developer,project.project_images,project.extLink,repository,extLink",
+    ]
+
+    def setUp(self):
+        cache.clear()
+
+    def count_queries(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return len(context)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        create_portfolio(2)
+        counts = {url: self.count_queries(url) for url in self.urls}
+        with self.captureOnCommitCallbacks(execute=True):
+            create_portfolio(8)
+        for url in self.urls:
+            with self.subTest(url=url):
+                self.assertEqual(self.count_queries(url), counts[url])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class QueryBudgetTest(TestCase):
+    def test_every_endpoint_is_within_budget(self):
+        for rows in (2, 6):
+            generate_portfolios(2, rows, seed=rows)
+            for url in get_benchmark_urls():
+                with self.subTest(url=url, rows=rows):
+                    result = measure(self.client, url)
+                    self.assertEqual(result["status"], 200)
+                    self.assertLessEqual(result["queries"], QUERY_BUDGETS[get_template(url)])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class BundleTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(3)
+
+    def test_bundle_is_normalized(self):
+        response = self.client.get(f"/developer/{self.developer.pk}/bundle", secure=True, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["developer"]), 1)
+        self.assertEqual(data["title"][0]["developer"], self.developer.pk)
+        self.assertEqual(len(data["project"]), 3)
+        self.assertEqual(len(data["project_image"]), 3)
+        self.assertEqual(len(data["repository"]), 3)
+
+    def test_bundle_is_served_from_snapshot_until_a_row_changes(self):
+        self.client.get("/bundle", secure=True, HTTP_ACCEPT="application/json")
+        with self.assertNumQueries(0):
+            self.client.get("/bundle", secure=True, HTTP_ACCEPT="application/json")
+        with self.captureOnCommitCallbacks(execute=True):
+            Title.objects.create(developer=self.developer, title="New title")
+        response = self.client.get("/bundle", secure=True, HTTP_ACCEPT="application/json")
+        self.assertIn("New title", [row["title"] for row in response.json()["title"]])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class ResponseCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(2)
+
+    def get(self, url):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+
+    def test_cached_response_runs_no_queries(self):
+        response = self.get("/project")
+        with self.assertNumQueries(0):
+            self.assertEqual(self.get("/project").content, response.content)
+
+    def test_related_model_change_invalidates_payload(self):
+        self.get("/title?expand=developer")
+        self.developer.firstName = "Changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            self.developer.save()
+        response = self.get("/title?expand=developer")
+        self.assertEqual(response.json()[0]["developer"]["firstName"], "Changed")
+
+    def test_versions_change_when_the_transaction_commits(self):
+        versions = get_versions([Title])
+        with self.captureOnCommitCallbacks(execute=True):
+            Title.objects.create(developer=self.developer, title="New title")
+            # Readers still see the old rows, they keep the old version
+            self.assertEqual(get_versions([Title]), versions)
+        self.assertNotEqual(get_versions([Title]), versions)
+
+    def test_m2m_change_invalidates_payload(self):
+        project = Project.objects.order_by("startDate", "id").first()
+        self.get(f"/project/details/{project.pk}")
+        with self.captureOnCommitCallbacks(execute=True):
+            project.languages.clear()
+        response = self.get(f"/project/details/{project.pk}")
+        self.assertEqual(response.json()["languages"], [])
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class ConditionalGetTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(2)
+
+    def get(self, url, **headers):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json", **headers)
+
+    def test_matching_etag_returns_not_modified_without_queries(self):
+        response = self.get("/experience")
+        self.assertTrue(response["ETag"])
+        self.assertTrue(response["Last-Modified"])
+        with self.assertNumQueries(0):
+            response = self.get("/experience", HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_when_a_dependency_changes(self):
+        etag = self.get("/skill")["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.developer.save()
+        response = self.get("/skill", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class CompressionTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(5)
+
+    def get(self, url, **headers):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json", **headers)
+
+    def test_brotli_is_preferred_over_gzip(self):
+        plain = self.get("/project").content
+        response = self.get("/project", HTTP_ACCEPT_ENCODING="gzip, deflate, br")
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertTrue(response["ETag"].startswith("W/"))
+        self.assertEqual(brotli.decompress(response.content), plain)
+
+        response = self.get("/project", HTTP_ACCEPT_ENCODING="gzip, br;q=0")
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(gzip.decompress(response.content), plain)
+
+    def test_small_payloads_are_not_compressed(self):
+        response = self.get("/project_category", HTTP_ACCEPT_ENCODING="gzip, br")
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    def test_cached_responses_are_not_compressed_again(self):
+        first = self.get("/project", HTTP_ACCEPT_ENCODING="br")
+        with mock.patch("core.middleware.compress") as compress, self.assertNumQueries(0):
+            second = self.get("/project", HTTP_ACCEPT_ENCODING="br")
+        compress.assert_not_called()
+        self.assertEqual(second.content, first.content)
+
+        # Conditional requests still match the weakened ETag
+        response = self.get("/project", HTTP_ACCEPT_ENCODING="br", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT, SERVER_TIMING=True)
+class ServerTimingTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(3)
+
+    def get(self, url):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+
+    def test_phases_are_reported(self):
+        header = self.get("/project").headers["Server-Timing"]
+        metrics = [metric.split(";")[0] for metric in header.split(", ")]
+        self.assertEqual(metrics, ["db", "serialize", "render", "total"])
+        self.assertIn('desc="4 queries"', header)
+
+    def test_cached_responses_report_no_queries(self):
+        self.get("/project")
+        header = self.get("/project").headers["Server-Timing"]
+        self.assertIn('desc="0 queries"', header)
+        self.assertNotIn("render", header)
+
+    def test_timings_are_logged(self):
+        with self.settings(SERVER_TIMING_LOG=True), self.assertLogs("core.middleware", "INFO") as logs:
+            self.get("/skill")
+        self.assertEqual(logs.records[0].timing["queries"], 1)
+        self.assertEqual(logs.records[0].timing["path"], "/skill")
+
+    @override_settings(SERVER_TIMING=False)
+    def test_disabled(self):
+        self.assertFalse(self.get("/project").has_header("Server-Timing"))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT, METRICS_TOKEN=None, INTERNAL_IPS=["127.0.0.1"])
+class MetricsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(2)
+
+    def get(self, url, **headers):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json", **headers)
+
+    def sample(self, name, **labels):
+        return REGISTRY.get_sample_value(name, labels) or 0
+
+    def test_requests_are_labeled_by_route(self):
+        requests = self.sample("http_requests_total", route="project", method="GET", status="200")
+        queries = self.sample("http_db_queries_sum", route="project_detail")
+        self.get("/project")
+        self.get(f"/project/details/{Project.objects.first().pk}")
+        self.assertEqual(self.sample("http_requests_total", route="project", method="GET", status="200"), requests + 1)
+        self.assertEqual(self.sample("http_db_queries_sum", route="project_detail"), queries + 4)
+
+    def test_cache_hits_and_misses(self):
+        hits = self.sample("cache_requests_total", cache="response", result="hit")
+        misses = self.sample("cache_requests_total", cache="response", result="miss")
+        self.get("/skill")
+        self.get("/skill")
+        self.assertEqual(self.sample("cache_requests_total", cache="response", result="hit"), hits + 1)
+        self.assertEqual(self.sample("cache_requests_total", cache="response", result="miss"), misses + 1)
+
+    def test_gunicorn_config_enables_multiprocess_mode(self):
+        # A new interpreter, prometheus_client is already imported here
+        script = (
+            "import runpy; runpy.run_path('gunicorn.conf.py');"
+            "from prometheus_client import values; print(values.ValueClass.__name__)"
+        )
+        environment = {name: value for name, value in os.environ.items() if name != "PROMETHEUS_MULTIPROC_DIR"}
+        result = subprocess.run([sys.executable, "-c", script], cwd=settings.BASE_DIR, env=environment, capture_output=True, text=True, check=True)
+        self.assertEqual(result.stdout.strip(), "MmapedValue")
+
+    def test_metrics_endpoint(self):
+        enqueue_email("Subject", "Body", "", "from@example.com", ["to@example.com"])
+        content = self.get("/metrics").content.decode()
+        self.assertIn('contact_outbox_emails{status="PEN"} 1.0', content)
+        self.assertIn('http_request_duration_seconds_bucket{le="0.005",method="GET",route=', content)
+        with self.settings(METRICS_TOKEN="secret", INTERNAL_IPS=[]):
+            self.assertEqual(self.get("/metrics").status_code, 403)
+            self.assertEqual(self.get("/metrics", HTTP_AUTHORIZATION="Bearer other").status_code, 403)
+            self.assertEqual(self.get("/metrics", HTTP_AUTHORIZATION="Bearer secret").status_code, 200)
+
+    @override_settings(INTERNAL_IPS=[])
+    def test_metrics_are_denied_by_default(self):
+        self.assertEqual(self.get("/metrics").status_code, 403)
+        self.assertEqual(self.get("/metrics", HTTP_AUTHORIZATION="Bearer None").status_code, 403)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class AsyncViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(3)
+
+    async def get(self, url, **headers):
+        return await self.async_client.get(url, secure=True, headers={"Accept": "application/json", **headers})
+
+    async def test_responses_match_sync_views(self):
+        pk = (await Project.objects.afirst()).pk
+        for url in ["/project", "/project/pro", "/experience", "/skill?ordering=-id", "/project?status=DEV,PRO", f"/project/details/{pk}"]:
+            response = await self.get(f"/async{url}")
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(json.loads(response.content), json.loads((await self.get(url)).content), url)
+
+    async def test_sideload_and_facets_match_sync_views(self):
+        pk = (await Project.objects.afirst()).pk
+        urls = [
+            "/project?facets=true",
+            "/project?format=sideload",
+            "/project?format=sideload&facets=true&page_size=2",
+            f"/project/details/{pk}?format=sideload",
+        ]
+        for url in urls:
+            response = await self.get(f"/async{url}", Accept="*/*")
+            expected = await self.get(url, Accept="*/*")
+            self.assertEqual(response.status_code, 200, url)
+            self.assertEqual(response["Content-Type"], expected["Content-Type"], url)
+            # The next links only differ on the /async prefix
+            data, expected = json.loads(response.content), json.loads(expected.content)
+            next_link = expected.pop("next", None)
+            self.assertEqual(data.pop("next", None), next_link and next_link.replace("/project", "/async/project"), url)
+            self.assertEqual(data, expected, url)
+        response = await self.get("/async/project", Accept="application/vnd.portfolio.sideload+json")
+        self.assertIn("included", json.loads(response.content))
+        self.assertEqual((await self.get("/async/project?format=xml")).status_code, 404)
+
+    async def test_not_found(self):
+        response = await self.get("/async/project/details/0")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(json.loads(response.content), {"detail": "No encontrado."})
+
+    async def test_cached_and_conditional_requests(self):
+        first = await self.get("/async/project")
+        with mock.patch.object(AsyncReadView, "get_data") as get_data:
+            second = await self.get("/async/project")
+        get_data.assert_not_called()
+        self.assertEqual(second.content, first.content)
+        response = await self.get("/async/project", **{"If-None-Match": first["ETag"]})
+        self.assertEqual(response.status_code, 304)
+
+    async def test_requests_are_labeled_by_route(self):
+        requests = REGISTRY.get_sample_value("http_requests_total", {"route": "async_project", "method": "GET", "status": "200"}) or 0
+        await self.get("/async/project")
+        self.assertEqual(
+            REGISTRY.get_sample_value("http_requests_total", {"route": "async_project", "method": "GET", "status": "200"}),
+            requests + 1,
+        )
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class AdminQueryTest(TestCase):
+    # Max queries of every admin page (including the session and user ones)
+    budgets = {
+        "developer_change": 9,
+        "skill_change": 7,
+        "project_change": 13,
+        "experience_change": 10,
+        "education_change": 7,
+        "developer_changelist": 4,
+        "framework_changelist": 4,
+        "project_changelist": 4,
+        "experience_changelist": 4,
+    }
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(User.objects.create_superuser("admin", "admin@example.com", "admin"))
+
+    def get_urls(self, developer):
+        project = developer.project.order_by("id").first()
+        return {
+            "developer_change": reverse("admin:portfolio_developer_change", args=[developer.pk]),
+            "skill_change": reverse("admin:portfolio_skill_change", args=[developer.skill.order_by("id").first().pk]),
+            "project_change": reverse("admin:portfolio_project_change", args=[project.pk]),
+            "experience_change": reverse("admin:portfolio_experience_change", args=[developer.experience.order_by("id").first().pk]),
+            "education_change": reverse("admin:portfolio_education_change", args=[developer.education.order_by("id").first().pk]),
+            "developer_changelist": reverse("admin:portfolio_developer_changelist"),
+            "framework_changelist": reverse("admin:portfolio_framework_changelist"),
+            "project_changelist": reverse("admin:portfolio_project_changelist"),
+            "experience_changelist": reverse("admin:portfolio_experience_changelist"),
+        }
+
+    def count_queries(self, urls):
+        counts = {}
+        for name, url in urls.items():
+            # The first request fills the content types cache
+            self.client.get(url, secure=True)
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(url, secure=True)
+            self.assertEqual(response.status_code, 200, name)
+            counts[name] = len(context)
+        return counts
+
+    def test_query_count_does_not_grow_with_rows(self):
+        small = self.count_queries(self.get_urls(generate_portfolios(1, 5)[0]))
+        developer = generate_portfolios(1, 200, seed=1)[0]
+        skill = developer.skill.order_by("id").first()
+        Framework.objects.bulk_create(Framework(skill=skill, title=f"Framework {i}", icon="icon") for i in range(100))
+        project = developer.project.order_by("id").first()
+        ProjectImage.objects.bulk_create(ProjectImage(project=project, image="img/projects/seed.jpg", altText=f"Image {i}") for i in range(100))
+        large = self.count_queries(self.get_urls(developer))
+
+        self.assertEqual(large, small)
+        for name, count in large.items():
+            self.assertLessEqual(count, self.budgets[name], name)
+
+
+class MigrationsTest(TestCase):
+    def test_models_have_no_pending_changes(self):
+        call_command("makemigrations", "portfolio", "--check", "--dry-run", stdout=StringIO())
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class IndexUsageTest(TestCase):
+    querysets = {
+        "portfolio_language_active_idx": lambda: views.LanguageList.queryset,
+        "portfolio_skill_active_idx": lambda: views.SkillList.queryset,
+        "portfolio_education_active_idx": lambda: views.EducationList.queryset,
+        "portfolio_project_active_idx": lambda: views.ProjectList.queryset,
+        "portfolio_project_status_idx": lambda: Project.objects.filter(status="PRO").order_by("startDate"),
+        "portfolio_image_feature_idx": lambda: ProjectImage.objects.filter(project=1).order_by("-isFeature", "id"),
+        "portfolio_exp_active_idx": lambda: views.ExperienceList.queryset,
+    }
+
+    def setUp(self):
+        create_portfolio(5)
+
+    def test_view_queries_use_indexes(self):
+        for index, queryset in self.querysets.items():
+            with self.subTest(index=index):
+                plan = queryset().all().explain()
+                self.assertIn(f"USING INDEX {index}", plan)
+                self.assertNotIn("TEMP B-TREE", plan)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class FilterTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(4)
+        self.projects = list(Project.objects.order_by("id"))
+        for project, status, day in zip(self.projects, ["DEV", "PRO", "PRO", "CAN"], [4, 3, 2, 1]):
+            project.status = status
+            project.startDate = date(2020, 1, day)
+            project.save()
+        self.language = self.projects[0].languages.get()
+        self.projects[1].languages.add(self.language)
+        self.projects[3].isActive = False
+        self.projects[3].save()
+
+    def get(self, url):
+        return self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+
+    def ids(self, url):
+        response = self.get(url)
+        self.assertEqual(response.status_code, 200)
+        return [row["id"] for row in response.json()]
+
+    def test_filters_and_ordering(self):
+        first, second, third, _canceled = [project.id for project in self.projects]
+        self.assertEqual(self.ids("/project?status=PRO"), [third, second])
+        self.assertEqual(self.ids("/project?status=PRO,DEV&ordering=-startDate"), [first, second, third])
+        self.assertEqual(self.ids(f"/project?language={self.language.id}&ordering=id"), [first, second])
+        self.assertEqual(self.ids("/project?status=CAN"), [])
+
+    def test_invalid_values_are_rejected(self):
+        self.assertEqual(self.get("/project?status=XXX").status_code, 400)
+        self.assertEqual(self.get("/project?category=abc").status_code, 400)
+
+    def test_unknown_ordering_fields_are_ignored(self):
+        self.assertEqual(self.ids("/project?ordering=description"), self.ids("/project"))
+
+    def test_status_routes(self):
+        self.assertEqual(self.ids("/project/pro"), self.ids("/project?status=PRO"))
+
+    def test_facets_are_fetched_with_one_query(self):
+        with CaptureQueriesContext(connection) as plain:
+            self.get("/project?status=PRO,DEV")
+        cache.clear()
+        with CaptureQueriesContext(connection) as faceted:
+            response = self.get("/project?status=PRO,DEV&facets=true")
+        self.assertEqual(len(faceted), len(plain) + 1)
+        self.assertEqual(response.json()["facets"], {
+            "status": {"DEV": 1, "PRO": 2},
+            "category": {str(self.projects[0].category_id): 3},
+            "language": {
+                str(self.language.id): 2,
+                str(self.projects[1].languages.exclude(pk=self.language.pk).get().id): 1,
+                str(self.projects[2].languages.get().id): 1,
+            },
+        })
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class SearchTest(TestCase):
+    def setUp(self):
+        create_portfolio(2)
+        self.project = Project.objects.order_by("id").first()
+        self.project.title = "Tienda online"
+        self.project.description = "Comercio electrónico con pagos y envíos"
+        self.project.save()
+
+    def search(self, query):
+        response = self.client.get("/search", {"q": query}, secure=True, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_results_are_ranked_and_highlighted(self):
+        # Saved one by one, so post_save indexes the competing rows
+        for education in Education.objects.all():
+            education.description = "Curso de tienda"
+            education.save()
+        results = self.search("tienda")
+        self.assertIn("education", [row["kind"] for row in results[1:]])
+        self.assertEqual(results[0]["kind"], "project")
+        self.assertEqual(results[0]["id"], self.project.id)
+        self.assertEqual(results[0]["title"], "<mark>Tienda</mark> online")
+        self.assertEqual(self.search("electronico pag")[0]["snippet"], "Comercio <mark>electrónico</mark> con <mark>pagos</mark> y envíos")
+
+    def test_index_follows_changes(self):
+        language = self.project.languages.get()
+        language.title = "Haskell"
+        language.save()
+        self.assertEqual([row["id"] for row in self.search("haskell")], [self.project.id])
+        self.project.languages.clear()
+        self.assertEqual(self.search("haskell"), [])
+
+        self.project.isActive = False
+        self.project.save()
+        self.assertEqual(self.search("tienda"), [])
+        self.project.delete()
+        self.assertEqual(self.search("tienda"), [])
+
+    def test_query_operators_are_literal(self):
+        self.assertEqual(self.search('tienda" OR "x'), [])
+        self.assertEqual(self.client.get("/search", secure=True).status_code, 400)
+
+    def test_search_uses_full_text_index(self):
+        with CaptureQueriesContext(connection) as context:
+            self.search("tienda")
+        plan = connection.cursor().execute(f"EXPLAIN QUERY PLAN {context[-1]['sql']}").fetchall()
+        self.assertIn("VIRTUAL TABLE INDEX", str(plan))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class StaticExportTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(2)
+        self.output = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.output, ignore_errors=True)
+
+    def export(self):
+        return StaticExport(self.output, "testserver").export()
+
+    def test_files_match_the_api(self):
+        self.export()
+        manifest = json.loads((self.output / "manifest.json").read_text())
+        self.assertEqual(manifest["files"]["/skill"]["file"], "skill.json")
+        content = (self.output / "skill.json").read_bytes()
+        self.assertEqual(content, self.client.get("/skill", secure=True, HTTP_ACCEPT="application/json").content)
+        self.assertEqual(gzip.decompress((self.output / "skill.json.gz").read_bytes()), content)
+        self.assertEqual(brotli.decompress((self.output / "skill.json.br").read_bytes()), content)
+        self.assertTrue((self.output / "project/details/1.json").exists())
+        self.assertTrue((self.output / "project/pro.json").exists())
+
+    def test_only_changed_endpoints_are_written(self):
+        total = self.export()["written"]
+        self.assertEqual(self.export(), {"written": 0, "unchanged": total, "removed": 0})
+
+        title = Title.objects.first()
+        title.title = "Changed"
+        with self.captureOnCommitCallbacks(execute=True):
+            title.save()
+        with mock.patch("portfolio.export.write_file", wraps=write_file) as writer:
+            stats = self.export()
+        written = {str(call.args[0].relative_to(self.output)) for call in writer.call_args_list}
+        developer = title.developer_id
+        changed = {"title.json", f"title/{title.id}.json", "bundle.json", f"developer/{developer}/bundle.json"}
+        self.assertEqual(stats["written"], len(changed))
+        self.assertEqual({name for name in written if name.endswith(".json")} - {"manifest.json"}, changed)
+
+        title.delete()
+        self.assertEqual(self.export()["removed"], 1)
+        self.assertFalse((self.output / f"title/{title.id}.json").exists())
+
+    def test_command_uses_an_allowed_host(self):
+        for allowed_hosts, host in ((["api.manuelferrero.com.ar"], "api.manuelferrero.com.ar"), ([".example.com"], "example.com")):
+            with override_settings(DEBUG=False, ALLOWED_HOSTS=allowed_hosts):
+                call_command("export_static_api", output=self.output, force=True, stdout=StringIO())
+            manifest = json.loads((self.output / "manifest.json").read_text())
+            self.assertEqual(manifest["host"], host)
+            self.assertIn(f"//{host}/", (self.output / "project_image.json").read_text())
+
+        with override_settings(DEBUG=False, ALLOWED_HOSTS=["example.com"]):
+            with self.assertRaises(CommandError):
+                call_command("export_static_api", output=self.output, host="other.com", stdout=StringIO())
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class KeysetPaginationTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(7)
+        for i, education in enumerate(Education.objects.order_by("id")):
+            education.finishDate = None if i % 3 == 0 else date(2020, 1, 1 + i % 2)
+            education.save()
+
+    def collect(self, url):
+        ids = []
+        while url:
+            response = self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+            self.assertEqual(response.status_code, 200)
+            data = response.json()
+            self.assertLessEqual(len(data["results"]), 2)
+            ids += [row["id"] for row in data["results"]]
+            url = data["next"]
+        return ids
+
+    def test_pages_follow_view_ordering_with_id_tie_breaker(self):
+        expected = Education.objects.filter(isActive=True).order_by(F("finishDate").desc(nulls_last=True), "id")
+        self.assertEqual(self.collect("/education?page_size=2"), [education.id for education in expected])
+        expected = ProjectImage.objects.order_by("-isFeature", "id")
+        self.assertEqual(self.collect("/project_image?page_size=2"), [image.id for image in expected])
+
+    def test_lists_are_not_paginated_by_default(self):
+        response = self.client.get("/project", secure=True, HTTP_ACCEPT="application/json")
+        self.assertIsInstance(response.json(), list)
+
+    def test_invalid_cursor(self):
+        response = self.client.get("/project?cursor=invalid", secure=True, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 404)
+        for position in (["notadate", 1], [{"a": 1}, 1], ["2020-01-01", None], ["2020-01-01", "uno"]):
+            cursor = base64.urlsafe_b64encode(json.dumps(position).encode()).decode()
+            response = self.client.get(f"/education?cursor={cursor}", secure=True, HTTP_ACCEPT="application/json")
+            self.assertEqual(response.status_code, 404)
+
+    def test_pages_seek_the_first_ordering_key(self):
+        cursor = base64.urlsafe_b64encode(json.dumps(["2020-01-01", "2019-01-01", 1]).encode()).decode()
+        with CaptureQueriesContext(connection) as queries:
+            self.client.get(f"/experience?cursor={cursor}", secure=True, HTTP_ACCEPT="application/json")
+        sql = next(query["sql"] for query in queries if "portfolio_experience" in query["sql"])
+        plan = connection.cursor().execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        self.assertIn("SEARCH portfolio_experience USING INDEX", str(plan))
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT, MEDIA_SENDFILE_HEADER=None)
+class MediaTest(TestCase):
+    content = bytes(range(256)) * 40
+
+    def setUp(self):
+        self.name = default_storage.save("files/cv/cv.pdf", ContentFile(self.content))
+
+    def get(self, name, **headers):
+        return self.client.get(f"/media/{name}", secure=True, **headers)
+
+    def test_files_are_stored_under_content_hashed_names(self):
+        self.assertRegex(self.name, r"^files/cv/cv\.[0-9a-f]{16}\.pdf$")
+        self.assertEqual(default_storage.save("files/cv/cv.pdf", ContentFile(self.content)), self.name)
+        self.assertNotEqual(default_storage.save("files/cv/cv.pdf", ContentFile(b"other")), self.name)
+
+    def test_hashed_names_fit_max_length(self):
+        for _ in range(2):
+            name = default_storage.save("files/cv/curriculum.pdf", ContentFile(self.content), max_length=35)
+            self.assertRegex(name, r"^files/cv/curri\.[0-9a-f]{16}\.pdf$")
+        self.assertEqual(default_storage.save("files/cv/cv.pdf", ContentFile(self.content), max_length=35), self.name)
+        with self.assertRaises(SuspiciousFileOperation):
+            default_storage.save("files/cv/cv.pdf", ContentFile(self.content), max_length=20)
+
+    def test_hashed_files_are_immutable(self):
+        response = self.get(self.name)
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Type"], "application/pdf")
+        self.assertEqual(response["Cache-Control"], "public, max-age=31536000, immutable")
+        self.assertEqual(self.get(self.name, HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_other_files_are_revalidated(self):
+        write_file(Path(MEDIA_ROOT) / "files/cv/legacy.pdf", self.content)
+        response = self.get("files/cv/legacy.pdf")
+        self.assertEqual(response["Cache-Control"], "public, no-cache")
+        self.assertEqual(self.get("files/cv/legacy.pdf", HTTP_IF_NONE_MATCH=response["ETag"]).status_code, 304)
+
+    def test_ranges(self):
+        response = self.get(self.name, HTTP_RANGE="bytes=100-199")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], f"bytes 100-199/{len(self.content)}")
+        self.assertEqual(response["Content-Length"], "100")
+        self.assertEqual(b"".join(response.streaming_content), self.content[100:200])
+
+        response = self.get(self.name, HTTP_RANGE="bytes=-10")
+        self.assertEqual(b"".join(response.streaming_content), self.content[-10:])
+        self.assertEqual(self.get(self.name, HTTP_RANGE=f"bytes={len(self.content)}-").status_code, 416)
+
+        response = self.get(self.name, HTTP_RANGE="bytes=500-100")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+
+    def test_if_range(self):
+        etag = self.get(self.name)["ETag"]
+        self.assertEqual(self.get(self.name, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE=etag).status_code, 206)
+        response = self.get(self.name, HTTP_RANGE="bytes=0-9", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+
+    def test_sendfile(self):
+        with self.settings(MEDIA_SENDFILE_HEADER="X-Accel-Redirect"):
+            response = self.get(self.name)
+        self.assertEqual(response["X-Accel-Redirect"], f"/protected-media/{self.name}")
+        self.assertEqual(response.content, b"")
+        with self.settings(MEDIA_SENDFILE_HEADER="X-Sendfile"):
+            self.assertEqual(self.get(self.name)["X-Sendfile"], str(Path(MEDIA_ROOT) / self.name))
+
+    def test_missing_files(self):
+        self.assertEqual(self.get("files/cv/missing.pdf").status_code, 404)
+        self.assertEqual(self.get("files/cv").status_code, 404)
+        # Paths out of MEDIA_ROOT are suspicious operations
+        self.assertEqual(self.get("files/../../db.sqlite3").status_code, 400)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class BulkTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(2)
+
+    def send(self, method, url, data):
+        # Runs the callbacks of the batch commit (a savepoint inside the test)
+        with self.captureOnCommitCallbacks(execute=True):
+            return getattr(self.client, method)(url, json.dumps(data), content_type="application/json", secure=True, HTTP_ACCEPT="application/json")
+
+    def titles(self):
+        return [row["title"] for row in self.client.get("/title", secure=True, HTTP_ACCEPT="application/json").json()]
+
+    def test_create(self):
+        self.titles()
+        with mock.patch("portfolio.cache.cache.set", wraps=cache.set) as cache_set:
+            response = self.send("post", "/title", [{"developer": self.developer.pk, "title": f"Bulk {i}"} for i in range(20)])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row["title"] for row in response.json()], [f"Bulk {i}" for i in range(20)])
+        self.assertTrue(all(row["id"] for row in response.json()))
+        # A single invalidation, the cached list is rendered again
+        self.assertEqual([call.args[0] for call in cache_set.call_args_list], [get_version_key(Title)])
+        self.assertEqual(len(self.titles()), 22)
+
+    def test_invalid_items_reject_the_batch(self):
+        response = self.send("post", "/title", [{"developer": self.developer.pk, "title": "Valid"}, {"developer": 0, "title": "Invalid"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual([error["index"] for error in response.json()["errors"]], [1])
+        self.assertEqual(Title.objects.count(), 2)
+
+    def test_partial_mode(self):
+        response = self.send("post", "/title?mode=partial", [{"developer": self.developer.pk, "title": "Valid"}, {"title": "Invalid"}])
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual([row["title"] for row in response.json()["results"]], ["Valid"])
+        self.assertEqual(response.json()["errors"], [{"index": 1, "errors": {"developer": ["Este campo es requerido."]}}])
+
+        pk = Title.objects.get(title="Valid").pk
+        response = self.send("patch", "/title?mode=partial", [{"id": pk, "title": "Renamed"}, {"id": 0, "title": "Missing"}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["errors"], [{"index": 1, "errors": {"id": ["No encontrado."]}}])
+        self.assertEqual(Title.objects.get(pk=pk).title, "Renamed")
+
+    def test_update_and_delete(self):
+        pks = list(Title.objects.order_by("id").values_list("pk", flat=True))
+        self.titles()
+        response = self.send("patch", "/title", [{"id": pk, "title": f"Updated {pk}"} for pk in pks])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.titles(), [f"Updated {pk}" for pk in pks])
+
+        self.assertEqual(self.send("delete", "/title", [pks[0], 0]).status_code, 400)
+        self.assertEqual(self.send("delete", "/title", pks).status_code, 204)
+        self.assertEqual(self.titles(), [])
+
+    def test_many_to_many_images_and_search_are_updated(self):
+        project = Project.objects.order_by("id").first()
+        language = ProjectLanguage.objects.create(title="Haskell")
+        data = {field: getattr(project, f"{field}_id") for field in ("developer", "category")}
+        response = self.send("post", "/project", [
+            dict(data, title="Bulk project", client="Client", startDate="2021-01-01", description="Description", status="DEV", languages=[language.pk]),
+        ])
+        self.assertEqual(response.status_code, 201)
+        created = Project.objects.get(pk=response.json()[0]["id"])
+        self.assertEqual(list(created.languages.all()), [language])
+        search = self.client.get("/search?q=haskell", secure=True, HTTP_ACCEPT="application/json").json()
+        self.assertEqual([row["id"] for row in search], [created.pk])
+
+        with mock.patch("portfolio.signals.update_image") as update_image:
+            response = self.send("post", "/project_image", [{"project": project.pk, "altText": "Bulk"}])
+        self.assertEqual(response.status_code, 201)
+        update_image.assert_called_once()
+
+    def test_writes_are_scoped_to_the_list(self):
+        project = Project.objects.order_by("id").first()
+        Project.objects.filter(pk=project.pk).update(status="PRO")
+        response = self.send("patch", "/project/dev", [{"id": project.pk, "title": "Changed"}])
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["errors"], [{"index": 0, "errors": {"id": ["No encontrado."]}}])
+        self.assertEqual(self.send("delete", "/project/dev", [project.pk]).status_code, 400)
+        self.assertTrue(Project.objects.filter(pk=project.pk, title=project.title).exists())
+        self.assertEqual(self.send("delete", "/project/pro", [project.pk]).status_code, 204)
+
+    def test_many_to_many_changes_send_m2m_changed(self):
+        project = Project.objects.order_by("id").first()
+        language = ProjectLanguage.objects.create(title="Haskell")
+        received = []
+
+        def receiver(action, instance, pk_set, **kwargs):
+            received.append((action, instance.pk, pk_set))
+
+        m2m_changed.connect(receiver, sender=Project.languages.through)
+        self.addCleanup(m2m_changed.disconnect, receiver, sender=Project.languages.through)
+        # post_save is not what reindexes the languages
+        with mock.patch.object(BulkMixin, "send_post_save"):
+            response = self.send("patch", "/project", [{"id": project.pk, "languages": [language.pk]}])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([action for action, _pk, _pk_set in received], ["pre_clear", "post_clear", "pre_add", "post_add"])
+        self.assertEqual(received[-1], ("post_add", project.pk, {language.pk}))
+        search = self.client.get("/search?q=haskell", secure=True, HTTP_ACCEPT="application/json").json()
+        self.assertEqual([row["id"] for row in search], [project.pk])
+
+    def test_list_body_is_required(self):
+        response = self.send("put", "/title", {"id": 1})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json(), {"non_field_errors": ["Se esperaba una lista"]})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class ImageVariantsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(1)
+        self.project = Project.objects.get()
+
+    def test_variants_are_generated_on_upload(self):
+        buffer = BytesIO()
+        Image.new("RGB", (1000, 500), (200, 10, 10)).save(buffer, "JPEG")
+        image = ProjectImage(project=self.project, altText="Upload")
+        image.image.save("upload.jpg", ContentFile(buffer.getvalue()))
+
+        response = self.client.get(f"/project_image/{image.pk}", secure=True, HTTP_ACCEPT="application/json")
+        srcset = response.json()["imageSrcset"]
+        self.assertEqual([variant["width"] for variant in srcset["webp"]], [320, 640, 960, 1000])
+        self.assertEqual([variant["height"] for variant in srcset["jpeg"]], [160, 320, 480, 500])
+        self.assertTrue(srcset["webp"][0]["url"].startswith("https://testserver/media/img/projects/variants/"))
+        with Image.open(f"{MEDIA_ROOT}/{image.imageVariants['webp'][0]['name']}") as variant:
+            self.assertEqual(variant.size, (320, 160))
+
+    def test_placeholder_is_stored_on_upload(self):
+        buffer = BytesIO()
+        Image.new("RGB", (800, 600), (200, 10, 10)).save(buffer, "JPEG")
+        image = ProjectImage(project=self.project, altText="Upload")
+        image.image.save("placeholder.jpg", ContentFile(buffer.getvalue()))
+
+        response = self.client.get(f"/project_image/{image.pk}", secure=True, HTTP_ACCEPT="application/json")
+        data = response.json()
+        self.assertEqual((data["imageWidth"], data["imageHeight"]), (800, 600))
+        self.assertTrue(data["imagePlaceholder"].startswith("data:image/webp;base64,"))
+        self.assertLess(len(data["imagePlaceholder"]), 1000)
+        red, green, blue = (int(data["imageColor"][i:i + 2], 16) for i in (1, 3, 5))
+        self.assertGreater(red, 180)
+        self.assertLess(green + blue, 60)
+
+    def test_missing_files_are_skipped(self):
+        self.assertEqual(ProjectImage.objects.get().imageVariants, {})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class DynamicFieldsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(2)
+
+    def get(self, url):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(url, secure=True, HTTP_ACCEPT="application/json")
+        self.assertEqual(response.status_code, 200)
+        return response.json(), " ".join(query["sql"] for query in context)
+
+    def test_related_objects_are_ids_by_default(self):
+        data, sql = self.get("/title")
+        self.assertEqual(data[0]["developer"], self.developer.pk)
+        self.assertNotIn("portfolio_developer", sql)
+
+    def test_fields_trim_output(self):
+        data, _sql = self.get("/skill?fields=id,title")
+        self.assertEqual(set(data[0]), {"id", "title"})
+
+    def test_expand_nests_related_objects(self):
+        data, sql = self.get("/framework?expand=skill.developer&fields=id,skill.developer.firstName")
+        self.assertEqual(data[0], {"id": data[0]["id"], "skill": {"developer": {"firstName": "Manuel"}}})
+        self.assertIn("portfolio_developer", sql)
+
+    def test_expand_many_relations(self):
+        data, _sql = self.get("/project?expand=languages&fields=id,languages,extLink")
+        self.assertEqual(set(data[0]["languages"][0]), {"id", "title"})
+        self.assertIsInstance(data[0]["extLink"][0], int)
+
+    def test_related_objects_are_written_by_id(self):
+        response = self.client.post("/title", {"developer": self.developer.pk, "title": "New"}, secure=True)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["developer"], self.developer.pk)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class SideloadTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.developer = create_portfolio(3)
+
+    def test_related_objects_are_included_once(self):
+        response = self.client.get("/experience?format=sideload", secure=True)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 3)
+        self.assertEqual(data["results"][0]["developer"], self.developer.pk)
+        included = data["included"]
+        self.assertEqual([row["id"] for row in included["developer"]], [self.developer.pk])
+        self.assertEqual(len(included["project"]), 3)
+        self.assertEqual(len(included["projectcategory"]), 1)
+        self.assertEqual(len(included["projectimage"]), 3)
+        self.assertEqual(len(included["extlink"]), 3)
+
+    def test_selected_by_accept_header(self):
+        project = Project.objects.first()
+        response = self.client.get(f"/project/details/{project.pk}", secure=True, HTTP_ACCEPT="application/vnd.portfolio.sideload+json")
+        self.assertEqual(response["Content-Type"], "application/vnd.portfolio.sideload+json")
+        data = response.json()
+        self.assertEqual(data["result"]["id"], project.pk)
+        self.assertEqual(data["included"]["developer"][0]["id"], self.developer.pk)
+
+    def test_dotted_fields_keep_relations_as_keys(self):
+        response = self.client.get("/experience?format=sideload&fields=id,project.title", secure=True)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(set(data["results"][0]), {"id", "project"})
+        self.assertIsInstance(data["results"][0]["project"], int)
+        self.assertEqual(len(data["included"]["project"]), 3)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        with CaptureQueriesContext(connection) as context:
+            self.client.get("/experience?format=sideload", secure=True)
+        with self.captureOnCommitCallbacks(execute=True):
+            create_portfolio(5)
+        with self.assertNumQueries(len(context)):
+            self.client.get("/experience?format=sideload", secure=True)
+
+
+@override_settings(CACHES=LOCMEM_CACHES, MEDIA_ROOT=MEDIA_ROOT)
+class RendererTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        create_portfolio(3)
+
+    def test_fast_renderer_matches_json_renderer(self):
+        data = {"title": "Señor \u2028 developer", "items": [1, 2.5, None, True], "date": date(2020, 1, 1)}
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_streamed_list_matches_rendered_list(self):
+        url = "/experience?expand=project.developer,extLink"
+        expected = self.client.get(url, secure=True, HTTP_ACCEPT="application/json").content
+        response = self.client.get(f"{url}&stream=true", secure=True, HTTP_ACCEPT="application/json")
+        self.assertTrue(response.streaming)
+        self.assertEqual(b"".join(response.streaming_content), expected)
+
+
+class SQLiteProfileTest(SimpleTestCase):
+    """
+    Runs on a temporary database file: the test database is in memory,
+    where WAL doesn't apply
+    """
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.settings_dict = {**connection.settings_dict, "NAME": str(Path(self.directory) / "db.sqlite3")}
+        with closing(self.connect()) as writer, writer.cursor() as cursor:
+            cursor.execute("CREATE TABLE item (id INTEGER PRIMARY KEY, name TEXT)")
+
+    def connect(self):
+        return DatabaseWrapper(self.settings_dict, alias="profile")
+
+    def test_pragmas_are_set_on_new_connections(self):
+        with closing(self.connect()) as database, database.cursor() as cursor:
+            pragmas = {}
+            for name in settings.SQLITE_PRAGMAS:
+                cursor.execute(f"PRAGMA {name}")
+                pragmas[name] = cursor.fetchone()[0]
+        self.assertEqual(pragmas["journal_mode"], "wal")
+        self.assertEqual(pragmas["synchronous"], 1)  # NORMAL
+        self.assertEqual(pragmas["busy_timeout"], settings.SQLITE_PRAGMAS["busy_timeout"])
+        self.assertEqual(pragmas["cache_size"], settings.SQLITE_PRAGMAS["cache_size"])
+
+    def test_readers_and_writer_in_parallel(self):
+        errors = []
+        reads = []
+        writing = threading.Event()
+        done = threading.Event()
+
+        def read():
+            with closing(self.connect()) as database:
+                count = 0
+                while not done.is_set():
+                    try:
+                        with database.cursor() as cursor:
+                            cursor.execute("SELECT COUNT(*) FROM item")
+                            cursor.fetchone()
+                    except OperationalError as error:
+                        errors.append(error)
+                    count += writing.is_set()
+                reads.append(count)
+
+        def write():
+            # Like an admin save: a transaction that holds the write lock
+            with closing(self.connect()) as database:
+                try:
+                    for batch in range(20):
+                        with database.cursor() as cursor:
+                            cursor.execute("BEGIN IMMEDIATE")
+                            writing.set()
+                            cursor.executemany("INSERT INTO item (name) VALUES (%s)", [(f"item {batch}",)] * 50)
+                            time.sleep(0.01)
+                            cursor.execute("COMMIT")
+                except OperationalError as error:
+                    errors.append(error)
+                finally:
+                    done.set()
+
+        threads = [threading.Thread(target=read) for _ in range(4)] + [threading.Thread(target=write)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(errors, [])
+        # Readers kept reading while the writer held the lock
+        self.assertTrue(all(reads))
+        with closing(self.connect()) as database, database.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM item")
+            self.assertEqual(cursor.fetchone()[0], 1000)
@@ -8,64 +8,71 @@ urlpatterns = [
     # Home (Just for testing)
     path('', views.home, name='home'),
 
+    # Bundle
+    re_path(r'^bundle$', views.PortfolioBundle.as_view(), name="bundle"),
+    re_path(r'developer/(?P<pk>[0-9]+)/bundle$', views.PortfolioBundle.as_view(), name="developer_bundle"),
+
+    # Search
+    re_path(r'^search$', views.Search.as_view(), name="search"),
+
     # Developer
     re_path(r'^developer$', views.DeveloperList.as_view(), name="developer"),
-    re_path(r'developer/(?P<pk>[0-9]+)$', views.DeveloperDetail.as_view()),
+    re_path(r'developer/(?P<pk>[0-9]+)$', views.DeveloperDetail.as_view(), name="developer_detail"),
     
     # Title
     re_path(r'^title$', views.TitleList.as_view(), name="title"),
-    re_path(r'title/(?P<pk>[0-9]+)$', views.TitleDetail.as_view()),
+    re_path(r'title/(?P<pk>[0-9]+)$', views.TitleDetail.as_view(), name="title_detail"),
     
     # SocialLink
     re_path(r'^social_link$', views.SocialLinkList.as_view(), name="social_link"),
-    re_path(r'social_link/(?P<pk>[0-9]+)$', views.SocialLinkDetail.as_view()),
+    re_path(r'social_link/(?P<pk>[0-9]+)$', views.SocialLinkDetail.as_view(), name="social_link_detail"),
     
     # Language
     re_path(r'^language$', views.LanguageList.as_view(), name="language"),
-    re_path(r'language/(?P<pk>[0-9]+)$', views.LanguageDetail.as_view()),
+    re_path(r'language/(?P<pk>[0-9]+)$', views.LanguageDetail.as_view(), name="language_detail"),
     
     # Skill
     re_path(r'^skill$', views.SkillList.as_view(), name="skill"),
-    re_path(r'skill/(?P<pk>[0-9]+)$', views.SkillDetail.as_view()),
+    re_path(r'skill/(?P<pk>[0-9]+)$', views.SkillDetail.as_view(), name="skill_detail"),
     
     # Framework
     re_path(r'^framework$', views.FrameworkList.as_view(), name="framework"),
-    re_path(r'framework/(?P<pk>[0-9]+)$', views.FrameworkDetail.as_view()),
+    re_path(r'framework/(?P<pk>[0-9]+)$', views.FrameworkDetail.as_view(), name="framework_detail"),
     
     # Repository
     re_path(r'^repository$', views.RepositoryList.as_view(), name="repository"),
-    re_path(r'repository/(?P<pk>[0-9]+)$', views.RepositoryDetail.as_view()),
+    re_path(r'repository/(?P<pk>[0-9]+)$', views.RepositoryDetail.as_view(), name="repository_detail"),
     
     # Education
     re_path(r'^education$', views.EducationList.as_view(), name="education"),
-    re_path(r'education/(?P<pk>[0-9]+)$', views.EducationDetail.as_view()),
+    re_path(r'education/(?P<pk>[0-9]+)$', views.EducationDetail.as_view(), name="education_detail"),
     
     # ProjectCategory
     re_path(r'^project_category$', views.ProjectCategoryList.as_view(), name="project_category"),
-    re_path(r'project_category/(?P<pk>[0-9]+)$', views.ProjectCategoryDetail.as_view()),
+    re_path(r'project_category/(?P<pk>[0-9]+)$', views.ProjectCategoryDetail.as_view(), name="project_category_detail"),
     
     # ProjectLanguage
     re_path(r'^project_language$', views.ProjectLanguageList.as_view(), name="project_language"),
-    re_path(r'project_language/(?P<pk>[0-9]+)$', views.ProjectLanguageDetail.as_view()),
+    re_path(r'project_language/(?P<pk>[0-9]+)$', views.ProjectLanguageDetail.as_view(), name="project_language_detail"),
     
     # ExtLink
     re_path(r'^external_link$', views.ExtLinkList.as_view(), name="external_link"),
-    re_path(r'external_link/(?P<pk>[0-9]+)$', views.ExtLinkDetail.as_view()),
+    re_path(r'external_link/(?P<pk>[0-9]+)$', views.ExtLinkDetail.as_view(), name="external_link_detail"),
     
     # Project
     re_path(r'^project$', views.ProjectList.as_view(), name="project"),
-    re_path(r'project/details/(?P<pk>[0-9]+)$', views.ProjectDetail.as_view()),
-    re_path(r'project/dev$', views.DevProjectList.as_view(), name="dev_project"),
-    re_path(r'project/pro$', views.ProProjectList.as_view(), name="pro_project"),
-    re_path(r'project/pau$', views.PauProjectList.as_view(), name="pau_project"),
-    re_path(r'project/can$', views.CanProjectList.as_view(), name="can_project"),
+    re_path(r'project/details/(?P<pk>[0-9]+)$', views.ProjectDetail.as_view(), name="project_detail"),
+    re_path(r'project/(?P<status>dev)$', views.ProjectStatusList.as_view(), name="dev_project"),
+    re_path(r'project/(?P<status>pro)$', views.ProjectStatusList.as_view(), name="pro_project"),
+    re_path(r'project/(?P<status>pau)$', views.ProjectStatusList.as_view(), name="pau_project"),
+    re_path(r'project/(?P<status>can)$', views.ProjectStatusList.as_view(), name="can_project"),
     
     # ProjectImage
     re_path(r'^project_image$', views.ProjectImageList.as_view(), name="project_image"),
-    re_path(r'project_image/(?P<pk>[0-9]+)$', views.ProjectImageDetail.as_view()),
+    re_path(r'project_image/(?P<pk>[0-9]+)$', views.ProjectImageDetail.as_view(), name="project_image_detail"),
     
     # Experience
     re_path(r'^experience$', views.ExperienceList.as_view(), name="experience"),
-    re_path(r'experience/(?P<pk>[0-9]+)$', views.ExperienceDetail.as_view()),
+    re_path(r'experience/(?P<pk>[0-9]+)$', views.ExperienceDetail.as_view(), name="experience_detail"),
     
 ]
@@ -1,6 +1,13 @@
-from django.shortcuts import render
+from django.shortcuts import get_object_or_404, render
 
-from rest_framework import generics
+from rest_framework.exceptions import ValidationError
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from portfolio import generics
+from portfolio.bundle import get_bundle
+from portfolio.pagination import KeysetPagination
+from portfolio.search import search
 
 from portfolio.models import (
     Developer,
@@ -40,6 +47,38 @@ from portfolio.serializers import (
 def home(request):
     return render(request, 'home.html')
 
+# Bundle
+class PortfolioBundle(APIView):
+    """
+    Whole public portfolio in a single normalized document
+    """
+    queryset = Developer.objects.all()
+
+    def get(self, request, pk=None):
+        if pk is not None:
+            pk = get_object_or_404(self.queryset, pk=pk).pk
+        return Response(get_bundle(request, pk))
+
+
+# Search
+class Search(APIView):
+    """
+    Full-text search on projects, work experience and education, best
+    ranked first: /search?q=<words>&limit=<max results>
+    """
+    max_limit = 50
+
+    def get(self, request):
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            raise ValidationError({"q": ["Ingresá las palabras a buscar"]})
+        try:
+            limit = min(max(int(request.query_params.get("limit", 20)), 1), self.max_limit)
+        except ValueError:
+            limit = 20
+        return Response(search(query, limit))
+
+
 # Developer
 class DeveloperList(generics.ListCreateAPIView):
     queryset = Developer.objects.all()
@@ -55,6 +94,7 @@ class DeveloperDetail(generics.RetrieveUpdateDestroyAPIView):
 class TitleList(generics.ListCreateAPIView):
     queryset = Title.objects.all()
     serializer_class = TitleSerializer
+    filter_fields = {"developer": "developer"}
 
 
 class TitleDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -66,6 +106,7 @@ class TitleDetail(generics.RetrieveUpdateDestroyAPIView):
 class SocialLinkList(generics.ListCreateAPIView):
     queryset = SocialLink.objects.filter(isActive=True).order_by('id')
     serializer_class = SocialLinkSerializer
+    filter_fields = {"developer": "developer"}
 
 
 class SocialLinkDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -77,6 +118,8 @@ class SocialLinkDetail(generics.RetrieveUpdateDestroyAPIView):
 class LanguageList(generics.ListCreateAPIView):
     queryset = Language.objects.filter(isActive=True).order_by('-proficiency')
     serializer_class = LanguageSerializer
+    filter_fields = {"developer": "developer"}
+    ordering_fields = ("proficiency", "id")
 
 
 class LanguageDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -88,6 +131,8 @@ class LanguageDetail(generics.RetrieveUpdateDestroyAPIView):
 class SkillList(generics.ListCreateAPIView):
     queryset = Skill.objects.filter(isActive=True).order_by('-proficiency')
     serializer_class = SkillSerializer
+    filter_fields = {"developer": "developer"}
+    ordering_fields = ("proficiency", "id")
 
 
 class SkillDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -99,6 +144,7 @@ class SkillDetail(generics.RetrieveUpdateDestroyAPIView):
 class FrameworkList(generics.ListCreateAPIView):
     queryset = Framework.objects.filter(isActive=True).order_by('id')
     serializer_class = FrameworkSerializer
+    filter_fields = {"skill": "skill"}
 
 
 class FrameworkDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -121,6 +167,9 @@ class RepositoryDetail(generics.RetrieveUpdateDestroyAPIView):
 class EducationList(generics.ListCreateAPIView):
     queryset = Education.objects.filter(isActive=True).order_by('-finishDate')
     serializer_class = EducationSerializer
+    pagination_class = KeysetPagination
+    filter_fields = {"developer": "developer"}
+    ordering_fields = ("finishDate", "id")
 
 
 class EducationDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -165,6 +214,19 @@ class ExtLinkDetail(generics.RetrieveUpdateDestroyAPIView):
 class ProjectList(generics.ListCreateAPIView):
     queryset = Project.objects.filter(isActive=True).order_by('startDate')
     serializer_class = ProjectSerializer
+    pagination_class = KeysetPagination
+    filter_fields = {
+        "developer": "developer",
+        "status": "status",
+        "category": "category",
+        "language": "languages",
+    }
+    ordering_fields = ("startDate", "id")
+    facet_fields = {
+        "status": "status",
+        "category": "category",
+        "language": "languages",
+    }
 
 
 class ProjectDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -172,30 +234,22 @@ class ProjectDetail(generics.RetrieveUpdateDestroyAPIView):
     serializer_class = ProjectSerializer
 
 
-class DevProjectList(generics.ListCreateAPIView):
-    queryset = Project.objects.filter(status='DEV')
-    serializer_class = ProjectSerializer
+class ProjectStatusList(ProjectList):
+    """
+    Projects with the status of the URL (same as /project?status=)
+    """
 
-
-class ProProjectList(generics.ListCreateAPIView):
-    queryset = Project.objects.filter(status='PRO')
-    serializer_class = ProjectSerializer
-
-
-class PauProjectList(generics.ListCreateAPIView):
-    queryset = Project.objects.filter(status='PAU')
-    serializer_class = ProjectSerializer
-
-
-class CanProjectList(generics.ListCreateAPIView):
-    queryset = Project.objects.filter(status='CAN')
-    serializer_class = ProjectSerializer
+    def get_queryset(self):
+        return super().get_queryset().filter(status=self.kwargs["status"].upper())
 
 
 # ProjectImage
 class ProjectImageList(generics.ListCreateAPIView):
     queryset = ProjectImage.objects.all().order_by('-isFeature')
     serializer_class = ProjectImageSerializer
+    pagination_class = KeysetPagination
+    filter_fields = {"project": "project"}
+    ordering_fields = ("isFeature", "id")
 
 
 class ProjectImageDetail(generics.RetrieveUpdateDestroyAPIView):
@@ -205,10 +259,13 @@ class ProjectImageDetail(generics.RetrieveUpdateDestroyAPIView):
 
 # Experience
 class ExperienceList(generics.ListCreateAPIView):
-    queryset = Experience.objects.filter(isActive=True).order_by('-finishDate').order_by('-startDate')
+    queryset = Experience.objects.filter(isActive=True).order_by('-startDate', '-finishDate')
     serializer_class = ExperienceSerializer
+    pagination_class = KeysetPagination
+    filter_fields = {"developer": "developer", "project": "project"}
+    ordering_fields = ("startDate", "finishDate", "id")
 
 
 class ExperienceDetail(generics.RetrieveUpdateDestroyAPIView):
-    queryset = Experience.objects.all().order_by('-finishDate').order_by('-startDate')
+    queryset = Experience.objects.all().order_by('-startDate', '-finishDate')
     serializer_class = ExperienceSerializer